@@ -0,0 +1,68 @@
+"""Compare the rdflib and native canonical graph backends.
+
+    python benchmarks/bench_backends.py --rows 2000
+
+Times mapping rows into the canonical graph, running the profile SELECT and
+CONSTRUCT queries, and serializing the CONSTRUCT result as N-Triples and
+Turtle, once per backend.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from bench_mapping import synthetic_rows
+
+from schema_bridge.profiles import load_profile, resolve_profile_path
+from schema_bridge.rdf import (
+    construct_graph,
+    load_raw_from_rows,
+    new_canonical_graph,
+    select_rows,
+)
+from schema_bridge.rdf.store import CANONICAL_BACKENDS
+
+
+def run(backend: str, rows: list[dict], profile_name: str) -> dict[str, float]:
+    profile = load_profile(profile_name)
+    select_path = resolve_profile_path(
+        profile, profile.select_query, "schema_bridge.resources"
+    )
+    construct_path = resolve_profile_path(
+        profile, profile.construct_query, "schema_bridge.resources"
+    )
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    graph = new_canonical_graph(backend)
+    load_raw_from_rows(rows, graph, profile.mapping)
+    timings["mapping"] = time.perf_counter() - start
+    start = time.perf_counter()
+    select_rows(graph, select_path)
+    timings["select"] = time.perf_counter() - start
+    start = time.perf_counter()
+    construct = construct_graph(graph, construct_path)
+    timings["construct"] = time.perf_counter() - start
+    for label, rdf_format in (("nt", "nt"), ("ttl", "turtle")):
+        start = time.perf_counter()
+        construct.serialize(format=rdf_format)
+        timings[label] = time.perf_counter() - start
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument("--profile", default="healthdcat-ap-r5-molgenis")
+    args = parser.parse_args()
+
+    rows = list(synthetic_rows(args.rows))
+    for backend in CANONICAL_BACKENDS:
+        timings = run(backend, rows, args.profile)
+        total = sum(timings.values())
+        details = ", ".join(f"{name} {value:.2f}s" for name, value in timings.items())
+        print(f"{backend:>7}: {details} (total {total:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
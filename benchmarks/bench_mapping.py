@@ -0,0 +1,99 @@
+"""Rows/second of load_raw_from_rows on a synthetic catalogue.
+
+    python benchmarks/bench_mapping.py --rows 100000
+    python benchmarks/bench_mapping.py --rows 20000 --store oxigraph
+
+The default ``null`` store only counts triples, so the timing isolates the
+mapping itself from triple-store insertion. Row generation is timed
+separately and subtracted.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import json
+import time
+
+from rdflib import Graph
+
+from schema_bridge.profiles import load_profile
+from schema_bridge.rdf import load_raw_from_rows, new_graph
+
+FIXTURE = (
+    Path(__file__).resolve().parents[1]
+    / "tests"
+    / "resources"
+    / "graphql_health_dcat_ap_molgenis.json"
+)
+
+
+class CountingGraph:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, triple) -> None:
+        self.count += 1
+
+    def addN(self, quads) -> None:
+        self.count += sum(1 for _ in quads)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def synthetic_rows(count: int):
+    template = json.loads(FIXTURE.read_text(encoding="utf-8"))["data"]["Resources"][0]
+    encoded = json.dumps(template)
+    for idx in range(count):
+        row = json.loads(encoded)
+        row["id"] = f"RES-{idx}"
+        row["name"] = f"Synthetic resource {idx}"
+        row["website"] = f"https://example.org/resources/{idx}"
+        row["keywords"] = ["health", f"topic-{idx % 50}"]
+        row["numberOfParticipants"] = idx
+        row["countries"][0]["name"] = f"Country {idx % 30}"
+        yield row
+
+
+def new_sink(store: str):
+    if store == "null":
+        return CountingGraph()
+    if store == "memory":
+        return Graph()
+    return new_graph()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--profile", default="healthdcat-ap-r5-molgenis")
+    parser.add_argument(
+        "--store", choices=["null", "memory", "oxigraph"], default="null"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mapping = load_profile(args.profile).mapping
+    start = time.perf_counter()
+    for _ in synthetic_rows(args.rows):
+        pass
+    generation = time.perf_counter() - start
+    best = None
+    triples = 0
+    for _ in range(args.repeat):
+        graph = new_sink(args.store)
+        start = time.perf_counter()
+        load_raw_from_rows(synthetic_rows(args.rows), graph, mapping)
+        elapsed = max(time.perf_counter() - start - generation, 1e-9)
+        triples = len(graph)
+        best = elapsed if best is None else min(best, elapsed)
+    assert best is not None
+    print(
+        f"{args.rows} rows, {triples} triples, store={args.store}: "
+        f"{best:.2f}s ({args.rows / best:,.0f} rows/s, {triples / best:,.0f} triples/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
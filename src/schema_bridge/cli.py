@@ -7,12 +7,32 @@ import typer
 import logging
 
 from schema_bridge.logging import configure_logging
-from schema_bridge.cli_helpers import resolve_graphql_target
-from schema_bridge.rdf import new_graph
+from schema_bridge.cli_helpers import (
+    build_response_cache,
+    prune_export_query,
+    resolve_graphql_target,
+    resolve_incremental_graph,
+    resolve_watermark_window,
+    stdout_stream,
+    write_mapping_report,
+)
+from schema_bridge.rdf.columnar import require_pyarrow
+from schema_bridge.rdf.instrument import MappingStats
+from schema_bridge.rdf.store import CANONICAL_BACKENDS, new_canonical_graph
+from schema_bridge.rdf.stream import stream_graph
 from schema_bridge.workflows.export import export_and_validate
-from schema_bridge.graphql.client import PaginationConfig, extract_rows, fetch_graphql
+from schema_bridge.graphql.pool import HttpConfig, configure_http
+from schema_bridge.graphql.retry import RetryConfig
+from schema_bridge.graphql.watermark import UPDATED_FIELD
+from schema_bridge.graphql.client import (
+    PaginationConfig,
+    extract_rows,
+    fetch_graphql,
+    iter_graphql_rows,
+)
 from schema_bridge.resources.loader import load_text
 from schema_bridge.profiles.loader import (
+    ResolvedExport,
     load_profile,
     load_ingest_profile,
     resolve_export,
@@ -56,6 +76,29 @@ def _normalize_rdf_format(value: str) -> str:
     return resolved
 
 
+def _normalize_backend(value: str) -> str:
+    normalized = value.strip().lower()
+    if normalized not in CANONICAL_BACKENDS:
+        raise typer.BadParameter(
+            "Unsupported backend. Use one of: " + ", ".join(CANONICAL_BACKENDS) + "."
+        )
+    return normalized
+
+
+def _check_columnar(columnar: bool) -> bool:
+    if columnar:
+        try:
+            require_pyarrow()
+        except RuntimeError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    return columnar
+
+
+def _check_out_dir(export: ResolvedExport, out_dir: Path | None) -> None:
+    if out_dir is None and len(export.targets) > 1:
+        raise typer.BadParameter("Writing several --format targets requires --out-dir")
+
+
 @app.callback()
 def _main(
     debug: bool = typer.Option(
@@ -100,6 +143,65 @@ def fetch(
         int(os.getenv("SCHEMA_BRIDGE_PAGE_SIZE", "200")),
         help="Rows per page for GraphQL paging",
     ),
+    concurrency: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_CONCURRENCY", "1")),
+        min=1,
+        help="Number of GraphQL pages to fetch in parallel",
+    ),
+    batch_pages: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_BATCH_PAGES", "1")),
+        "--batch-pages",
+        min=1,
+        help="Pack this many pages into one aliased GraphQL request",
+    ),
+    http_timeout: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_HTTP_TIMEOUT", "30")),
+        "--timeout",
+        min=1,
+        help="GraphQL HTTP timeout in seconds",
+    ),
+    max_connections: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_MAX_CONNECTIONS", "10")),
+        "--max-connections",
+        min=1,
+        help="Maximum pooled HTTP connections per GraphQL host",
+    ),
+    retries: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_RETRIES", "3")),
+        "--retries",
+        min=0,
+        help="Retries per GraphQL page on transient errors (exponential backoff)",
+    ),
+    checkpoint_dir: Path | None = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_CHECKPOINT_DIR"),
+        "--checkpoint-dir",
+        help="Spool fetched pages here so an interrupted run resumes where it stopped",
+    ),
+    cache_dir: Path | None = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_CACHE_DIR"),
+        "--cache-dir",
+        help="Enable the GraphQL response cache in this directory",
+    ),
+    cache_ttl: float = typer.Option(
+        float(os.getenv("SCHEMA_BRIDGE_CACHE_TTL", "3600")),
+        "--cache-ttl",
+        help="Seconds before a cached GraphQL response expires",
+    ),
+    cache_max_mb: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_CACHE_MAX_MB", "512")),
+        "--cache-max-mb",
+        help="Cache size bound in MB; least recently used entries are evicted",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the GraphQL response cache for this run",
+    ),
+    refresh_cache: bool = typer.Option(
+        False,
+        "--refresh-cache",
+        help="Ignore cached GraphQL responses but store fresh ones",
+    ),
     updated_since: str | None = typer.Option(
         None,
         help="Only fetch rows updated on/after this timestamp (ISO 8601)",
@@ -108,6 +210,16 @@ def fetch(
         None,
         help="Only fetch rows updated before this timestamp (ISO 8601)",
     ),
+    watermark: bool = typer.Option(
+        False,
+        "--watermark",
+        help="Resume from the last synced mg_updatedOn watermark and record a new one",
+    ),
+    state_dir: Path = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_STATE_DIR", ".schema-bridge/state"),
+        "--state-dir",
+        help="Directory for persisted sync state",
+    ),
     debug: bool = typer.Option(
         False,
         "--debug",
@@ -122,6 +234,9 @@ def fetch(
         profile,
         endpoint,
     )
+    configure_http(
+        HttpConfig(timeout=http_timeout, max_connections_per_host=max_connections)
+    )
     profile_cfg = load_profile(profile, expected_kind="export")
     resolved_endpoint, resolved_base_url, resolved_schema = resolve_graphql_target(
         profile=profile_cfg,
@@ -130,7 +245,12 @@ def fetch(
         endpoint=endpoint,
     )
     pagination = PaginationConfig(
-        page_size=page_size, max_rows=None if limit <= 0 else limit
+        page_size=page_size,
+        max_rows=None if limit <= 0 else limit,
+        concurrency=concurrency,
+        batch_pages=batch_pages,
+        strategy=profile_cfg.pagination_strategy,
+        keyset_field=profile_cfg.pagination_key,
     )
     query_path = (
         query or profile_cfg.graphql_query or "profiles/dcat/graphql/query.graphql"
@@ -139,6 +259,25 @@ def fetch(
         profile_cfg, query_path, "schema_bridge.resources"
     )
     query_text = load_text(query_path, "schema_bridge.resources")
+    window = None
+    if watermark:
+        window = resolve_watermark_window(
+            state_dir=state_dir,
+            profile=profile_cfg.name,
+            endpoint=resolved_endpoint,
+            base_url=resolved_base_url,
+            schema=resolved_schema,
+            updated_since=updated_since,
+            updated_until=updated_until,
+        )
+        updated_since, updated_until = window.updated_since, window.fetch_until
+    cache = build_response_cache(
+        cache_dir=cache_dir,
+        ttl=cache_ttl,
+        max_mb=cache_max_mb,
+        no_cache=no_cache,
+        refresh=refresh_cache,
+    )
     data = fetch_graphql(
         resolved_base_url,
         resolved_schema,
@@ -148,15 +287,25 @@ def fetch(
         updated_since=updated_since,
         updated_until=updated_until,
         endpoint=resolved_endpoint,
+        cache=cache,
+        retry=RetryConfig(attempts=retries + 1),
+        checkpoint_dir=checkpoint_dir,
     )
     write_json(data, out)
+    if cache is not None:
+        logger.debug("GraphQL cache: %s hit(s), %s miss(es)", cache.hits, cache.misses)
+    if window is not None:
+        for row in extract_rows(data, profile_cfg.root_key):
+            window.observe(row)
+        window.commit(max_rows=pagination.max_rows)
     logger.debug("Fetch complete: wrote %s", out)
 
 
 @app.command()
 def convert(
     input_path: Path = typer.Argument(
-        ..., help="Input GraphQL JSON or RML mapping file"
+        ...,
+        help="Input GraphQL JSON (.json, .ndjson, optionally gzipped) or RML mapping file",
     ),
     profile: str = typer.Option(
         os.getenv("SCHEMA_BRIDGE_PROFILE", "dcat"),
@@ -174,9 +323,15 @@ def convert(
         ...,
         "--format",
         "-f",
-        help="Output format: csv, json, jsonld, ttl, rdfxml, nt",
+        help="Output format(s), comma-separated: csv, json, jsonld, ttl, rdfxml, nt",
         case_sensitive=False,
     ),
+    out_dir: Path | None = typer.Option(
+        None,
+        "--out-dir",
+        help="Write resources.<ext> for every --format target into this directory "
+        "instead of stdout",
+    ),
     root_key: str | None = typer.Option(
         None,
         help="GraphQL data root (overrides profile)",
@@ -206,6 +361,48 @@ def convert(
         None,
         help="Optional path to write SHACL validation report (TTL)",
     ),
+    insert_batch_size: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_INSERT_BATCH_SIZE", "10000")),
+        "--insert-batch-size",
+        min=1,
+        help="Triples buffered per bulk insert into the canonical graph",
+    ),
+    workers: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_WORKERS", "1")),
+        "--workers",
+        min=1,
+        help="Processes used to map rows into triples (1 maps in-process)",
+    ),
+    decompose_construct: bool = typer.Option(
+        False,
+        "--decompose-construct",
+        help="Split the CONSTRUCT query into one sub-query per independent group of "
+        "OPTIONALs and union the results",
+    ),
+    columnar: bool = typer.Option(
+        False,
+        "--columnar",
+        help="Map rows from Arrow record batches, emitting scalar fields column by "
+        "column (requires pyarrow)",
+    ),
+    instrument_mapping: bool = typer.Option(
+        False,
+        "--instrument-mapping",
+        help="Time each mapping rule and print a hot-spot report to stderr",
+    ),
+    mapping_report: Path | None = typer.Option(
+        None,
+        "--mapping-report",
+        help="Write the mapping instrumentation report as JSON (implies "
+        "--instrument-mapping)",
+    ),
+    backend: str = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_BACKEND", "rdflib"),
+        "--backend",
+        help="Canonical graph backend: rdflib (Oxigraph behind rdflib) or native "
+        "(pyoxigraph terms and queries, rdflib only for SHACL and prefixed output)",
+        case_sensitive=False,
+    ),
     debug: bool = typer.Option(
         False,
         "--debug",
@@ -227,8 +424,11 @@ def convert(
         construct_query=construct,
         target_format=output_format.lower(),
         validate_override=validate,
+        decompose_construct=decompose_construct,
     )
+    _check_out_dir(export, out_dir)
 
+    stats = MappingStats() if instrument_mapping or mapping_report is not None else None
     raw_graph = _materialize_graph(
         profile=export.profile,
         from_format=from_format.lower(),
@@ -237,14 +437,22 @@ def convert(
         root_key=export.root_key,
         rml_mapping=rml_mapping,
         rml_source=rml_source,
+        batch_size=insert_batch_size,
+        workers=workers,
+        backend=_normalize_backend(backend),
+        stats=stats,
+        columnar=_check_columnar(columnar),
     )
     export_and_validate(
         raw_graph,
         export,
-        None,
+        out_dir,
         shacl_report,
         emit=lambda text: typer.echo(text, nl=False),
+        stream=stdout_stream(),
     )
+    if stats is not None:
+        write_mapping_report(stats, mapping_report)
     logger.debug("Convert complete")
 
 
@@ -289,9 +497,15 @@ def export(
         ...,
         "--format",
         "-f",
-        help="Output format: csv, json, jsonld, ttl, rdfxml, nt",
+        help="Output format(s), comma-separated: csv, json, jsonld, ttl, rdfxml, nt",
         case_sensitive=False,
     ),
+    out_dir: Path | None = typer.Option(
+        None,
+        "--out-dir",
+        help="Write resources.<ext> for every --format target into this directory "
+        "instead of stdout",
+    ),
     limit: int = typer.Option(
         int(os.getenv("SCHEMA_BRIDGE_LIMIT", "5")),
         help="Maximum number of resources to fetch (0 for all)",
@@ -300,6 +514,70 @@ def export(
         int(os.getenv("SCHEMA_BRIDGE_PAGE_SIZE", "200")),
         help="Rows per page for GraphQL paging",
     ),
+    concurrency: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_CONCURRENCY", "1")),
+        min=1,
+        help="Number of GraphQL pages to fetch in parallel",
+    ),
+    batch_pages: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_BATCH_PAGES", "1")),
+        "--batch-pages",
+        min=1,
+        help="Pack this many pages into one aliased GraphQL request",
+    ),
+    http_timeout: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_HTTP_TIMEOUT", "30")),
+        "--timeout",
+        min=1,
+        help="GraphQL HTTP timeout in seconds",
+    ),
+    max_connections: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_MAX_CONNECTIONS", "10")),
+        "--max-connections",
+        min=1,
+        help="Maximum pooled HTTP connections per GraphQL host",
+    ),
+    retries: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_RETRIES", "3")),
+        "--retries",
+        min=0,
+        help="Retries per GraphQL page on transient errors (exponential backoff)",
+    ),
+    checkpoint_dir: Path | None = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_CHECKPOINT_DIR"),
+        "--checkpoint-dir",
+        help="Spool fetched pages here so an interrupted run resumes where it stopped",
+    ),
+    cache_dir: Path | None = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_CACHE_DIR"),
+        "--cache-dir",
+        help="Enable the GraphQL response cache in this directory",
+    ),
+    cache_ttl: float = typer.Option(
+        float(os.getenv("SCHEMA_BRIDGE_CACHE_TTL", "3600")),
+        "--cache-ttl",
+        help="Seconds before a cached GraphQL response expires",
+    ),
+    cache_max_mb: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_CACHE_MAX_MB", "512")),
+        "--cache-max-mb",
+        help="Cache size bound in MB; least recently used entries are evicted",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the GraphQL response cache for this run",
+    ),
+    refresh_cache: bool = typer.Option(
+        False,
+        "--refresh-cache",
+        help="Ignore cached GraphQL responses but store fresh ones",
+    ),
+    prune_query: bool = typer.Option(
+        False,
+        "--prune-query/--no-prune-query",
+        help="Drop GraphQL selections that no mapping rule or SPARQL query uses",
+    ),
     validate: bool | None = typer.Option(
         None,
         "--validate/--no-validate",
@@ -317,6 +595,64 @@ def export(
         None,
         help="Only fetch rows updated before this timestamp (ISO 8601)",
     ),
+    watermark: bool = typer.Option(
+        False,
+        "--watermark",
+        help="Resume from the last synced mg_updatedOn watermark and record a new one",
+    ),
+    state_dir: Path = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_STATE_DIR", ".schema-bridge/state"),
+        "--state-dir",
+        help="Directory for persisted sync state",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Keep the canonical graph and a row-hash index under --state-dir; "
+        "re-map only new or changed rows and export only those subjects",
+    ),
+    insert_batch_size: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_INSERT_BATCH_SIZE", "10000")),
+        "--insert-batch-size",
+        min=1,
+        help="Triples buffered per bulk insert into the canonical graph",
+    ),
+    workers: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_WORKERS", "1")),
+        "--workers",
+        min=1,
+        help="Processes used to map rows into triples (1 maps in-process)",
+    ),
+    decompose_construct: bool = typer.Option(
+        False,
+        "--decompose-construct",
+        help="Split the CONSTRUCT query into one sub-query per independent group of "
+        "OPTIONALs and union the results",
+    ),
+    columnar: bool = typer.Option(
+        False,
+        "--columnar",
+        help="Map rows from Arrow record batches, emitting scalar fields column by "
+        "column (requires pyarrow)",
+    ),
+    instrument_mapping: bool = typer.Option(
+        False,
+        "--instrument-mapping",
+        help="Time each mapping rule and print a hot-spot report to stderr",
+    ),
+    mapping_report: Path | None = typer.Option(
+        None,
+        "--mapping-report",
+        help="Write the mapping instrumentation report as JSON (implies "
+        "--instrument-mapping)",
+    ),
+    backend: str = typer.Option(
+        os.getenv("SCHEMA_BRIDGE_BACKEND", "rdflib"),
+        "--backend",
+        help="Canonical graph backend: rdflib (Oxigraph behind rdflib) or native "
+        "(pyoxigraph terms and queries, rdflib only for SHACL and prefixed output)",
+        case_sensitive=False,
+    ),
     debug: bool = typer.Option(
         False,
         "--debug",
@@ -348,6 +684,9 @@ def export(
         output_format,
         endpoint,
     )
+    configure_http(
+        HttpConfig(timeout=http_timeout, max_connections_per_host=max_connections)
+    )
     profile_cfg = load_profile(profile, expected_kind="export")
     if profile_cfg.mapping_format == "rml":
         raise SystemExit(
@@ -361,9 +700,16 @@ def export(
         construct_query=construct,
         target_format=output_format.lower(),
         validate_override=validate,
+        decompose_construct=decompose_construct,
     )
+    _check_out_dir(export, out_dir)
     pagination = PaginationConfig(
-        page_size=page_size, max_rows=None if limit <= 0 else limit
+        page_size=page_size,
+        max_rows=None if limit <= 0 else limit,
+        concurrency=concurrency,
+        batch_pages=batch_pages,
+        strategy=export.profile.pagination_strategy,
+        keyset_field=export.profile.pagination_key,
     )
     resolved_endpoint, resolved_base_url, resolved_schema = resolve_graphql_target(
         profile=export.profile,
@@ -378,7 +724,33 @@ def export(
         export.profile, query_path, "schema_bridge.resources"
     )
     query_text = load_text(query_path, "schema_bridge.resources")
-    graphql_data = fetch_graphql(
+    if prune_query and (canonical_out is not None or canonical_only):
+        logger.warning("Ignoring --prune-query: canonical output needs every field")
+    elif prune_query:
+        keep = [pagination.keyset_field] if pagination.strategy == "keyset" else []
+        if watermark:
+            keep.append(UPDATED_FIELD)
+        query_text = prune_export_query(query_text, export=export, keep=keep)
+    window = None
+    if watermark:
+        window = resolve_watermark_window(
+            state_dir=state_dir,
+            profile=export.profile.name,
+            endpoint=resolved_endpoint,
+            base_url=resolved_base_url,
+            schema=resolved_schema,
+            updated_since=updated_since,
+            updated_until=updated_until,
+        )
+        updated_since, updated_until = window.updated_since, window.fetch_until
+    cache = build_response_cache(
+        cache_dir=cache_dir,
+        ttl=cache_ttl,
+        max_mb=cache_max_mb,
+        no_cache=no_cache,
+        refresh=refresh_cache,
+    )
+    rows = iter_graphql_rows(
         resolved_base_url,
         resolved_schema,
         query_text,
@@ -387,24 +759,79 @@ def export(
         updated_since=updated_since,
         updated_until=updated_until,
         endpoint=resolved_endpoint,
+        cache=cache,
+        retry=RetryConfig(attempts=retries + 1),
+        checkpoint_dir=checkpoint_dir,
     )
-    rows = extract_rows(graphql_data, export.root_key)
-    raw_graph = new_graph()
-    load_raw_from_rows(rows, raw_graph, export.mapping)
+    if window is not None:
+        rows = window.track(rows)
+    stats = MappingStats() if instrument_mapping or mapping_report is not None else None
+    canonical = None
+    if incremental:
+        if workers > 1:
+            logger.warning("Ignoring --workers: --incremental maps rows in-process")
+        if columnar:
+            logger.warning("Ignoring --columnar: --incremental maps rows as dicts")
+        if stats is not None:
+            logger.warning(
+                "Mapping instrumentation is not available with --incremental"
+            )
+            stats = None
+        canonical = resolve_incremental_graph(
+            state_dir=state_dir,
+            profile=export.profile.name,
+            endpoint=resolved_endpoint,
+            base_url=resolved_base_url,
+            schema=resolved_schema,
+        )
+        patch = canonical.patch(
+            rows,
+            export.mapping,
+            detect_deletions=not (updated_since or updated_until),
+            max_rows=pagination.max_rows,
+            batch_size=insert_batch_size,
+        )
+        for subject in patch.deleted:
+            logger.info("Deleted subject: %s", subject)
+        raw_graph = canonical.subjects_graph(
+            patch.changed, backend=_normalize_backend(backend)
+        )
+    else:
+        raw_graph = new_canonical_graph(_normalize_backend(backend))
+        load_raw_from_rows(
+            rows,
+            raw_graph,
+            export.mapping,
+            batch_size=insert_batch_size,
+            workers=workers,
+            stats=stats,
+            columnar=_check_columnar(columnar),
+        )
+    if cache is not None:
+        logger.debug("GraphQL cache: %s hit(s), %s miss(es)", cache.hits, cache.misses)
     canonical_rdf_format = _normalize_rdf_format(canonical_format)
     if canonical_out is not None:
         canonical_out.parent.mkdir(parents=True, exist_ok=True)
-        raw_graph.serialize(canonical_out, format=canonical_rdf_format)
+        with canonical_out.open("wb") as handle:
+            stream_graph(raw_graph, handle, canonical_rdf_format)
     if canonical_only:
-        typer.echo(raw_graph.serialize(format=canonical_rdf_format), nl=False)
-        return
-    export_and_validate(
-        raw_graph,
-        export,
-        None,
-        shacl_report,
-        emit=lambda text: typer.echo(text, nl=False),
-    )
+        stream_graph(raw_graph, stdout_stream(), canonical_rdf_format)
+    else:
+        export_and_validate(
+            raw_graph,
+            export,
+            out_dir,
+            shacl_report,
+            emit=lambda text: typer.echo(text, nl=False),
+            stream=stdout_stream(),
+        )
+    if stats is not None:
+        write_mapping_report(stats, mapping_report)
+    if canonical is not None:
+        canonical.commit()
+        canonical.close()
+    if window is not None:
+        window.commit(max_rows=pagination.max_rows)
     logger.debug("Export complete")
 
 
@@ -463,6 +890,18 @@ def ingest(
         None,
         help="Bearer token for GraphQL auth (overrides profile)",
     ),
+    http_timeout: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_HTTP_TIMEOUT", "30")),
+        "--timeout",
+        min=1,
+        help="GraphQL HTTP timeout in seconds",
+    ),
+    max_connections: int = typer.Option(
+        int(os.getenv("SCHEMA_BRIDGE_MAX_CONNECTIONS", "10")),
+        "--max-connections",
+        min=1,
+        help="Maximum pooled HTTP connections per GraphQL host",
+    ),
     dry_run: bool = typer.Option(False, help="Do not upload, print rows as JSON"),
     out: Path | None = typer.Option(
         None,
@@ -478,6 +917,9 @@ def ingest(
 ) -> None:
     configure_logging(debug)
     logger.debug("Starting ingest: input=%s profile=%s", input_path, profile)
+    configure_http(
+        HttpConfig(timeout=http_timeout, max_connections_per_host=max_connections)
+    )
     profile_cfg = load_ingest_profile(profile)
     final_base_url = (
         base_url
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+import sys
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from schema_bridge.graphql.cache import CacheConfig, ResponseCache
+from schema_bridge.graphql.planner import plan_graphql_query
+from schema_bridge.graphql.watermark import WatermarkWindow, open_watermark_window
+from schema_bridge.rdf.export import _normalize_export_format
+from schema_bridge.rdf.instrument import MappingStats
+from schema_bridge.rdf.incremental import IncrementalGraph, open_incremental_graph
+from schema_bridge.rdf.queries import load_query
 
 if TYPE_CHECKING:
-    from schema_bridge.profiles.loader import ProfileConfig
+    from schema_bridge.profiles.loader import ProfileConfig, ResolvedExport
 
 
 def resolve_graphql_target(
@@ -30,3 +40,97 @@ def resolve_graphql_target(
                 "--base-url/--schema (or set them in the profile or environment)."
             )
     return resolved_endpoint, resolved_base_url, resolved_schema
+
+
+def build_response_cache(
+    *,
+    cache_dir: Path | None,
+    ttl: float,
+    max_mb: int,
+    no_cache: bool,
+    refresh: bool,
+) -> ResponseCache | None:
+    if cache_dir is None:
+        return None
+    mode = "bypass" if no_cache else "refresh" if refresh else "use"
+    return ResponseCache(
+        CacheConfig(
+            directory=cache_dir,
+            ttl=ttl,
+            max_bytes=max_mb * 1024 * 1024,
+            mode=mode,
+        )
+    )
+
+
+def _sync_target(endpoint: str | None, base_url: str | None, schema: str | None) -> str:
+    return endpoint or f"{(base_url or '').rstrip('/')}/{schema or ''}/graphql"
+
+
+def resolve_incremental_graph(
+    *,
+    state_dir: Path,
+    profile: str,
+    endpoint: str | None,
+    base_url: str | None,
+    schema: str | None,
+) -> IncrementalGraph:
+    return open_incremental_graph(
+        state_dir,
+        profile=profile,
+        endpoint=_sync_target(endpoint, base_url, schema),
+    )
+
+
+def resolve_watermark_window(
+    *,
+    state_dir: Path,
+    profile: str,
+    endpoint: str | None,
+    base_url: str | None,
+    schema: str | None,
+    updated_since: str | None,
+    updated_until: str | None,
+) -> WatermarkWindow:
+    return open_watermark_window(
+        state_dir,
+        profile=profile,
+        endpoint=_sync_target(endpoint, base_url, schema),
+        updated_since=updated_since,
+        updated_until=updated_until,
+    )
+
+
+def prune_export_query(
+    query_text: str,
+    *,
+    export: "ResolvedExport",
+    keep: list[str],
+) -> str:
+    targets = {_normalize_export_format(target) for target in export.targets}
+    sparql_paths = []
+    if targets & {"json", "csv"} and export.select_query:
+        sparql_paths.append(export.select_query)
+    if (targets - {"json", "csv"} or export.validate) and export.construct_query:
+        sparql_paths.append(export.construct_query)
+    plan = plan_graphql_query(
+        query_text,
+        root_key=export.root_key,
+        mapping=export.mapping,
+        sparql=[load_query(path).text for path in sparql_paths],
+        keep=keep,
+    )
+    return plan.query
+
+
+def write_mapping_report(stats: MappingStats, path: Path | None) -> None:
+    sys.stderr.write(stats.render())
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(stats.to_json(), encoding="utf-8")
+
+
+def stdout_stream() -> IO[bytes]:
+    # Serializers write bytes; anything echoed as text must go out first.
+    sys.stdout.flush()
+    return sys.stdout.buffer
@@ -2,12 +2,28 @@ from schema_bridge.graphql.client import (
     PaginationConfig,
     extract_rows,
     fetch_graphql,
+    iter_graphql_pages,
+    iter_graphql_rows,
     load_graphql_file,
 )
+from schema_bridge.graphql.pool import (
+    ClientPool,
+    HttpConfig,
+    configure_http,
+    get_client_pool,
+)
+from schema_bridge.graphql.retry import RetryConfig
 
 __all__ = [
+    "ClientPool",
+    "HttpConfig",
     "PaginationConfig",
+    "RetryConfig",
+    "configure_http",
     "extract_rows",
     "fetch_graphql",
+    "get_client_pool",
+    "iter_graphql_pages",
+    "iter_graphql_rows",
     "load_graphql_file",
 ]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TypeVar
+
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    Node,
+    OperationDefinitionNode,
+    SelectionSetNode,
+)
+
+NodeT = TypeVar("NodeT", bound=Node)
+
+
+def replace_node(node: NodeT, **changes: object) -> NodeT:
+    # AST nodes are immutable in recent graphql-core releases.
+    values = {key: getattr(node, key, None) for key in node.keys}
+    values.update(changes)
+    return type(node)(**values)
+
+
+def response_key(node: FieldNode) -> str:
+    return node.alias.value if node.alias else node.name.value
+
+
+def root_field(
+    document: DocumentNode, root_key: str
+) -> tuple[OperationDefinitionNode, FieldNode] | None:
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        for selection in definition.selection_set.selections:
+            if isinstance(selection, FieldNode) and response_key(selection) == root_key:
+                return definition, selection
+    return None
+
+
+def replace_root_field(
+    document: DocumentNode,
+    found: tuple[OperationDefinitionNode, FieldNode],
+    root: FieldNode,
+) -> DocumentNode:
+    operation, old = found
+    operation = replace_node(
+        operation,
+        selection_set=SelectionSetNode(
+            selections=tuple(
+                root if selection is old else selection
+                for selection in operation.selection_set.selections
+            )
+        ),
+    )
+    return replace_node(
+        document,
+        definitions=tuple(
+            operation if definition is found[0] else definition
+            for definition in document.definitions
+        ),
+    )
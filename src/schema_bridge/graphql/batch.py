@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, cast
+
+from graphql import parse, print_ast
+from graphql.language import (
+    FieldNode,
+    NameNode,
+    Node,
+    SelectionSetNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+
+from schema_bridge.graphql.ast import replace_node, root_field
+
+PAGE_VARIABLES = ("limit", "offset")
+
+
+def page_alias(index: int) -> str:
+    return f"p{index}"
+
+
+def _page_variable(name: str, index: int) -> str:
+    return f"{name}_{page_alias(index)}"
+
+
+def _rename_variables(node: object, index: int) -> object:
+    if isinstance(node, VariableNode):
+        if node.name.value in PAGE_VARIABLES:
+            return VariableNode(
+                name=NameNode(value=_page_variable(node.name.value, index))
+            )
+        return node
+    if isinstance(node, Node):
+        changes: dict[str, Any] = {
+            key: _rename_variables(getattr(node, key, None), index)
+            for key in node.keys
+            if key != "loc"
+        }
+        return type(node)(**changes)
+    if isinstance(node, tuple):
+        return tuple(_rename_variables(item, index) for item in node)
+    if isinstance(node, list):
+        return [_rename_variables(item, index) for item in node]
+    return node
+
+
+@lru_cache(maxsize=32)
+def batched_query(query: str, root_key: str, count: int) -> str:
+    document = parse(query)
+    found = root_field(document, root_key)
+    if found is None:
+        raise ValueError(f"Batched pagination requires a '{root_key}' selection")
+    operation, root = found
+    definitions = {
+        definition.variable.name.value: definition
+        for definition in operation.variable_definitions or ()
+    }
+    missing = [name for name in PAGE_VARIABLES if name not in definitions]
+    if missing:
+        raise ValueError(
+            "Batched pagination requires "
+            + ", ".join(f"${name}" for name in missing)
+            + f" in the query for '{root_key}'"
+        )
+    pages = [
+        replace_node(
+            cast(FieldNode, _rename_variables(root, index)),
+            alias=NameNode(value=page_alias(index)),
+        )
+        for index in range(count)
+    ]
+    selections = []
+    for selection in operation.selection_set.selections:
+        if selection is root:
+            selections.extend(pages)
+        else:
+            selections.append(selection)
+    variable_definitions: list[VariableDefinitionNode] = []
+    for definition in operation.variable_definitions or ():
+        name = definition.variable.name.value
+        if name not in PAGE_VARIABLES:
+            variable_definitions.append(definition)
+            continue
+        variable_definitions.extend(
+            replace_node(
+                definition,
+                variable=VariableNode(name=NameNode(value=_page_variable(name, index))),
+            )
+            for index in range(count)
+        )
+    operation = replace_node(
+        operation,
+        variable_definitions=tuple(variable_definitions),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    document = replace_node(
+        document,
+        definitions=tuple(
+            operation if definition is found[0] else definition
+            for definition in document.definitions
+        ),
+    )
+    return print_ast(document)
+
+
+def batched_variables(page_vars: list[dict]) -> dict:
+    merged = {
+        key: value for key, value in page_vars[0].items() if key not in PAGE_VARIABLES
+    }
+    for index, variables in enumerate(page_vars):
+        for name in PAGE_VARIABLES:
+            merged[_page_variable(name, index)] = variables[name]
+    return merged
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger("schema_bridge.graphql.cache")
+
+CACHE_MODES = {"use", "refresh", "bypass"}
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    directory: Path
+    ttl: float = 3600.0
+    max_bytes: int = 512 * 1024 * 1024
+    mode: str = "use"
+
+
+class ResponseCache:
+    def __init__(self, config: CacheConfig) -> None:
+        if config.mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown cache mode '{config.mode}' (use one of {sorted(CACHE_MODES)})"
+            )
+        self.config = config
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Bytes on disk, scanned once and then kept up to date by put/get so a
+        # write does not stat the whole directory.
+        self._total: int | None = None
+
+    @staticmethod
+    def key(endpoint: str, query: str, variables: dict | None) -> str:
+        payload = json.dumps(
+            {"endpoint": endpoint, "query": query, "variables": variables or {}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.config.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - stat.st_mtime > self.config.ttl:
+            logger.debug("Cache entry expired: %s", key)
+            self._discard(path, stat.st_size)
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            self._discard(path, stat.st_size)
+            return None
+        # atime tracks recency for LRU eviction; mtime keeps the TTL anchor.
+        os.utime(path, (now, stat.st_mtime))
+        return data
+
+    def put(self, key: str, value: dict) -> None:
+        self.config.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(value, handle)
+        size = tmp_path.stat().st_size
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._total is None:
+                self._total = self._scan_size()
+            else:
+                self._total += size - replaced
+            over = self._total > self.config.max_bytes
+        if over:
+            self.evict()
+
+    def _discard(self, path: Path, size: int) -> None:
+        with self._lock:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                return
+            if self._total is not None:
+                self._total -= size
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self.config.directory.glob("*.json"):
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.config.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+                total += stat.st_size
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.config.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logger.debug("Evicted cache entry: %s", path.name)
+            self._total = total
+
+    def wrap(
+        self, endpoint: str, execute: Callable[[str, dict | None], dict]
+    ) -> Callable[[str, dict | None], dict]:
+        if self.config.mode == "bypass":
+            return execute
+
+        def cached(query: str, variables: dict | None) -> dict:
+            key = self.key(endpoint, query, variables)
+            if self.config.mode == "use":
+                hit = self.get(key)
+                if hit is not None:
+                    self._count(True)
+                    logger.debug("GraphQL cache hit: %s", key)
+                    return hit
+            self._count(False)
+            result = execute(query, variables)
+            self.put(key, result)
+            return result
+
+        return cached
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+import hashlib
+import json
+import logging
+import os
+
+if TYPE_CHECKING:
+    from schema_bridge.graphql.client import PaginationConfig
+
+logger = logging.getLogger("schema_bridge.graphql.checkpoint")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    offset: int = 0
+    total: int = 0
+    last_seen: object | None = None
+    boundary: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class CheckpointState:
+    cursor: PageCursor
+    updated_filter: dict | None
+    spool_bytes: int
+
+
+class PageCheckpoint:
+    def __init__(self, directory: Path, key: str) -> None:
+        self.directory = directory
+        self.key = key
+        self.state_path = directory / f"{key}.json"
+        self.spool_path = directory / f"{key}.ndjson"
+
+    @classmethod
+    def for_request(
+        cls,
+        directory: Path,
+        *,
+        endpoint: str,
+        query: str,
+        variables: dict | None,
+        root_key: str,
+        pagination: PaginationConfig,
+        updated_since: str | None,
+    ) -> PageCheckpoint:
+        # Only settings that change which rows land in which page belong in the
+        # key; concurrency and batching are free to change between attempts.
+        payload = json.dumps(
+            {
+                "endpoint": endpoint,
+                "query": query,
+                "variables": variables or {},
+                "root_key": root_key,
+                "pagination": {
+                    "page_size": pagination.page_size,
+                    "max_rows": pagination.max_rows,
+                    "offset": pagination.offset,
+                    "strategy": pagination.strategy,
+                    "keyset_field": pagination.keyset_field,
+                },
+                "updated_since": updated_since,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+        return cls(directory, key)
+
+    def load(self) -> CheckpointState | None:
+        if not self.state_path.exists():
+            return None
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+            cursor = data["cursor"]
+            state = CheckpointState(
+                cursor=PageCursor(
+                    offset=int(cursor["offset"]),
+                    total=int(cursor["total"]),
+                    last_seen=cursor.get("last_seen"),
+                    boundary=tuple(cursor.get("boundary") or ()),
+                ),
+                updated_filter=data.get("updated_filter"),
+                spool_bytes=int(data["spool_bytes"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(
+                "Ignoring unreadable checkpoint %s: %s", self.state_path, exc
+            )
+            return None
+        if not self.spool_path.exists() or (
+            self.spool_path.stat().st_size < state.spool_bytes
+        ):
+            logger.warning("Ignoring checkpoint with a truncated spool: %s", self.key)
+            return None
+        # Rows appended after the last recorded state belong to an unfinished page.
+        with self.spool_path.open("r+b") as handle:
+            handle.truncate(state.spool_bytes)
+        return state
+
+    def spooled_pages(self, page_size: int) -> Iterator[list[dict]]:
+        page: list[dict] = []
+        with self.spool_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                page.append(json.loads(line))
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+    def record(
+        self, page: list[dict], cursor: PageCursor, updated_filter: dict | None
+    ) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self.spool_path.open("ab") as handle:
+            for row in page:
+                handle.write(json.dumps(row, default=str).encode("utf-8") + b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+            spool_bytes = handle.tell()
+        payload = {
+            "cursor": {
+                "offset": cursor.offset,
+                "total": cursor.total,
+                "last_seen": cursor.last_seen,
+                "boundary": list(cursor.boundary),
+            },
+            "updated_filter": updated_filter,
+            "spool_bytes": spool_bytes,
+        }
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def clear(self) -> None:
+        self.state_path.unlink(missing_ok=True)
+        self.spool_path.unlink(missing_ok=True)
+        logger.debug("Cleared checkpoint %s", self.key)
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable
-from datetime import datetime, timezone
+from typing import Callable, Iterator
 from pathlib import Path
 import json
 import os
 
-from gql import Client, gql
-from gql.transport.exceptions import TransportQueryError
-from gql.transport.requests import RequestsHTTPTransport
+from graphql import parse, print_ast
+from graphql.language import (
+    ArgumentNode,
+    EnumValueNode,
+    NameNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    VariableNode,
+)
+
+from schema_bridge.graphql.ast import replace_node, replace_root_field, root_field
+from schema_bridge.graphql.batch import batched_query, batched_variables, page_alias
+from schema_bridge.graphql.cache import ResponseCache
+from schema_bridge.graphql.checkpoint import PageCheckpoint, PageCursor
+from schema_bridge.graphql.pool import get_client_pool
+from schema_bridge.graphql.retry import RetryConfig, with_retry
+from schema_bridge.graphql.stream import iter_fixture_pages, open_fixture
 import logging
 
 logger = logging.getLogger("schema_bridge.graphql.client")
@@ -20,11 +34,15 @@ class PaginationConfig:
     page_size: int
     max_rows: int | None = None
     offset: int = 0
+    concurrency: int = 1
+    strategy: str = "offset"
+    keyset_field: str = "id"
+    batch_pages: int = 1
 
 
 def load_graphql_file(path: Path) -> dict:
     logger.debug("Loading GraphQL fixture: %s", path)
-    with path.open("r", encoding="utf-8") as handle:
+    with open_fixture(path) as handle:
         return json.load(handle)
 
 
@@ -34,11 +52,10 @@ def _build_updated_filter(
     if not updated_since and not updated_until:
         return None
     start = updated_since or "0001-01-01T00:00:00Z"
-    end = updated_until
-    if not end:
-        now = datetime.now(timezone.utc).replace(microsecond=0)
-        end = now.isoformat().replace("+00:00", "Z")
-    logger.debug("Using updated filter: %s..%s", start, end)
+    # An open upper bound (null) keeps the request, and so its cache key, the
+    # same from run to run; a clock-derived bound would never hit the cache.
+    end = updated_until or None
+    logger.debug("Using updated filter: %s..%s", start, end or "now")
     return {"between": {"mg_updatedOn": [start, end]}}
 
 
@@ -50,15 +67,46 @@ def _merge_filters(existing: dict | None, updated_filter: dict | None) -> dict |
     return {"and": [existing, updated_filter]}
 
 
-def _execute_graphql(client: Client, query: str, variables: dict | None = None) -> dict:
-    try:
-        result = client.execute(gql(query), variable_values=variables or {})
-    except TransportQueryError as exc:
-        raise RuntimeError(f"GraphQL errors: {exc.errors}") from exc
-    return result
+def _page_variables(
+    variables: dict | None,
+    *,
+    limit: int,
+    offset: int,
+    updated_filter: dict | None,
+) -> dict:
+    page_vars = dict(variables or {})
+    page_vars["limit"] = limit
+    page_vars["offset"] = offset
+    if updated_filter is not None or "filter" in page_vars:
+        page_vars["filter"] = _merge_filters(page_vars.get("filter"), updated_filter)
+    return page_vars
 
 
-def _paginate_graphql(
+def _page_rows(result: dict, root_key: str) -> list[dict]:
+    data = result.get(root_key)
+    if not isinstance(data, list):
+        raise RuntimeError(f"Expected list for '{root_key}', got {type(data).__name__}")
+    return data
+
+
+def _page_windows(
+    pagination: PaginationConfig, offset: int, total: int, count: int
+) -> list[tuple[int, int]]:
+    windows: list[tuple[int, int]] = []
+    for _ in range(count):
+        page_limit = pagination.page_size
+        if pagination.max_rows is not None:
+            remaining = pagination.max_rows - total
+            if remaining <= 0:
+                break
+            page_limit = min(page_limit, remaining)
+        windows.append((offset, page_limit))
+        offset += page_limit
+        total += page_limit
+    return windows
+
+
+def _iter_graphql_pages(
     *,
     execute: Callable[[str, dict | None], dict],
     query: str,
@@ -66,16 +114,260 @@ def _paginate_graphql(
     root_key: str,
     pagination: PaginationConfig,
     updated_filter: dict | None,
-) -> dict:
+) -> Iterator[list[dict]]:
+    for page, _ in _iter_graphql_page_cursors(
+        execute=execute,
+        query=query,
+        variables=variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_filter=updated_filter,
+        start=PageCursor(offset=pagination.offset),
+    ):
+        yield page
+
+
+def _iter_graphql_page_cursors(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    start: PageCursor,
+) -> Iterator[tuple[list[dict], PageCursor]]:
     logger.debug(
-        "Paginating GraphQL results: root_key=%s page_size=%s max_rows=%s",
+        "Paginating GraphQL results: root_key=%s page_size=%s max_rows=%s concurrency=%s",
         root_key,
         pagination.page_size,
         pagination.max_rows,
+        pagination.concurrency,
     )
-    rows: list[dict] = []
-    total = 0
-    offset = pagination.offset
+    if pagination.strategy == "keyset":
+        if pagination.concurrency > 1 or pagination.batch_pages > 1:
+            logger.warning(
+                "Keyset pagination is sequential; ignoring concurrency=%s batch_pages=%s",
+                pagination.concurrency,
+                pagination.batch_pages,
+            )
+        yield from _iter_graphql_pages_keyset(
+            execute=execute,
+            query=query,
+            variables=variables,
+            root_key=root_key,
+            pagination=pagination,
+            updated_filter=updated_filter,
+            start=start,
+        )
+        return
+    if pagination.strategy != "offset":
+        raise ValueError(
+            f"Unknown pagination strategy '{pagination.strategy}' (use offset or keyset)"
+        )
+    if pagination.batch_pages > 1:
+        if pagination.concurrency > 1:
+            logger.warning(
+                "Batched pagination sends one request at a time; ignoring concurrency=%s",
+                pagination.concurrency,
+            )
+        yield from _iter_graphql_pages_batched(
+            execute=execute,
+            query=query,
+            variables=variables,
+            root_key=root_key,
+            pagination=pagination,
+            updated_filter=updated_filter,
+            start=start,
+        )
+        return
+    if pagination.concurrency > 1:
+        yield from _iter_graphql_pages_concurrent(
+            execute=execute,
+            query=query,
+            variables=variables,
+            root_key=root_key,
+            pagination=pagination,
+            updated_filter=updated_filter,
+            start=start,
+        )
+        return
+    total = start.total
+    offset = start.offset
+    while True:
+        windows = _page_windows(pagination, offset, total, 1)
+        if not windows:
+            break
+        _, page_limit = windows[0]
+        page_vars = _page_variables(
+            variables, limit=page_limit, offset=offset, updated_filter=updated_filter
+        )
+        data = _page_rows(execute(query, page_vars), root_key)
+        total += len(data)
+        offset += len(data)
+        logger.debug("Fetched %s rows (total=%s)", len(data), total)
+        yield data, PageCursor(offset=offset, total=total)
+        if len(data) < page_limit:
+            break
+
+
+def _iter_graphql_pages_concurrent(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    start: PageCursor,
+) -> Iterator[tuple[list[dict], PageCursor]]:
+    total = start.total
+    offset = start.offset
+    with ThreadPoolExecutor(max_workers=pagination.concurrency) as pool:
+        while True:
+            windows = _page_windows(pagination, offset, total, pagination.concurrency)
+            if not windows:
+                break
+            futures = [
+                pool.submit(
+                    execute,
+                    query,
+                    _page_variables(
+                        variables,
+                        limit=page_limit,
+                        offset=page_offset,
+                        updated_filter=updated_filter,
+                    ),
+                )
+                for page_offset, page_limit in windows
+            ]
+            exhausted = False
+            try:
+                for (page_offset, page_limit), future in zip(windows, futures):
+                    data = _page_rows(future.result(), root_key)
+                    total += len(data)
+                    logger.debug(
+                        "Fetched %s rows at offset %s (total=%s)",
+                        len(data),
+                        page_offset,
+                        total,
+                    )
+                    yield data, PageCursor(offset=page_offset + len(data), total=total)
+                    if len(data) < page_limit:
+                        exhausted = True
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+            if exhausted:
+                break
+            last_offset, last_limit = windows[-1]
+            offset = last_offset + last_limit
+
+
+def _iter_graphql_pages_batched(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    start: PageCursor,
+) -> Iterator[tuple[list[dict], PageCursor]]:
+    total = start.total
+    offset = start.offset
+    while True:
+        windows = _page_windows(pagination, offset, total, pagination.batch_pages)
+        if not windows:
+            break
+        result = execute(
+            batched_query(query, root_key, len(windows)),
+            batched_variables(
+                [
+                    _page_variables(
+                        variables,
+                        limit=page_limit,
+                        offset=page_offset,
+                        updated_filter=updated_filter,
+                    )
+                    for page_offset, page_limit in windows
+                ]
+            ),
+        )
+        for index, (page_offset, page_limit) in enumerate(windows):
+            data = _page_rows(result, page_alias(index))
+            total += len(data)
+            logger.debug(
+                "Fetched %s rows at offset %s (total=%s)", len(data), page_offset, total
+            )
+            yield data, PageCursor(offset=page_offset + len(data), total=total)
+            if len(data) < page_limit:
+                return
+        last_offset, last_limit = windows[-1]
+        offset = last_offset + last_limit
+
+
+def _keyset_filter(key: str, last_seen: object | None) -> dict | None:
+    if last_seen is None:
+        return None
+    # EMX2 treats a null bound in `between` as an open range, so this is
+    # `key >= last_seen`; rows on the boundary are de-duplicated by the caller.
+    return {key: {"between": [last_seen, None]}}
+
+
+def _keyset_query(query: str, root_key: str, key: str) -> tuple[str, str | None]:
+    # Each page filters on `key >= last_seen`, which only walks the table when
+    # rows come back sorted by the key, so the root field's orderby is forced to
+    # it. An orderby bound to a variable is returned so the caller can set it.
+    document = parse(query)
+    found = root_field(document, root_key)
+    if found is None:
+        raise ValueError(f"Keyset pagination requires a '{root_key}' selection")
+    root = found[1]
+    order = ObjectValueNode(
+        fields=(
+            ObjectFieldNode(name=NameNode(value=key), value=EnumValueNode(value="ASC")),
+        )
+    )
+    arguments: list[ArgumentNode] = []
+    for argument in root.arguments or ():
+        if argument.name.value != "orderby":
+            arguments.append(argument)
+        elif isinstance(argument.value, VariableNode):
+            return query, argument.value.name.value
+        elif print_ast(argument.value) != print_ast(order):
+            logger.info(
+                "Keyset pagination on '%s' replaces orderby %s with %s",
+                key,
+                print_ast(argument.value),
+                print_ast(order),
+            )
+    arguments.append(ArgumentNode(name=NameNode(value="orderby"), value=order))
+    root = replace_node(root, arguments=tuple(arguments))
+    return print_ast(replace_root_field(document, found, root)), None
+
+
+def _keyset_identity(row: dict) -> str:
+    return json.dumps(row, sort_keys=True, default=str)
+
+
+def _iter_graphql_pages_keyset(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    start: PageCursor,
+) -> Iterator[tuple[list[dict], PageCursor]]:
+    key = pagination.keyset_field
+    query, order_variable = _keyset_query(query, root_key, key)
+    total = start.total
+    offset = start.offset if start.last_seen is None else 0
+    last_seen: object | None = start.last_seen
+    boundary: set[str] = set(start.boundary)
     while True:
         page_limit = pagination.page_size
         if pagination.max_rows is not None:
@@ -83,28 +375,174 @@ def _paginate_graphql(
             if remaining <= 0:
                 break
             page_limit = min(page_limit, remaining)
-        page_vars = dict(variables or {})
-        page_vars["limit"] = page_limit
-        page_vars["offset"] = offset
-        if updated_filter is not None or "filter" in page_vars:
-            page_vars["filter"] = _merge_filters(
-                page_vars.get("filter"), updated_filter
+        request_limit = page_limit + len(boundary)
+        page_vars = _page_variables(
+            variables,
+            limit=request_limit,
+            offset=offset,
+            updated_filter=_merge_filters(
+                updated_filter, _keyset_filter(key, last_seen)
+            ),
+        )
+        if order_variable is not None:
+            page_vars[order_variable] = {key: "ASC"}
+        data = _page_rows(execute(query, page_vars), root_key)
+        offset = 0
+        page: list[dict] = []
+        consumed = 0
+        for row in data:
+            if len(page) >= page_limit:
+                break
+            consumed += 1
+            value = row.get(key)
+            if value is None:
+                raise RuntimeError(
+                    f"Keyset pagination requires '{key}' in every '{root_key}' row"
+                )
+            identity = _keyset_identity(row)
+            if value == last_seen and identity in boundary:
+                continue
+            if value != last_seen:
+                last_seen = value
+                boundary = set()
+            boundary.add(identity)
+            page.append(row)
+        total += len(page)
+        logger.debug(
+            "Fetched %s rows after %s=%s (total=%s)", len(page), key, last_seen, total
+        )
+        if page:
+            yield (
+                page,
+                PageCursor(
+                    total=total, last_seen=last_seen, boundary=tuple(sorted(boundary))
+                ),
             )
-        result = execute(query, page_vars)
-        data = result.get(root_key)
-        if not isinstance(data, list):
+        if len(data) < request_limit and consumed == len(data):
+            break
+        if not page:
             raise RuntimeError(
-                f"Expected list for '{root_key}', got {type(data).__name__}"
+                f"Keyset pagination stalled: more than {request_limit} rows share "
+                f"{key}={last_seen!r}; use a more selective key or a larger page size"
             )
-        rows.extend(data)
-        total += len(data)
-        logger.debug("Fetched %s rows (total=%s)", len(data), total)
-        if len(data) < page_limit:
-            break
-        offset += len(data)
+
+
+def _iter_checkpointed_pages(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    checkpoint: PageCheckpoint | None,
+) -> Iterator[list[dict]]:
+    start = PageCursor(offset=pagination.offset)
+    if checkpoint is not None:
+        state = checkpoint.load()
+        if state is None:
+            checkpoint.clear()
+        else:
+            logger.info(
+                "Resuming GraphQL pagination from checkpoint %s (%s rows spooled)",
+                checkpoint.key,
+                state.cursor.total,
+            )
+            # Keep the original time window so resumed pages match the spooled ones.
+            updated_filter = state.updated_filter
+            start = state.cursor
+            yield from checkpoint.spooled_pages(pagination.page_size)
+    for page, cursor in _iter_graphql_page_cursors(
+        execute=execute,
+        query=query,
+        variables=variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_filter=updated_filter,
+        start=start,
+    ):
+        if checkpoint is not None:
+            checkpoint.record(page, cursor, updated_filter)
+        yield page
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def _paginate_graphql(
+    *,
+    execute: Callable[[str, dict | None], dict],
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_filter: dict | None,
+    checkpoint: PageCheckpoint | None = None,
+) -> dict:
+    rows: list[dict] = []
+    for page in _iter_checkpointed_pages(
+        execute=execute,
+        query=query,
+        variables=variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_filter=updated_filter,
+        checkpoint=checkpoint,
+    ):
+        rows.extend(page)
     return {"data": {root_key: rows}}
 
 
+def _resolve_url(base_url: str | None, schema: str | None, endpoint: str | None) -> str:
+    if endpoint:
+        return endpoint
+    if not base_url or not schema:
+        raise ValueError(
+            "GraphQL base_url and schema are required when endpoint is not set"
+        )
+    return f"{base_url.rstrip('/')}/{schema}/graphql"
+
+
+def _pooled_executor(
+    url: str,
+    cache: ResponseCache | None = None,
+    retry: RetryConfig | None = None,
+) -> Callable[[str, dict | None], dict]:
+    pool = get_client_pool()
+
+    def pooled(q: str, v: dict | None) -> dict:
+        return pool.execute(url, q, v)
+
+    execute: Callable[[str, dict | None], dict] = pooled
+    if retry is not None:
+        execute = with_retry(execute, retry)
+    if cache is not None:
+        return cache.wrap(url, execute)
+    return execute
+
+
+def _page_checkpoint(
+    checkpoint_dir: Path | None,
+    *,
+    url: str,
+    query: str,
+    variables: dict | None,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_since: str | None,
+) -> PageCheckpoint | None:
+    if checkpoint_dir is None:
+        return None
+    return PageCheckpoint.for_request(
+        checkpoint_dir,
+        endpoint=url,
+        query=query,
+        variables=variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_since=updated_since,
+    )
+
+
 def fetch_graphql(
     base_url: str | None,
     schema: str | None,
@@ -116,33 +554,36 @@ def fetch_graphql(
     updated_since: str | None = None,
     updated_until: str | None = None,
     endpoint: str | None = None,
+    cache: ResponseCache | None = None,
+    retry: RetryConfig | None = None,
+    checkpoint_dir: Path | None = None,
 ) -> dict:
     fixture = os.getenv("SCHEMA_BRIDGE_GRAPHQL_FIXTURE")
     if fixture:
         logger.debug("Using GraphQL fixture from SCHEMA_BRIDGE_GRAPHQL_FIXTURE")
         return load_graphql_file(Path(fixture))
-    if endpoint:
-        url = endpoint
-    else:
-        if not base_url or not schema:
-            raise ValueError(
-                "GraphQL base_url and schema are required when endpoint is not set"
-            )
-        url = f"{base_url.rstrip('/')}/{schema}/graphql"
+    url = _resolve_url(base_url, schema, endpoint)
     logger.debug("Fetching GraphQL from %s (root_key=%s)", url, root_key)
-    transport = RequestsHTTPTransport(url=url, timeout=30)
-    client = Client(transport=transport, fetch_schema_from_transport=False)
     updated_filter = _build_updated_filter(updated_since, updated_until)
     if pagination:
         if not root_key:
             raise ValueError("Pagination requires a root_key to merge results")
         return _paginate_graphql(
-            execute=lambda q, v: _execute_graphql(client, q, v),
+            execute=_pooled_executor(url, cache, retry),
             query=query,
             variables=variables,
             root_key=root_key,
             pagination=pagination,
             updated_filter=updated_filter,
+            checkpoint=_page_checkpoint(
+                checkpoint_dir,
+                url=url,
+                query=query,
+                variables=variables,
+                root_key=root_key,
+                pagination=pagination,
+                updated_since=updated_since,
+            ),
         )
     merged_vars = dict(variables or {})
     if updated_filter is not None:
@@ -150,10 +591,83 @@ def fetch_graphql(
             merged_vars.get("filter"), updated_filter
         )
     logger.debug("Executing GraphQL query (no pagination)")
-    result = _execute_graphql(client, query, merged_vars)
+    result = _pooled_executor(url, cache, retry)(query, merged_vars)
     return {"data": result}
 
 
+def iter_graphql_pages(
+    base_url: str | None,
+    schema: str | None,
+    query: str,
+    variables: dict | None = None,
+    *,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_since: str | None = None,
+    updated_until: str | None = None,
+    endpoint: str | None = None,
+    cache: ResponseCache | None = None,
+    retry: RetryConfig | None = None,
+    checkpoint_dir: Path | None = None,
+) -> Iterator[list[dict]]:
+    fixture = os.getenv("SCHEMA_BRIDGE_GRAPHQL_FIXTURE")
+    if fixture:
+        logger.debug("Using GraphQL fixture from SCHEMA_BRIDGE_GRAPHQL_FIXTURE")
+        yield from iter_fixture_pages(Path(fixture), root_key, pagination.page_size)
+        return
+    url = _resolve_url(base_url, schema, endpoint)
+    logger.debug("Streaming GraphQL pages from %s (root_key=%s)", url, root_key)
+    yield from _iter_checkpointed_pages(
+        execute=_pooled_executor(url, cache, retry),
+        query=query,
+        variables=variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_filter=_build_updated_filter(updated_since, updated_until),
+        checkpoint=_page_checkpoint(
+            checkpoint_dir,
+            url=url,
+            query=query,
+            variables=variables,
+            root_key=root_key,
+            pagination=pagination,
+            updated_since=updated_since,
+        ),
+    )
+
+
+def iter_graphql_rows(
+    base_url: str | None,
+    schema: str | None,
+    query: str,
+    variables: dict | None = None,
+    *,
+    root_key: str,
+    pagination: PaginationConfig,
+    updated_since: str | None = None,
+    updated_until: str | None = None,
+    endpoint: str | None = None,
+    cache: ResponseCache | None = None,
+    retry: RetryConfig | None = None,
+    checkpoint_dir: Path | None = None,
+) -> Iterator[dict]:
+    for page in iter_graphql_pages(
+        base_url,
+        schema,
+        query,
+        variables,
+        root_key=root_key,
+        pagination=pagination,
+        updated_since=updated_since,
+        updated_until=updated_until,
+        endpoint=endpoint,
+        cache=cache,
+        retry=retry,
+        checkpoint_dir=checkpoint_dir,
+    ):
+        yield from page
+
+
 def extract_rows(graphql_data: dict, root_key: str) -> list[dict]:
     data = graphql_data.get("data", {})
     if root_key not in data:
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+import logging
+
+from graphql import parse, print_ast
+from graphql.language import (
+    FieldNode,
+    Node,
+    SelectionSetNode,
+    VariableNode,
+)
+from rdflib import URIRef, Variable
+from rdflib.paths import NegatedPath, Path as PropertyPath
+from rdflib.plugins.sparql.algebra import translateQuery
+from rdflib.plugins.sparql.parser import parseQuery
+
+from schema_bridge.graphql.ast import replace_node, response_key, root_field
+from schema_bridge.rdf.mapping import MappingConfig
+from schema_bridge.rdf.plan import parse_path
+
+logger = logging.getLogger("schema_bridge.graphql.planner")
+
+# A required-selection tree: response key -> nested requirements, or None to
+# keep the whole subtree.
+SelectionTree = dict[str, "SelectionTree | None"]
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    query: str
+    pruned: bool
+    reason: str | None = None
+    kept: int = 0
+    removed: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class PredicateUsage:
+    names: set[str]
+    open_reason: str | None = None
+
+
+def sparql_predicate_usage(queries: Iterable[str], field_ns: str) -> PredicateUsage:
+    names: set[str] = set()
+    for text in queries:
+        try:
+            algebra = translateQuery(parseQuery(text)).algebra
+        except Exception as exc:  # noqa: BLE001 - any parse failure disables pruning
+            return PredicateUsage(names, f"could not parse SPARQL: {exc}")
+        reason = _collect_predicates(algebra, field_ns, names)
+        if reason:
+            return PredicateUsage(names, reason)
+    return PredicateUsage(names)
+
+
+def _collect_predicates(node: object, field_ns: str, names: set[str]) -> str | None:
+    if isinstance(node, URIRef):
+        if str(node).startswith(field_ns):
+            names.add(str(node)[len(field_ns) :])
+        return None
+    if isinstance(node, NegatedPath):
+        return "SPARQL uses a negated property path"
+    if isinstance(node, PropertyPath):
+        parts = getattr(node, "args", None) or [
+            getattr(node, "arg", None) or getattr(node, "path", None)
+        ]
+        for part in parts:
+            reason = _collect_predicates(part, field_ns, names)
+            if reason:
+                return reason
+        return None
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "template":
+                continue
+            if key == "triples":
+                for _, predicate, _ in value:
+                    if isinstance(predicate, Variable):
+                        return f"SPARQL uses a variable predicate ?{predicate}"
+            reason = _collect_predicates(value, field_ns, names)
+            if reason:
+                return reason
+        return None
+    if isinstance(node, (list, tuple, set)):
+        for item in node:
+            reason = _collect_predicates(item, field_ns, names)
+            if reason:
+                return reason
+    return None
+
+
+def _require(tree: SelectionTree, path: str | list[str]) -> None:
+    parts = [name for name, _ in parse_path(path)] if isinstance(path, str) else path
+    parts = [part for part in parts if part]
+    if not parts:
+        return
+    current = tree
+    for part in parts[:-1]:
+        if part not in current:
+            current[part] = {}
+        child = current[part]
+        if child is None:
+            return
+        current = child
+    current[parts[-1]] = None
+
+
+def required_selections(
+    mapping: MappingConfig,
+    predicates: set[str],
+    *,
+    response_keys: Iterable[str] = (),
+    keep: Iterable[str] = (),
+) -> SelectionTree:
+    tree: SelectionTree = {}
+
+    def alias(key: str) -> str:
+        return mapping.field_aliases.get(key, key)
+
+    for key in [mapping.raw.id_field, *keep]:
+        _require(tree, key)
+    for key, target in mapping.field_aliases.items():
+        if target == mapping.raw.id_field:
+            _require(tree, key)
+    for key in [*mapping.id_strategy.pid_fields, *mapping.id_strategy.fallback_fields]:
+        _require(tree, key)
+
+    keys = set(response_keys)
+    for key in keys:
+        if alias(key) in predicates:
+            _require(tree, key)
+    for out_key, path_spec in mapping.field_paths.items():
+        if alias(out_key) not in predicates:
+            continue
+        for path in path_spec if isinstance(path_spec, list) else [path_spec]:
+            _require(tree, path)
+    for key, concept in mapping.concept_fields.items():
+        if not concept.path or (concept.predicate or alias(key)) not in predicates:
+            continue
+        for sub_path in (concept.uri_path, concept.code_path, concept.label_path):
+            _require(
+                tree,
+                [name for name, _ in parse_path(concept.path)]
+                + [name for name, _ in parse_path(sub_path)],
+            )
+    for node in mapping.node_fields.values():
+        if not node.path:
+            continue
+        mapped = set(node.fields.values()) if node.fields else set()
+        if node.predicate not in predicates and not (mapped & predicates):
+            continue
+        base = [name for name, _ in parse_path(node.path)]
+        if not node.fields:
+            _require(tree, base)
+            continue
+        _require(tree, base + [name for name, _ in parse_path(node.id_field)])
+        for source in node.fields:
+            _require(tree, base + [source])
+    return tree
+
+
+def _count_fields(selection_set: SelectionSetNode | None) -> int:
+    if selection_set is None:
+        return 0
+    total = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            total += 1 + _count_fields(selection.selection_set)
+    return total
+
+
+def _prune_selection_set(
+    selection_set: SelectionSetNode,
+    tree: SelectionTree,
+    *,
+    keep_nested: set[str],
+    prefix: str,
+    removed: list[str],
+) -> SelectionSetNode:
+    kept = []
+    for selection in selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            # Fragments are kept verbatim; their type conditions are not resolved here.
+            kept.append(selection)
+            continue
+        key = response_key(selection)
+        path = f"{prefix}{key}"
+        if key not in tree and not (
+            selection.selection_set is not None and key in keep_nested
+        ):
+            removed.append(path)
+            continue
+        children = tree.get(key)
+        if children is None or selection.selection_set is None:
+            kept.append(selection)
+            continue
+        pruned = _prune_selection_set(
+            selection.selection_set,
+            children,
+            keep_nested=set(),
+            prefix=f"{path}.",
+            removed=removed,
+        )
+        if not pruned.selections:
+            removed.append(path)
+            continue
+        kept.append(replace_node(selection, selection_set=pruned))
+    return SelectionSetNode(selections=tuple(kept))
+
+
+def _leaf_names(selection_set: SelectionSetNode | None) -> set[str]:
+    if selection_set is None:
+        return set()
+    names: set[str] = set()
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            names.add(response_key(selection))
+            names |= _leaf_names(selection.selection_set)
+    return names
+
+
+def _used_variables(node: object, names: set[str]) -> None:
+    if isinstance(node, VariableNode):
+        names.add(node.name.value)
+        return
+    if isinstance(node, Node):
+        for key in node.keys:
+            if key == "variable_definitions":
+                continue
+            _used_variables(getattr(node, key, None), names)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            _used_variables(item, names)
+
+
+def plan_graphql_query(
+    query: str,
+    *,
+    root_key: str,
+    mapping: MappingConfig,
+    sparql: Iterable[str],
+    keep: Iterable[str] = (),
+) -> QueryPlan:
+    usage = sparql_predicate_usage(sparql, mapping.raw.field_ns)
+    if usage.open_reason:
+        logger.info("GraphQL query pruning disabled: %s", usage.open_reason)
+        return QueryPlan(query=query, pruned=False, reason=usage.open_reason)
+    document = parse(query)
+    found = root_field(document, root_key)
+    selection_set = found[1].selection_set if found is not None else None
+    if found is None or selection_set is None:
+        reason = f"no '{root_key}' selection in the GraphQL query"
+        logger.info("GraphQL query pruning disabled: %s", reason)
+        return QueryPlan(query=query, pruned=False, reason=reason)
+    operation, root = found
+    tree = required_selections(
+        mapping,
+        usage.names,
+        response_keys=[
+            response_key(selection)
+            for selection in selection_set.selections
+            if isinstance(selection, FieldNode)
+        ],
+        keep=keep,
+    )
+    keep_nested: set[str] = set()
+    if mapping.auto_nodes:
+        # Auto nodes turn nested objects into `field:<item key>` triples. They
+        # read the raw row, so drop_nested does not remove them.
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode) and (
+                _leaf_names(selection.selection_set) & usage.names
+            ):
+                keep_nested.add(response_key(selection))
+    before = _count_fields(selection_set)
+    removed: list[str] = []
+    root = replace_node(
+        root,
+        selection_set=_prune_selection_set(
+            selection_set,
+            tree,
+            keep_nested=keep_nested,
+            prefix=f"{root_key}.",
+            removed=removed,
+        ),
+    )
+    operation = replace_node(
+        operation,
+        selection_set=SelectionSetNode(
+            selections=tuple(
+                root if selection is found[1] else selection
+                for selection in operation.selection_set.selections
+            )
+        ),
+    )
+    used: set[str] = set()
+    _used_variables(operation, used)
+    operation = replace_node(
+        operation,
+        variable_definitions=tuple(
+            definition
+            for definition in operation.variable_definitions or ()
+            if definition.variable.name.value in used
+        ),
+    )
+    document = replace_node(
+        document,
+        definitions=tuple(
+            operation if definition is found[0] else definition
+            for definition in document.definitions
+        ),
+    )
+    kept = _count_fields(root.selection_set)
+    logger.info(
+        "Pruned GraphQL query for '%s': kept %s of %s selection(s)",
+        root_key,
+        kept,
+        before,
+    )
+    logger.debug("Pruned GraphQL selections: %s", ", ".join(removed) or "none")
+    return QueryPlan(query=print_ast(document), pruned=True, kept=kept, removed=removed)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import logging
+import threading
+
+from gql import Client, GraphQLRequest
+from gql.transport.exceptions import TransportAlreadyConnected, TransportQueryError
+from gql.transport.requests import RequestsHTTPTransport
+from graphql import DocumentNode, parse
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("schema_bridge.graphql.pool")
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    timeout: int = 30
+    max_connections_per_host: int = 10
+    keep_alive: bool = True
+
+
+class _PooledTransport(RequestsHTTPTransport):
+    def __init__(self, *, session: requests.Session, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._shared_session = session
+
+    def connect(self) -> None:
+        if self.session is not None:
+            raise TransportAlreadyConnected("Transport is already connected")
+        self.session = self._shared_session
+
+    def close(self) -> None:
+        # The requests session belongs to the pool and outlives the transport.
+        self.session = None
+
+
+@lru_cache(maxsize=64)
+def _parse_query(query: str) -> DocumentNode:
+    # Only the parsed document is shared: gql stores the variables on the request
+    # object, so every call builds its own.
+    return parse(query)
+
+
+class ClientPool:
+    def __init__(self, config: HttpConfig | None = None) -> None:
+        self.config = config or HttpConfig()
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._clients: dict[tuple[str, tuple[tuple[str, str], ...]], object] = {}
+
+    def _http_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.config.max_connections_per_host,
+                pool_maxsize=self.config.max_connections_per_host,
+                pool_block=True,
+            )
+            for prefix in "http://", "https://":
+                session.mount(prefix, adapter)
+            if not self.config.keep_alive:
+                session.headers["Connection"] = "close"
+            self._session = session
+        return self._session
+
+    def _client_session(self, url: str, headers: dict[str, str] | None):
+        key = (url, tuple(sorted((headers or {}).items())))
+        with self._lock:
+            client_session = self._clients.get(key)
+            if client_session is None:
+                logger.debug("Opening pooled GraphQL client for %s", url)
+                transport = _PooledTransport(
+                    session=self._http_session(),
+                    url=url,
+                    headers=headers,
+                    timeout=self.config.timeout,
+                )
+                client = Client(transport=transport, fetch_schema_from_transport=False)
+                client_session = client.connect_sync()
+                self._clients[key] = client_session
+        return client_session
+
+    def execute(
+        self,
+        url: str,
+        query: str,
+        variables: dict | None = None,
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> dict:
+        client_session = self._client_session(url, headers)
+        try:
+            return client_session.execute(  # type: ignore[attr-defined]
+                GraphQLRequest(_parse_query(query), variable_values=variables or {})
+            )
+        except TransportQueryError as exc:
+            raise RuntimeError(f"GraphQL errors: {exc.errors}") from exc
+
+    def close(self) -> None:
+        with self._lock:
+            for client_session in self._clients.values():
+                client_session.client.close_sync()  # type: ignore[attr-defined]
+            self._clients.clear()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_POOL = ClientPool()
+
+
+def get_client_pool() -> ClientPool:
+    return _POOL
+
+
+def configure_http(config: HttpConfig) -> ClientPool:
+    global _POOL
+    if config != _POOL.config:
+        logger.debug("Configuring GraphQL client pool: %s", config)
+        _POOL.close()
+        _POOL = ClientPool(config)
+    return _POOL
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+import logging
+import random
+import time
+
+from gql.transport.exceptions import TransportConnectionFailed, TransportServerError
+import requests
+
+logger = logging.getLogger("schema_bridge.graphql.retry")
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    attempts: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.5
+
+
+def is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, TransportServerError):
+        return exc.code is None or exc.code >= 500 or exc.code == 429
+    return isinstance(exc, (TransportConnectionFailed, requests.RequestException))
+
+
+def backoff_delay(config: RetryConfig, attempt: int) -> float:
+    delay = min(config.max_backoff, config.backoff * (2 ** (attempt - 1)))
+    if config.jitter:
+        delay *= 1 + random.uniform(-config.jitter, config.jitter)
+    return max(delay, 0.0)
+
+
+def with_retry(
+    execute: Callable[[str, dict | None], dict],
+    config: RetryConfig,
+    *,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Callable[[str, dict | None], dict]:
+    if config.attempts <= 1:
+        return execute
+
+    def retrying(query: str, variables: dict | None) -> dict:
+        attempt = 1
+        while True:
+            try:
+                return execute(query, variables)
+            except Exception as exc:
+                if attempt >= config.attempts or not is_transient(exc):
+                    raise
+                delay = backoff_delay(config, attempt)
+                logger.warning(
+                    "GraphQL request failed (%s); retry %s/%s in %.1fs",
+                    exc,
+                    attempt,
+                    config.attempts - 1,
+                    delay,
+                )
+                sleep(delay)
+                attempt += 1
+
+    return retrying
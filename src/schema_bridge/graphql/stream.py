@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Iterator
+import gzip
+import json
+import logging
+
+logger = logging.getLogger("schema_bridge.graphql.stream")
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+_DECODER = json.JSONDecoder()
+
+
+def is_gzip(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(2) == b"\x1f\x8b"
+
+
+def is_ndjson(path: Path) -> bool:
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    return bool(suffixes) and suffixes[-1] in NDJSON_SUFFIXES
+
+
+def open_fixture(path: Path) -> IO[str]:
+    if is_gzip(path):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+class _JsonReader:
+    def __init__(self, handle: IO[str], chunk_size: int) -> None:
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> None:
+        if self.pos > self.chunk_size:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        # Read at least as much as is pending so a large element costs
+        # O(log n) re-parses rather than one per chunk.
+        chunk = self.handle.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+        self.buffer += chunk
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return ""
+            self._fill()
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            found_text = repr(found) if found else "end of file"
+            raise ValueError(f"Expected '{char}' in GraphQL JSON, found {found_text}")
+        self.pos += 1
+
+    def value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+            # A scalar ending at the buffer edge may continue in the next chunk;
+            # a number cut after "." or "e" decodes short of the edge.
+            if not self.eof and self._at_edge(value, end):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+    def _at_edge(self, value: object, end: int) -> bool:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            while end < len(self.buffer) and self.buffer[end] in _NUMBER_CHARS:
+                end += 1
+        return end == len(self.buffer)
+
+    def seek_key(self, key: str) -> bool:
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return False
+        while True:
+            name = self.value()
+            self.expect(":")
+            if name == key:
+                return True
+            self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return False
+
+    def items(self) -> Iterator[object]:
+        if self.peek() == "n":
+            if self.value() is not None:
+                raise ValueError("Expected a JSON array or null")
+            return
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_json_rows(
+    handle: IO[str], root_key: str, *, chunk_size: int = 1 << 16
+) -> Iterator[dict]:
+    reader = _JsonReader(handle, chunk_size)
+    if not reader.seek_key("data") or not reader.seek_key(root_key):
+        raise KeyError(f"Missing data root '{root_key}' in GraphQL response")
+    for item in reader.items():
+        if not isinstance(item, dict):
+            raise ValueError(
+                f"Expected objects in '{root_key}', got {type(item).__name__}"
+            )
+        yield item
+
+
+def iter_ndjson_rows(handle: IO[str]) -> Iterator[dict]:
+    for lineno, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError(f"Expected a JSON object on NDJSON line {lineno}")
+        yield row
+
+
+def iter_fixture_rows(
+    path: Path, root_key: str, *, chunk_size: int = 1 << 16
+) -> Iterator[dict]:
+    ndjson = is_ndjson(path)
+    logger.debug(
+        "Streaming GraphQL rows from %s (%s)", path, "ndjson" if ndjson else "json"
+    )
+    with open_fixture(path) as handle:
+        if ndjson:
+            yield from iter_ndjson_rows(handle)
+        else:
+            yield from iter_json_rows(handle, root_key, chunk_size=chunk_size)
+
+
+def iter_fixture_pages(
+    path: Path, root_key: str, page_size: int
+) -> Iterator[list[dict]]:
+    page: list[dict] = []
+    for row in iter_fixture_rows(path, root_key):
+        page.append(row)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+import hashlib
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger("schema_bridge.graphql.watermark")
+
+UPDATED_FIELD = "mg_updatedOn"
+
+
+def utc_timestamp() -> str:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return now.isoformat().replace("+00:00", "Z")
+
+
+def _later(value: str, other: str) -> bool:
+    try:
+        return datetime.fromisoformat(
+            value.replace("Z", "+00:00")
+        ) > datetime.fromisoformat(other.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return value > other
+
+
+def watermark_path(state_dir: Path, profile: str, endpoint: str) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", profile).strip("-") or "profile"
+    digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:12]
+    return state_dir / f"{slug}-{digest}.json"
+
+
+def load_watermark(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    value = data.get("updated_until") if isinstance(data, dict) else None
+    logger.debug("Loaded watermark %s from %s", value, path)
+    return str(value) if value else None
+
+
+def save_watermark(path: Path, *, profile: str, endpoint: str, value: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"profile": profile, "endpoint": endpoint, "updated_until": value}
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+    logger.debug("Saved watermark %s to %s", value, path)
+
+
+@dataclass
+class WatermarkWindow:
+    path: Path
+    profile: str
+    endpoint: str
+    updated_since: str | None
+    updated_until: str
+    from_clock: bool = False
+    rows: int = 0
+    latest: str | None = None
+
+    @property
+    def fetch_until(self) -> str | None:
+        # A clock-derived bound is only the fallback mark; the fetch itself
+        # stays open-ended so its requests can be served from the cache.
+        return None if self.from_clock else self.updated_until
+
+    def observe(self, row: dict) -> None:
+        self.rows += 1
+        value = row.get(UPDATED_FIELD)
+        if not value:
+            return
+        value = str(value)
+        if self.latest is None or _later(value, self.latest):
+            self.latest = value
+
+    def track(self, rows: Iterable[dict]) -> Iterator[dict]:
+        for row in rows:
+            self.observe(row)
+            yield row
+
+    def commit(self, *, max_rows: int | None = None) -> None:
+        if max_rows is not None and self.rows >= max_rows:
+            logger.warning(
+                "Not recording a watermark: the fetch stopped at the %s row limit, "
+                "so later rows were not synced",
+                max_rows,
+            )
+            return
+        value = self.updated_until
+        if self.from_clock:
+            # The server's own timestamps are immune to clock skew; the local
+            # clock is only a fallback.
+            if self.latest is not None:
+                value = self.latest
+            elif self.rows == 0 and self.updated_since:
+                logger.info("No rows fetched; keeping watermark %s", self.updated_since)
+                return
+            else:
+                logger.warning(
+                    "Watermark %s comes from the local clock; select %s in the "
+                    "GraphQL query to record the server's timestamp instead",
+                    value,
+                    UPDATED_FIELD,
+                )
+        save_watermark(
+            self.path,
+            profile=self.profile,
+            endpoint=self.endpoint,
+            value=value,
+        )
+
+
+def open_watermark_window(
+    state_dir: Path,
+    *,
+    profile: str,
+    endpoint: str,
+    updated_since: str | None,
+    updated_until: str | None,
+) -> WatermarkWindow:
+    path = watermark_path(state_dir, profile, endpoint)
+    return WatermarkWindow(
+        path=path,
+        profile=profile,
+        endpoint=endpoint,
+        updated_since=updated_since or load_watermark(path),
+        updated_until=updated_until or utc_timestamp(),
+        from_clock=updated_until is None,
+    )
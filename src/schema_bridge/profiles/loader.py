@@ -18,6 +18,8 @@ class ProfileConfig:
     base_url: str | None = None
     schema: str | None = None
     root_key: str = "Resources"
+    pagination_strategy: str = "offset"
+    pagination_key: str = "id"
     select_query: str | None = None
     construct_query: str | None = None
     ingest_select_query: str | None = None
@@ -123,6 +125,7 @@ def load_profile(
 ) -> ProfileConfig:
     profile_data, base_dir = _load_profile_data(name_or_path, expected_kind)
     fetch_data = _as_dict(profile_data.get("fetch"))
+    pagination_data = _as_dict(fetch_data.get("pagination"))
     export_data = _as_dict(profile_data.get("export"))
     validate_data = _as_dict(profile_data.get("validate"))
     mapping = MappingConfig.from_dict(_as_dict(profile_data.get("mapping")) or None)
@@ -173,6 +176,8 @@ def load_profile(
         root_key=str(
             profile_data.get("root_key", fetch_data.get("root_key", "Resources"))
         ),
+        pagination_strategy=str(pagination_data.get("strategy", "offset")).lower(),
+        pagination_key=str(pagination_data.get("key", "id")),
         select_query=_as_str(profile_data.get("select_query"))
         or _as_str(export_data.get("select")),
         construct_query=_as_str(profile_data.get("construct_query"))
@@ -290,6 +295,7 @@ class ResolvedExport:
     construct_query: str | None
     targets: list[str]
     validate: bool
+    decompose_construct: bool = False
 
 
 def _final_validate(profile: ProfileConfig, override: bool | None) -> bool:
@@ -307,13 +313,18 @@ def resolve_export(
     construct_query: str | None,
     target_format: str | None,
     validate_override: bool | None,
+    decompose_construct: bool = False,
 ) -> ResolvedExport:
     profile = load_profile(profile_name, expected_kind="export")
     mapping = load_mapping_override(str(mapping_override)) if mapping_override else None
     if not target_format:
         raise ValueError("Output format is required")
-    normalized_format = target_format.strip().lower()
-    if not normalized_format:
+    targets = list(
+        dict.fromkeys(
+            part.strip().lower() for part in target_format.split(",") if part.strip()
+        )
+    )
+    if not targets:
         raise ValueError("Output format is required")
     resolved_select = None
     select_path = select_query or profile.select_query
@@ -337,6 +348,7 @@ def resolve_export(
         root_key=root_key or profile.root_key,
         select_query=resolved_select,
         construct_query=resolved_construct,
-        targets=[normalized_format],
+        targets=targets,
         validate=_final_validate(profile, validate_override),
+        decompose_construct=decompose_construct,
     )
@@ -9,7 +9,8 @@ from schema_bridge.rdf.export import (
 from schema_bridge.rdf.mapping import MappingConfig, RawMapping, load_raw_from_rows
 from schema_bridge.rdf.sparql import construct_graph, select_rows
 from schema_bridge.rdf.shacl import ShaclConfig, validate_graph
-from schema_bridge.rdf.store import new_graph
+from schema_bridge.rdf.native import NativeGraph
+from schema_bridge.rdf.store import new_canonical_graph, new_graph
 
 __all__ = [
     "construct_dcat",
@@ -17,6 +18,7 @@ __all__ = [
     "export_formats",
     "load_raw_from_rows",
     "MappingConfig",
+    "NativeGraph",
     "RawMapping",
     "render_csv",
     "render_json",
@@ -25,5 +27,6 @@ __all__ = [
     "validate_graph",
     "write_csv",
     "write_json",
+    "new_canonical_graph",
     "new_graph",
 ]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
+import json
+import logging
+
+from rdflib import Graph
+
+from schema_bridge.rdf.mapping import (
+    MappingConfig,
+    _EmittedNodes,
+    _map_row,
+    _normalized_row,
+    _resolve_id_alias,
+    _subject_from_row,
+)
+from schema_bridge.rdf.native import NativeGraph, Term
+from schema_bridge.rdf.plan import (
+    DEFAULT_IRI_CACHE_SIZE,
+    FieldTerm,
+    MappingPlan,
+    compile_mapping,
+)
+from schema_bridge.rdf.store import (
+    DEFAULT_INSERT_BATCH_SIZE,
+    TripleBuffer,
+    buffered_triples,
+)
+from schema_bridge.rdf.terms import term_factory
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+else:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:  # optional: pip install pyarrow
+        pa = None
+        pc = None
+
+logger = logging.getLogger("schema_bridge.rdf.columnar")
+
+DEFAULT_BATCH_ROWS = 5_000
+_JSON_COLUMNS = b"schema_bridge.json_columns"
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError(
+            "Columnar mapping requires pyarrow; install it with `pip install pyarrow`"
+        )
+
+
+def _column_array(values: list[object]) -> pa.Array | None:
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    # Arrow widens mixed int/float columns to double, which would turn 1 into 1.0.
+    if pa.types.is_floating(array.type) and any(type(value) is int for value in values):
+        return None
+    return array
+
+
+def to_record_batch(rows: list[dict]) -> pa.RecordBatch:
+    require_pyarrow()
+    names: dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    arrays = []
+    json_columns = []
+    for name in names:
+        values: list[object] = [row.get(name) for row in rows]
+        array = _column_array(values)
+        if array is None:
+            # Columns Arrow cannot type consistently are carried as JSON text and
+            # decoded again on the dict path.
+            json_columns.append(name)
+            array = pa.array(
+                [None if value is None else json.dumps(value) for value in values],
+                type=pa.string(),
+            )
+        arrays.append(array)
+    metadata = {_JSON_COLUMNS: json.dumps(json_columns)} if json_columns else None
+    return pa.RecordBatch.from_arrays(arrays, names=list(names), metadata=metadata)
+
+
+def iter_record_batches(
+    rows: Iterable[dict], batch_rows: int = DEFAULT_BATCH_ROWS
+) -> Iterator[pa.RecordBatch]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, batch_rows)):
+        yield to_record_batch(chunk)
+
+
+def _json_columns(batch: pa.RecordBatch) -> set[str]:
+    metadata = batch.schema.metadata or {}
+    raw = metadata.get(_JSON_COLUMNS)
+    return set(json.loads(raw)) if raw else set()
+
+
+def _is_scalar_type(data_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_string(data_type)
+        or pa.types.is_large_string(data_type)
+        or pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_boolean(data_type)
+        or pa.types.is_null(data_type)
+    )
+
+
+def _is_vector_type(data_type: pa.DataType) -> bool:
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+        return _is_scalar_type(data_type.value_type)
+    return _is_scalar_type(data_type)
+
+
+def _dict_path_columns(plan: MappingPlan, mapping: MappingConfig) -> set[str]:
+    # Columns read by identifiers, field paths, concepts or nodes stay on the
+    # dict path together with every nested column.
+    names = {plan.id_field, *plan.id_aliases}
+    names.update(mapping.id_strategy.pid_fields)
+    names.update(mapping.id_strategy.fallback_fields)
+    for out_key, accessors in plan.field_paths:
+        names.add(out_key)
+        names.update(accessor.parts[0][0] for accessor in accessors)
+    names.update(concept.accessor.parts[0][0] for concept in plan.concepts)
+    names.update(node.accessor.parts[0][0] for node in plan.nodes)
+    return names
+
+
+def _add_column(
+    column: pa.Array,
+    term: FieldTerm,
+    subjects: list[Term],
+    sink: TripleBuffer,
+) -> int:
+    if pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+        parents = pc.list_parent_indices(column).to_pylist()  # type: ignore[attr-defined]
+        values = column.flatten()
+    else:
+        parents = range(len(column))
+        values = column
+    if pa.types.is_null(values.type):
+        return 0
+    # Repeated values are coerced into RDF terms once per batch.
+    encoded = values.dictionary_encode()
+    terms = [term.coerce(value) for value in encoded.dictionary.to_pylist()]
+    predicate = term.predicate
+    triples: list[tuple[Term, Term, Term]] = [
+        (subjects[parent], predicate, terms[index])
+        for parent, index in zip(parents, encoded.indices.to_pylist())
+        if index is not None
+    ]
+    sink.extend(triples)
+    return len(triples)
+
+
+def load_raw_from_batches(
+    batches: Iterable[pa.RecordBatch],
+    graph: Graph | NativeGraph,
+    mapping: MappingConfig,
+    *,
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    bnode_prefix: str | None = None,
+    iri_cache_size: int = DEFAULT_IRI_CACHE_SIZE,
+) -> None:
+    require_pyarrow()
+    plan = compile_mapping(
+        mapping, iri_cache_size=iri_cache_size, terms=term_factory(graph)
+    )
+    dict_path = _dict_path_columns(plan, mapping)
+    # Nested columns nothing reads are never converted back into Python objects.
+    keep_unmapped = plan.auto_nodes or not plan.drop_nested
+    emitted = _EmittedNodes()
+    count = 0
+    vectorized = 0
+    with buffered_triples(graph, batch_size, bnode_prefix) as sink:
+        for batch in batches:
+            json_columns = _json_columns(batch)
+            vector_names = [
+                column.name
+                for column in batch.schema
+                if column.name not in dict_path
+                and column.name not in json_columns
+                and _is_vector_type(column.type)
+            ]
+            row_names = [
+                name
+                for name in batch.schema.names
+                if name not in vector_names
+                and (keep_unmapped or name in dict_path or name in json_columns)
+            ]
+            rows = (
+                batch.select(row_names).to_pylist()
+                if row_names
+                else [{} for _ in range(batch.num_rows)]
+            )
+            subjects: list[Term] = []
+            for row in rows:
+                for name in json_columns:
+                    if row.get(name) is not None:
+                        row[name] = json.loads(row[name])
+                normalized = _resolve_id_alias(_normalized_row(row, plan), plan)
+                subject = _subject_from_row(normalized, mapping, plan.iris)
+                subjects.append(subject)
+                _map_row(subject, row, normalized, sink, plan, mapping, emitted)
+            for name in vector_names:
+                vectorized += _add_column(
+                    batch.column(name), plan.term(name), subjects, sink
+                )
+            count += batch.num_rows
+    logger.debug(
+        "Loaded %s row(s) for %s from record batches (%s column triple(s))",
+        count,
+        mapping.raw.entity_name,
+        vectorized,
+    )
+    logger.debug("Skipped %s redundant concept/node triple insert(s)", emitted.skipped)
+    plan.iris.log_stats(mapping.raw.entity_name)
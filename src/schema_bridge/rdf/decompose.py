@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import prod
+import re
+
+from rdflib.plugins.sparql.algebra import translateQuery
+from rdflib.plugins.sparql.parser import parseQuery
+
+_MASKED = re.compile(
+    r'"""[\s\S]*?"""'
+    r"|'''[\s\S]*?'''"
+    r'|"(?:[^"\\\n]|\\.)*"'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r"|<[^<>\"{}|^`\\\s]*>"
+    r"|#[^\n]*"
+)
+_VARIABLE = re.compile(r"[?$]([A-Za-z0-9_]+)")
+_CONSTRUCT = re.compile(r"\bCONSTRUCT\s*\{", re.IGNORECASE)
+_WHERE = re.compile(r"\s*(?:WHERE\s*)?\{", re.IGNORECASE)
+_OPTIONAL = re.compile(r"OPTIONAL\s*\{", re.IGNORECASE)
+_BIND = re.compile(r"BIND\s*\(", re.IGNORECASE)
+_FILTER = re.compile(r"FILTER\s*\(", re.IGNORECASE)
+_VALUES = re.compile(r"VALUES\s*(?:[?$]\w+|\([^)]*\))\s*\{", re.IGNORECASE)
+_BIND_TARGET = re.compile(r"\bAS\s+[?$]([A-Za-z0-9_]+)\s*\)\s*$", re.IGNORECASE)
+_KEYWORD = re.compile(
+    r"(?:OPTIONAL|BIND|FILTER|MINUS|VALUES|GRAPH|SERVICE|UNION|SELECT)\b",
+    re.IGNORECASE,
+)
+_TEMPLATE_TOKEN = re.compile(
+    r'(?P<term>"""[\s\S]*?"""(?:@[\w-]+|\^\^(?:<[^>]*>|[\w-]*:[\w.-]*))?'
+    r"|'''[\s\S]*?'''(?:@[\w-]+|\^\^(?:<[^>]*>|[\w-]*:[\w.-]*))?"
+    r'|"(?:[^"\\\n]|\\.)*"(?:@[\w-]+|\^\^(?:<[^>]*>|[\w-]*:[\w.-]*))?'
+    r"|'(?:[^'\\\n]|\\.)*'(?:@[\w-]+|\^\^(?:<[^>]*>|[\w-]*:[\w.-]*))?"
+    r"|<[^<>\"{}|^`\\\s]*>"
+    r"|[?$][A-Za-z0-9_]+"
+    r"|[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"
+    r"|[A-Za-z][\w-]*:(?:[\w-](?:[\w.-]*[\w-])?)?"
+    r"|:(?:[\w-](?:[\w.-]*[\w-])?)?"
+    r"|a\b|true\b|false\b)"
+    r"|(?P<punct>[;,.])"
+    r"|(?P<space>\s+|#[^\n]*)"
+    r"|(?P<other>\S)"
+)
+
+
+@dataclass
+class BindingCounts:
+    whole_bindings: int = 0
+    split_bindings: int = 0
+    whole_triples: int = 0
+    split_triples: int = 0
+
+
+@dataclass(frozen=True)
+class ConstructDecomposition:
+    queries: tuple[str, ...]
+    components: int
+    # Used to count intermediate bindings: the core patterns on their own and
+    # together with each independent OPTIONAL component.
+    prologue: str
+    core: tuple[str, ...]
+    key_variables: tuple[str, ...]
+    component_patterns: tuple[tuple[str, ...], ...]
+    query_components: tuple[frozenset[int], ...]
+    template_sizes: tuple[int, ...]
+
+    def count_queries(self) -> list[str]:
+        key = " ".join(f"?{name}" for name in self.key_variables)
+        queries = []
+        for patterns in ([], *self.component_patterns):
+            body = "\n".join([*self.core, *patterns])
+            queries.append(
+                f"{self.prologue}SELECT {key} (COUNT(*) AS ?n)\n"
+                f"WHERE {{\n{body}\n}}\nGROUP BY {key}\n"
+            )
+        return queries
+
+    def binding_counts(self, counts: list[dict[tuple[str, ...], int]]) -> BindingCounts:
+        core, per_component = counts[0], counts[1:]
+        result = BindingCounts()
+        # Each component is left-joined, so every core solution survives it at
+        # least once.
+        for key in core:
+            sizes = [max(1, component.get(key, 0)) for component in per_component]
+            whole = prod(sizes)
+            result.whole_bindings += whole
+            result.whole_triples += whole * sum(self.template_sizes)
+            for components, size in zip(self.query_components, self.template_sizes):
+                split = prod(sizes[index] for index in components)
+                result.split_bindings += split
+                result.split_triples += split * size
+        return result
+
+
+def _mask(text: str) -> str:
+    def blank(match: re.Match[str]) -> str:
+        value = match.group(0)
+        if value.startswith("#"):
+            return " " * len(value)
+        return value[0] + " " * (len(value) - 2) + value[-1]
+
+    return _MASKED.sub(blank, text)
+
+
+def _closing(masked: str, start: int) -> int:
+    pairs = {"{": "}", "(": ")", "[": "]"}
+    stack = [pairs[masked[start]]]
+    for index in range(start + 1, len(masked)):
+        char = masked[index]
+        if char in pairs:
+            stack.append(pairs[char])
+        elif char in ")}]":
+            if char != stack.pop():
+                raise ValueError("Unbalanced brackets in SPARQL query")
+            if not stack:
+                return index
+    raise ValueError("Unbalanced brackets in SPARQL query")
+
+
+def _triples_end(masked: str, start: int) -> int | None:
+    depth = 0
+    for index in range(start, len(masked)):
+        char = masked[index]
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char in "{}":
+            return None
+        elif depth == 0 and char == ".":
+            if index + 1 == len(masked) or masked[index + 1].isspace():
+                return index + 1
+        elif (
+            depth == 0
+            and char.isalpha()
+            and not (masked[index - 1].isalnum() or masked[index - 1] in "_:?$")
+            and _KEYWORD.match(masked, index)
+        ):
+            return index
+    return len(masked)
+
+
+def _split_body(text: str, masked: str) -> list[tuple[str, str, str]] | None:
+    elements = []
+    index = 0
+    while index < len(masked):
+        if masked[index].isspace():
+            index += 1
+            continue
+        for kind, pattern in (
+            ("optional", _OPTIONAL),
+            ("bind", _BIND),
+            ("filter", _FILTER),
+            ("triples", _VALUES),
+        ):
+            match = pattern.match(masked, index)
+            if match:
+                end = _closing(masked, match.end() - 1) + 1
+                break
+        else:
+            if _KEYWORD.match(masked, index) or masked[index] in "{}":
+                return None
+            kind = "triples"
+            found = _triples_end(masked, index)
+            if found is None or found == index:
+                return None
+            end = found
+        elements.append((kind, text[index:end], masked[index:end]))
+        index = end
+    return elements
+
+
+def _template_triples(template: str) -> list[tuple[str, str, str]] | None:
+    triples = []
+    terms: list[str] = []
+    subject = predicate = None
+    complete = False
+    for match in _TEMPLATE_TOKEN.finditer(template):
+        if match.group("space"):
+            continue
+        term = match.group("term")
+        if match.group("other") or (term or "").startswith("_:"):
+            return None
+        if term is not None:
+            if complete:
+                return None
+            terms.append(term)
+            if subject is None and len(terms) == 3:
+                subject, predicate = terms[0], terms[1]
+            elif subject is not None and predicate is None and len(terms) == 2:
+                predicate = terms[0]
+            elif subject is None or predicate is None:
+                continue
+            triples.append((subject, predicate, terms[-1]))
+            terms = []
+            complete = True
+            continue
+        punct = match.group("punct")
+        if not complete:
+            # ";" may close a predicate-object list right before "."
+            if punct == "." and subject is not None and predicate is None and not terms:
+                subject = None
+                continue
+            return None
+        complete = False
+        if punct == ".":
+            subject = predicate = None
+        elif punct == ";":
+            predicate = None
+    if terms:
+        return None
+    return triples
+
+
+def _variables(masked: str) -> frozenset[str]:
+    return frozenset(_VARIABLE.findall(masked))
+
+
+def _construct_query(
+    prologue: str, triples: list[tuple[str, str, str]], body: str
+) -> str:
+    template = "\n".join(f"  {s} {p} {o} ." for s, p, o in triples)
+    return f"{prologue}CONSTRUCT {{\n{template}\n}}\nWHERE {{\n{body}\n}}\n"
+
+
+def _split_construct(
+    query: str,
+) -> tuple[str, list[tuple[str, str, str]], list[tuple[str, str, str]]] | None:
+    masked = _mask(query)
+    construct = _CONSTRUCT.search(masked)
+    if construct is None:
+        return None
+    template_end = _closing(masked, construct.end() - 1)
+    where = _WHERE.match(masked, template_end + 1)
+    if where is None:
+        return None
+    body_end = _closing(masked, where.end() - 1)
+    if masked[body_end + 1 :].strip():
+        return None
+    triples = _template_triples(query[construct.end() : template_end])
+    elements = _split_body(
+        query[where.end() : body_end], masked[where.end() : body_end]
+    )
+    if triples is None or elements is None:
+        return None
+    return query[: construct.start()], triples, elements
+
+
+def _same_algebra(query: str, rebuilt: str) -> bool:
+    try:
+        expected = translateQuery(parseQuery(query)).algebra
+        actual = translateQuery(parseQuery(rebuilt)).algebra
+    except Exception:  # noqa: BLE001 - the store reports syntax errors itself
+        return False
+    return actual == expected
+
+
+@lru_cache(maxsize=64)
+def decompose_construct(query: str) -> ConstructDecomposition | None:
+    try:
+        split = _split_construct(query)
+    except ValueError:
+        return None
+    if split is None:
+        return None
+    prologue, triples, elements = split
+    # The textual split is only trusted when putting the pieces back together
+    # gives the algebra rdflib's SPARQL parser reads from the original query.
+    body = "\n".join(f"  {text.strip()}" for _, text, _ in elements)
+    if not _same_algebra(query, _construct_query(prologue, triples, body)):
+        return None
+
+    core_variables: set[str] = set()
+    key_variables: set[str] = set()
+    seen_optional: set[str] = set()
+    parts: list[tuple[str, frozenset[str], bool]] = []
+    filters: list[int] = []
+    for kind, text, masked_text in elements:
+        variables = _variables(masked_text)
+        core = False
+        if kind == "triples":
+            if variables & (seen_optional - core_variables):
+                return None
+            core_variables |= variables
+            key_variables |= variables
+            core = True
+        elif kind == "filter":
+            filters.append(len(parts))
+        elif kind == "bind":
+            target = _BIND_TARGET.search(masked_text)
+            if target is None:
+                return None
+            name = target.group(1)
+            if variables - {name} <= core_variables and name not in seen_optional:
+                core_variables.add(name)
+                core = True
+            else:
+                seen_optional |= variables
+        else:
+            seen_optional |= variables
+        parts.append((text, variables, core))
+    for index in filters:
+        text, variables, _ = parts[index]
+        parts[index] = (text, variables, variables <= core_variables)
+
+    # Non-core elements that share a variable must stay in the same sub-query.
+    units = [index for index, (_, _, core) in enumerate(parts) if not core]
+    parent = {index: index for index in units}
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    owner: dict[str, int] = {}
+    for index in units:
+        for name in parts[index][1] - core_variables:
+            if name in owner:
+                parent[find(index)] = find(owner[name])
+            else:
+                owner[name] = index
+    # A top-level FILTER on optional variables drops whole solutions, so its
+    # component is evaluated in every sub-query as part of the core.
+    pinned = {find(index) for index in units if index in filters}
+    for index in units:
+        if find(index) in pinned:
+            text, variables, _ = parts[index]
+            parts[index] = (text, variables, True)
+            key_variables |= variables
+    units = [index for index in units if find(index) not in pinned]
+    roots = sorted({find(index) for index in units})
+    component_of = {root: number for number, root in enumerate(roots)}
+    element_component = {index: component_of[find(index)] for index in units}
+    variable_component = {
+        name: element_component[index]
+        for name, index in owner.items()
+        if index in element_component
+    }
+
+    groups: dict[frozenset[int], list[tuple[str, str, str]]] = {}
+    for triple in triples:
+        needed = frozenset(
+            variable_component[name]
+            for term in triple
+            for name in _VARIABLE.findall(term)
+            if name in variable_component
+        )
+        groups.setdefault(needed, []).append(triple)
+    if len(groups) < 2:
+        return None
+
+    core = tuple(f"  {text.strip()}" for text, _, is_core in parts if is_core)
+    queries = []
+    for needed, group in groups.items():
+        body = "\n".join(
+            f"  {text.strip()}"
+            for index, (text, _, is_core) in enumerate(parts)
+            if is_core or element_component[index] in needed
+        )
+        queries.append(_construct_query(prologue, group, body))
+    return ConstructDecomposition(
+        queries=tuple(queries),
+        components=len(roots),
+        prologue=prologue,
+        core=core,
+        key_variables=tuple(sorted(key_variables)),
+        component_patterns=tuple(
+            tuple(
+                f"  {parts[index][0].strip()}"
+                for index in units
+                if element_component[index] == number
+            )
+            for number in range(len(roots))
+        ),
+        query_components=tuple(groups),
+        template_sizes=tuple(len(group) for group in groups.values()),
+    )
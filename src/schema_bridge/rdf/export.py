@@ -3,13 +3,17 @@ from __future__ import annotations
 import csv
 import io
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import IO, Callable, Iterable
 
 from rdflib import Graph
 
-from schema_bridge.resources.loader import load_text
+from schema_bridge.rdf.native import NativeGraph, as_rdflib
+from schema_bridge.rdf.queries import load_query
 from schema_bridge.rdf.sparql import select_rows as sparql_select_rows, construct_graph
+from schema_bridge.rdf.stream import stream_graph
 import logging
 
 logger = logging.getLogger("schema_bridge.rdf.export")
@@ -17,17 +21,14 @@ logger = logging.getLogger("schema_bridge.rdf.export")
 
 def construct_dcat(raw_graph: Graph) -> Graph:
     logger.debug("Running DCAT construct query")
-    query = load_text(
-        "profiles/dcat/sparql/construct.sparql",
-        "schema_bridge.resources",
-    )
-    result = raw_graph.query(query)
+    query = load_query("profiles/dcat/sparql/construct.sparql")
+    result = raw_graph.query(query.for_graph(raw_graph))
     if result.graph is None:
         raise RuntimeError("DCAT construct query did not return a graph")
     return result.graph
 
 
-def select_rows(raw_graph: Graph, query_path: str) -> list[dict]:
+def select_rows(raw_graph: Graph | NativeGraph, query_path: str) -> list[dict]:
     return sparql_select_rows(raw_graph, query_path)
 
 
@@ -85,13 +86,15 @@ def _normalize_export_format(value: str) -> str:
 
 
 def export_formats(
-    raw_graph: Graph,
+    raw_graph: Graph | NativeGraph,
     out_dir: Path | None,
     select_query: str | None,
     construct_query: str | None,
     targets: list[str],
     emit: Callable[[str], None] | None = None,
-) -> Graph | None:
+    decompose_construct: bool = False,
+    stream: IO[bytes] | None = None,
+) -> Graph | NativeGraph | None:
     targets_set = {
         _normalize_export_format(target) for target in targets if target.strip()
     }
@@ -101,6 +104,7 @@ def export_formats(
     if out_dir is not None:
         logger.debug("Writing outputs to %s", out_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
+    jobs: list[Callable[[], None]] = []
     if "json" in targets_set or "csv" in targets_set:
         if not select_query:
             raise ValueError("Select query is required for CSV/JSON outputs")
@@ -108,48 +112,91 @@ def export_formats(
         logger.debug("Selected %s row(s)", len(selected))
         if "json" in targets_set:
             payload = {"rows": selected}
-            _emit_or_write_text(
-                emit,
-                out_dir,
-                "resources.json",
-                render_json(payload),
+            jobs.append(
+                partial(
+                    _emit_or_write_text,
+                    emit,
+                    out_dir,
+                    "resources.json",
+                    render_json(payload),
+                )
             )
         if "csv" in targets_set:
-            _emit_or_write_text(
-                emit,
-                out_dir,
-                "resources.csv",
-                render_csv(selected),
+            jobs.append(
+                partial(
+                    _emit_or_write_text,
+                    emit,
+                    out_dir,
+                    "resources.csv",
+                    render_csv(selected),
+                )
             )
     construct = None
     rdf_targets = {"ttl", "jsonld", "rdfxml", "nt"} & targets_set
     if rdf_targets:
         if not construct_query:
             raise ValueError("Construct query is required for RDF outputs")
-        construct = construct_graph(raw_graph, construct_query)
+        construct = construct_graph(
+            raw_graph, construct_query, decompose=decompose_construct
+        )
         if construct is None:
             raise RuntimeError("Construct query did not return a graph")
-        if "ttl" in targets_set:
-            _emit_or_write_graph(emit, out_dir, "resources.ttl", construct, "turtle")
-        if "rdfxml" in targets_set:
-            _emit_or_write_graph(emit, out_dir, "resources.rdf", construct, "xml")
+        if rdf_targets - {"nt"}:
+            # Prefixed formats share one rdflib view of the CONSTRUCT result and
+            # are written in turn, since serializers bind prefixes on the graph.
+            prefixed = as_rdflib(construct)
+            jobs.append(
+                partial(_write_prefixed, emit, stream, out_dir, prefixed, rdf_targets)
+            )
         if "nt" in targets_set:
-            _emit_or_write_graph(emit, out_dir, "resources.nt", construct, "nt")
-    if "jsonld" in targets_set:
-        if construct is None:
-            raise ValueError("Construct query is required for JSON-LD outputs")
-        content = construct.serialize(
-            format="json-ld",
-            context=_namespace_context(construct),
+            jobs.append(
+                partial(
+                    _emit_or_write_graph,
+                    emit,
+                    stream,
+                    out_dir,
+                    "resources.nt",
+                    construct,
+                    "nt",
+                )
+            )
+    _run_jobs(jobs, parallel=out_dir is not None)
+    return construct
+
+
+def _run_jobs(jobs: list[Callable[[], None]], *, parallel: bool) -> None:
+    if not parallel or len(jobs) < 2:
+        for job in jobs:
+            job()
+        return
+    logger.debug("Writing %s output group(s) in parallel", len(jobs))
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        for future in [pool.submit(job) for job in jobs]:
+            future.result()
+
+
+def _write_prefixed(
+    emit: Callable[[str], None] | None,
+    stream: IO[bytes] | None,
+    out_dir: Path | None,
+    graph: Graph,
+    targets: set[str],
+) -> None:
+    if "ttl" in targets:
+        _emit_or_write_graph(emit, stream, out_dir, "resources.ttl", graph, "turtle")
+    if "rdfxml" in targets:
+        _emit_or_write_graph(emit, stream, out_dir, "resources.rdf", graph, "xml")
+    if "jsonld" in targets:
+        _emit_or_write_graph(
+            emit,
+            stream,
+            out_dir,
+            "resources.jsonld",
+            graph,
+            "json-ld",
+            context=_namespace_context(graph),
             auto_compact=True,
         )
-        if out_dir is None:
-            if emit is None:
-                raise ValueError("Stdout output requested but no emitter provided")
-            emit(content)
-        else:
-            (out_dir / "resources.jsonld").write_text(content, encoding="utf-8")
-    return construct
 
 
 def _namespace_context(graph: Graph) -> dict[str, str]:
@@ -162,17 +209,37 @@ def _namespace_context(graph: Graph) -> dict[str, str]:
 
 def _emit_or_write_graph(
     emit: Callable[[str], None] | None,
+    stream: IO[bytes] | None,
     out_dir: Path | None,
     filename: str,
-    graph: Graph,
+    graph: Graph | NativeGraph,
     rdf_format: str,
+    *,
+    context: dict[str, str] | None = None,
+    auto_compact: bool = False,
 ) -> None:
     if out_dir is None:
+        if stream is not None:
+            stream_graph(
+                graph, stream, rdf_format, context=context, auto_compact=auto_compact
+            )
+            return
         if emit is None:
             raise ValueError("Stdout output requested but no emitter provided")
-        emit(graph.serialize(format=rdf_format))
+        if context is None:
+            text = graph.serialize(format=rdf_format)
+        else:
+            text = graph.serialize(
+                format=rdf_format, context=context, auto_compact=auto_compact
+            )
+        if not isinstance(text, str):
+            raise RuntimeError(f"Serializing {rdf_format} did not return text")
+        emit(text)
         return
-    graph.serialize(out_dir / filename, format=rdf_format)
+    with (out_dir / filename).open("wb") as handle:
+        stream_graph(
+            graph, handle, rdf_format, context=context, auto_compact=auto_compact
+        )
 
 
 def _emit_or_write_text(
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+
+from rdflib import Graph
+import pyoxigraph as ox
+
+from schema_bridge.rdf.mapping import (
+    MappingConfig,
+    _EmittedNodes,
+    _map_row,
+    _normalized_row,
+    _resolve_id_alias,
+    _subject_from_row,
+)
+from schema_bridge.rdf.native import NativeGraph, Term, TermConverter
+from schema_bridge.rdf.oxigraph import graph_name, inner_store
+from schema_bridge.rdf.plan import MappingPlan, compile_mapping
+from schema_bridge.rdf.store import (
+    DEFAULT_INSERT_BATCH_SIZE,
+    TripleBuffer,
+    new_canonical_graph,
+)
+from schema_bridge.rdf.terms import OXIGRAPH_TERMS
+
+logger = logging.getLogger("schema_bridge.rdf.incremental")
+
+
+@dataclass(frozen=True)
+class PatchResult:
+    changed: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+class _RowTriples:
+    def __init__(self) -> None:
+        self.triples: list[tuple[Term, Term, Term]] = []
+
+    def addN(self, quads: Iterable[tuple[Term, Term, Term, object]]) -> None:
+        self.triples.extend(quad[:3] for quad in quads)
+
+
+def _subject_key(subject: Term) -> str:
+    return subject.value if isinstance(subject, ox.NamedNode) else str(subject)
+
+
+def _json_default(value: object) -> object:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def mapping_fingerprint(mapping: MappingConfig) -> str:
+    payload = json.dumps(asdict(mapping), sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def row_digest(row: dict, normalized: dict, plan: MappingPlan) -> str:
+    # Concept, node and auto-node mapping read the raw row, which may hold nested
+    # values that normalisation drops.
+    reads_raw = bool(plan.concepts or plan.nodes or plan.auto_nodes)
+    payload = [normalized, row] if reads_raw and normalized is not row else normalized
+    encoded = json.dumps(
+        payload, sort_keys=True, default=_json_default, separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def incremental_path(state_dir: Path, profile: str, endpoint: str) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", profile).strip("-") or "profile"
+    digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:12]
+    return state_dir / "canonical" / f"{slug}-{digest}"
+
+
+class IncrementalGraph:
+    # Each subject's triples live in a named graph of the same IRI, so a changed
+    # or deleted row is patched by dropping that graph.
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._store: ox.Store | None = ox.Store(str(directory / "store"))
+        self._index_path = directory / "index.json"
+        self.fingerprint: str | None = None
+        self.index: dict[str, str] = {}
+        if self._index_path.exists():
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            self.fingerprint = data.get("mapping")
+            self.index = dict(data.get("subjects") or {})
+
+    def __enter__(self) -> IncrementalGraph:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def store(self) -> ox.Store:
+        if self._store is None:
+            raise RuntimeError(f"Incremental graph is closed: {self.directory}")
+        return self._store
+
+    def patch(
+        self,
+        rows: Iterable[dict],
+        mapping: MappingConfig,
+        *,
+        detect_deletions: bool,
+        max_rows: int | None = None,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    ) -> PatchResult:
+        plan = compile_mapping(mapping, terms=OXIGRAPH_TERMS)
+        fingerprint = mapping_fingerprint(mapping)
+        rebuild = fingerprint != self.fingerprint
+        # A subject is described by all of its rows, so its digest chains every
+        # row digest. Rows are spooled to disk meanwhile, and only the changed
+        # subjects are mapped from the spool once every digest is complete.
+        digests: dict[str, str] = {}
+        row_count = 0
+        with tempfile.TemporaryFile(
+            "w+", encoding="utf-8", dir=self.directory
+        ) as spool:
+            for row in rows:
+                row_count += 1
+                normalized = _resolve_id_alias(_normalized_row(row, plan), plan)
+                key = _subject_key(_subject_from_row(normalized, mapping, plan.iris))
+                chained = digests.get(key, "") + row_digest(row, normalized, plan)
+                digests[key] = hashlib.sha256(chained.encode("ascii")).hexdigest()[:32]
+                spool.write(json.dumps(row, default=_json_default))
+                spool.write("\n")
+            if rebuild:
+                logger.info(
+                    "Mapping changed; rebuilding the incremental canonical graph"
+                )
+                self.index = {}
+            changed = [
+                key for key, digest in digests.items() if self.index.get(key) != digest
+            ]
+            if detect_deletions and max_rows is not None and row_count >= max_rows:
+                # A fetch cut short by the row limit says nothing about the rest.
+                logger.info("Row limit reached; skipping deletion detection")
+                detect_deletions = False
+            deleted: list[str] = []
+            if detect_deletions:
+                deleted = sorted(key for key in self.index if key not in digests)
+            # Touched subjects leave the saved index before the store changes,
+            # so an interrupted run re-patches them instead of trusting stale
+            # digests.
+            if rebuild or changed or deleted:
+                for key in (*changed, *deleted):
+                    self.index.pop(key, None)
+                self.fingerprint = fingerprint
+                self._save_index()
+            if rebuild:
+                self.store.clear()
+            if changed:
+                spool.seek(0)
+                self._map_changed(spool, set(changed), plan, mapping, batch_size)
+            for key in changed:
+                self.index[key] = digests[key]
+        for key in deleted:
+            self.store.remove_graph(ox.NamedNode(key))
+        unchanged = len(digests) - len(changed)
+        logger.info(
+            "Incremental run: %s changed or new, %s deleted, %s unchanged subject(s)",
+            len(changed),
+            len(deleted),
+            unchanged,
+        )
+        plan.iris.log_stats(mapping.raw.entity_name)
+        return PatchResult(changed=changed, deleted=deleted, unchanged=unchanged)
+
+    def _map_changed(
+        self,
+        spool: Iterable[str],
+        changed: set[str],
+        plan: MappingPlan,
+        mapping: MappingConfig,
+        batch_size: int,
+    ) -> None:
+        collector = _RowTriples()
+        sink = TripleBuffer(collector, terms=plan.terms)  # type: ignore[arg-type]
+        quad = TermConverter().quad
+        pending: list[ox.Quad] = []
+        cleared: set[str] = set()
+        for line in spool:
+            row = json.loads(line)
+            normalized = _resolve_id_alias(_normalized_row(row, plan), plan)
+            subject = _subject_from_row(normalized, mapping, plan.iris)
+            key = _subject_key(subject)
+            if key not in changed:
+                continue
+            name = ox.NamedNode(key)
+            if key not in cleared:
+                cleared.add(key)
+                self.store.remove_graph(name)
+            # Descriptions are kept per subject so dropping one graph never
+            # removes a concept or node another subject still points at.
+            _map_row(subject, row, normalized, sink, plan, mapping, _EmittedNodes())
+            sink.flush()
+            pending.extend(quad(s, p, o, name) for s, p, o in collector.triples)
+            collector.triples.clear()
+            if len(pending) >= batch_size:
+                self.store.bulk_extend(pending)
+                pending = []
+        if pending:
+            self.store.bulk_extend(pending)
+
+    def subjects_graph(
+        self, subjects: Iterable[str], backend: str = "native"
+    ) -> Graph | NativeGraph:
+        affected = new_canonical_graph(backend)
+        if isinstance(affected, NativeGraph):
+            store, context = affected.store, ox.DefaultGraph()
+        else:
+            store, context = inner_store(affected), graph_name(affected)
+            if store is None:
+                raise RuntimeError("Canonical rdflib graph is not backed by Oxigraph")
+        for key in subjects:
+            store.bulk_extend(
+                [
+                    ox.Quad(quad.subject, quad.predicate, quad.object, context)
+                    for quad in self.store.quads_for_pattern(
+                        None, None, None, ox.NamedNode(key)
+                    )
+                ]
+            )
+        return affected
+
+    def commit(self) -> None:
+        self.store.flush()
+        self._save_index()
+
+    def close(self) -> None:
+        # pyoxigraph releases the store's lock when the last reference goes.
+        self._store = None
+
+    def _save_index(self) -> None:
+        payload = {"mapping": self.fingerprint, "subjects": self.index}
+        tmp_path = self._index_path.with_name(f"{self._index_path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+        logger.debug(
+            "Saved incremental index with %s subject(s) to %s",
+            len(self.index),
+            self._index_path,
+        )
+
+
+def open_incremental_graph(
+    state_dir: Path, *, profile: str, endpoint: str
+) -> IncrementalGraph:
+    return IncrementalGraph(incremental_path(state_dir, profile, endpoint))
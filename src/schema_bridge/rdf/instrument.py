@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+
+
+@dataclass
+class FieldStats:
+    rows: int = 0
+    triples: int = 0
+    seconds: float = 0.0
+
+
+class MappingStats:
+    def __init__(self) -> None:
+        self.fields: dict[str, FieldStats] = {}
+        self.rows = 0
+
+    def record(
+        self, name: str, *, rows: int = 1, triples: int = 0, seconds: float = 0.0
+    ) -> None:
+        stats = self.fields.get(name)
+        if stats is None:
+            stats = self.fields[name] = FieldStats()
+        stats.rows += rows
+        stats.triples += triples
+        stats.seconds += seconds
+
+    def report(self) -> list[dict]:
+        total = sum(stats.seconds for stats in self.fields.values()) or 1e-9
+        entries = []
+        cumulative = 0.0
+        for name, stats in sorted(
+            self.fields.items(), key=lambda item: item[1].seconds, reverse=True
+        ):
+            cumulative += stats.seconds
+            entries.append(
+                {
+                    "name": name,
+                    "rows": stats.rows,
+                    "triples": stats.triples,
+                    "seconds": round(stats.seconds, 6),
+                    "share": round(stats.seconds / total, 4),
+                    "cumulative_share": round(cumulative / total, 4),
+                }
+            )
+        return entries
+
+    def to_json(self) -> str:
+        return json.dumps({"rows": self.rows, "fields": self.report()}, indent=2)
+
+    def render(self, limit: int = 20) -> str:
+        entries = self.report()
+        width = max([len("entry"), *(len(entry["name"]) for entry in entries[:limit])])
+        shown = min(limit, len(entries))
+        lines = [
+            f"Mapping cost for {self.rows} row(s), top {shown} of {len(entries)}:",
+            (
+                f"{'entry':<{width}}  {'rows':>8}  {'triples':>10}  {'seconds':>9}  "
+                f"{'share':>6}  {'cum.':>6}"
+            ),
+        ]
+        for entry in entries[:limit]:
+            lines.append(
+                f"{entry['name']:<{width}}  {entry['rows']:>8}  {entry['triples']:>10}  "
+                f"{entry['seconds']:>9.3f}  {entry['share']:>6.1%}  "
+                f"{entry['cumulative_share']:>6.1%}"
+            )
+        return "\n".join(lines) + "\n"
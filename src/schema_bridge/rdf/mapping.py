@@ -1,15 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, Mapping
+from time import perf_counter
+from typing import Callable, Iterable, Mapping
 from urllib.parse import quote
 
-from rdflib import Graph, Namespace, URIRef, Literal, BNode
-from rdflib.namespace import RDF, SKOS, OWL
+from rdflib import Graph, Namespace
+from schema_bridge.rdf.store import (
+    DEFAULT_INSERT_BATCH_SIZE,
+    TripleBuffer,
+    buffered_triples,
+)
+from schema_bridge.rdf.native import NativeGraph, Term
+from schema_bridge.rdf.instrument import MappingStats
+from schema_bridge.rdf.plan import (
+    DEFAULT_IRI_CACHE_SIZE,
+    ConceptPlan,
+    IriCache,
+    MappingPlan,
+    NodePlan,
+    PathAccessor,
+    compile_mapping,
+)
+from schema_bridge.rdf.terms import RDFLIB_TERMS, term_factory
 import logging
 
 logger = logging.getLogger("schema_bridge.rdf.mapping")
 
+DEFAULT_PROGRESS_ROWS = 10_000
+_EMITTED_INDEX_SIZE = 100_000
+
 EX = Namespace("https://catalogue.org/")
 FIELD = Namespace("https://catalogue.org/field/")
 ENTITY = Namespace("https://catalogue.org/entity/")
@@ -38,6 +58,7 @@ class MappingConfig:
     id_strategy: "IdStrategy" = field(default_factory=lambda: IdStrategy())
     concept_ns: str = "https://catalogue.org/concept/"
     drop_nested: bool = False
+    field_types: dict[str, "FieldType"] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, data: Mapping[str, object] | None) -> "MappingConfig":
@@ -70,6 +91,14 @@ class MappingConfig:
         for key, raw_cfg in (data.get("node_fields") or {}).items():  # type: ignore[union-attr]
             if isinstance(raw_cfg, dict):
                 node_fields[str(key)] = NodeField.from_dict(raw_cfg)
+        field_types = {}
+        for key, raw_cfg in (data.get("field_types") or {}).items():  # type: ignore[union-attr]
+            if any(char in str(key) for char in ".[]"):
+                raise ValueError(
+                    f"Field type keys name a field, not a path: {key!r} "
+                    "(map the path with field_paths first)"
+                )
+            field_types[str(key)] = FieldType.from_dict(raw_cfg)
         concept_ns = str(data.get("concept_ns", "https://catalogue.org/concept/"))
         drop_nested = bool(data.get("drop_nested", False))
         auto_nodes = bool(data.get("auto_nodes", True))
@@ -93,7 +122,43 @@ class MappingConfig:
             id_strategy=id_strategy,
             concept_ns=concept_ns,
             drop_nested=drop_nested,
+            field_types=field_types,
+        )
+
+
+@dataclass(frozen=True)
+class FieldType:
+    datatype: str | None = None
+    lang: str | None = None
+    iri: bool = False
+
+    @classmethod
+    def from_dict(cls, data: object) -> "FieldType":
+        if isinstance(data, str):
+            if data == "iri":
+                return cls(iri=True)
+            return cls(datatype=data)
+        if not isinstance(data, Mapping):
+            raise ValueError(f"Invalid field type: {data!r}")
+        field_type = cls(
+            datatype=_opt_str(data.get("datatype")),
+            lang=_opt_str(data.get("lang")),
+            iri=bool(data.get("iri", False)),
         )
+        if (
+            sum(
+                [
+                    field_type.datatype is not None,
+                    field_type.lang is not None,
+                    field_type.iri,
+                ]
+            )
+            > 1
+        ):
+            raise ValueError(
+                f"Field type must set only one of datatype, lang or iri: {data!r}"
+            )
+        return field_type
 
 
 @dataclass(frozen=True)
@@ -224,12 +289,6 @@ def _iter_values(value: object) -> Iterable[object]:
     return (value,)
 
 
-def _coerce_object(value: object, use_iri: bool) -> URIRef | Literal:
-    if use_iri:
-        return URIRef(str(value))
-    return Literal(value)
-
-
 def _opt_str(value: object | None) -> str | None:
     if value is None:
         return None
@@ -271,17 +330,31 @@ def _format_subject(
     path: str,
     value: str,
     normalize: NormalizeConfig,
-) -> URIRef:
+    iris: IriCache | None = None,
+) -> Term:
+    if iris is not None:
+        key = (template, base_uri, path, value, normalize)
+        cached = iris.get(key)
+        if cached is not None:
+            return cached
     normalized = _normalize_value(value, normalize) or value
     if normalize.url_encode:
         normalized = quote(normalized, safe="")
+    iri = iris.terms.iri if iris is not None else RDFLIB_TERMS.iri
     if template:
-        subject = template.format(base_uri=base_uri, path=path, id=normalized)
-        return URIRef(subject)
-    return URIRef(f"{base_uri}{path}/{normalized}")
+        subject = iri(template.format(base_uri=base_uri, path=path, id=normalized))
+    else:
+        subject = iri(f"{base_uri}{path}/{normalized}")
+    if iris is not None:
+        iris.put(key, subject)
+    return subject
 
 
-def _subject_from_row(row: Mapping[str, object], mapping: MappingConfig) -> URIRef:
+def _subject_from_row(
+    row: Mapping[str, object],
+    mapping: MappingConfig,
+    iris: IriCache | None = None,
+) -> Term:
     strategy = mapping.id_strategy
     if not strategy.pid_fields and not strategy.fallback_fields:
         raise ValueError(
@@ -300,49 +373,10 @@ def _subject_from_row(row: Mapping[str, object], mapping: MappingConfig) -> URIR
         path=mapping.raw.subject_path,
         value=chosen,
         normalize=strategy.normalize,
+        iris=iris,
     )
 
 
-def _parse_path(path: str) -> list[tuple[str, bool]]:
-    parts: list[tuple[str, bool]] = []
-    for raw in path.split("."):
-        if raw.endswith("[]"):
-            parts.append((raw[:-2], True))
-        else:
-            parts.append((raw, False))
-    return parts
-
-
-def _values_from_path(value: object, path: str) -> list[object]:
-    parts = _parse_path(path)
-
-    def walk(current: object, idx: int) -> list[object]:
-        if idx >= len(parts):
-            return [current]
-        key, is_list = parts[idx]
-        if isinstance(current, dict):
-            next_value = current.get(key)
-        else:
-            return []
-        if is_list:
-            if not isinstance(next_value, list):
-                return []
-            results: list[object] = []
-            for item in next_value:
-                results.extend(walk(item, idx + 1))
-            return results
-        return walk(next_value, idx + 1)
-
-    return [item for item in walk(value, 0) if item is not None]
-
-
-def _value_from_path(value: object, path: str) -> object | None:
-    values = _values_from_path(value, path)
-    if not values:
-        return None
-    return values[0]
-
-
 def _is_nested(value: object) -> bool:
     if isinstance(value, dict):
         return True
@@ -351,60 +385,86 @@ def _is_nested(value: object) -> bool:
     return False
 
 
-def _normalized_row(row: dict, mapping: MappingConfig) -> dict:
+def _merge_field_path(
+    normalized: dict, row: dict, out_key: str, accessors: tuple[PathAccessor, ...]
+) -> bool:
+    merged: list[object] = []
+    for accessor in accessors:
+        values = accessor.values(row)
+        if values:
+            merged.extend(values)
+    merged = [value for value in merged if not isinstance(value, (dict, list))]
+    if not merged:
+        return False
+    existing = normalized.get(out_key)
+    if existing is None:
+        if len(merged) == 1:
+            normalized[out_key] = merged[0]
+        else:
+            normalized[out_key] = merged
+    elif isinstance(existing, list):
+        normalized[out_key] = [*existing, *merged]
+    else:
+        normalized[out_key] = [existing, *merged]
+    return True
+
+
+def _normalized_row(
+    row: dict, plan: MappingPlan, stats: MappingStats | None = None
+) -> dict:
+    if not plan.field_paths:
+        if plan.drop_nested:
+            return {k: v for k, v in row.items() if not _is_nested(v)}
+        # Rows are only read from here on, so they are not copied.
+        return row
     normalized = dict(row)
-    for out_key, path_spec in mapping.field_paths.items():
-        paths = path_spec if isinstance(path_spec, list) else [path_spec]
-        merged: list[object] = []
-        for path in paths:
-            values = _values_from_path(row, path)
-            if values:
-                merged.extend(values)
-        merged = [value for value in merged if not isinstance(value, (dict, list))]
-        if not merged:
-            continue
-        existing = normalized.get(out_key)
-        if existing is None:
-            if len(merged) == 1:
-                normalized[out_key] = merged[0]
-            else:
-                normalized[out_key] = merged
+    for out_key, accessors in plan.field_paths:
+        if stats is None:
+            _merge_field_path(normalized, row, out_key, accessors)
             continue
-        if isinstance(existing, list):
-            existing.extend(merged)
-            normalized[out_key] = existing
-        else:
-            normalized[out_key] = [existing, *merged]
-    if mapping.drop_nested:
+        start = perf_counter()
+        hit = _merge_field_path(normalized, row, out_key, accessors)
+        stats.record(
+            f"field_paths.{out_key}",
+            rows=int(hit),
+            seconds=perf_counter() - start,
+        )
+    if plan.drop_nested:
         normalized = {k: v for k, v in normalized.items() if not _is_nested(v)}
     return normalized
 
 
-def _resolve_id_alias(normalized: dict, mapping: MappingConfig) -> dict:
-    if mapping.raw.id_field in normalized:
+def _resolve_id_alias(normalized: dict, plan: MappingPlan) -> dict:
+    if plan.id_field in normalized:
         return normalized
-    for key, alias in mapping.field_aliases.items():
-        if alias == mapping.raw.id_field and key in normalized:
-            normalized[mapping.raw.id_field] = normalized[key]
-            return normalized
+    for key in plan.id_aliases:
+        if key in normalized:
+            return {**normalized, plan.id_field: normalized[key]}
     return normalized
 
 
+def _cached_iri(value: str, iris: IriCache) -> Term:
+    key = (value,)
+    iri = iris.get(key)
+    if iri is None:
+        iri = iris.put(key, iris.terms.iri(value))
+    return iri
+
+
 def _concept_iri(
     *,
     value: object,
-    mapping: MappingConfig,
-    uri_path: str,
-    code_path: str,
-    label_path: str,
-) -> tuple[URIRef | BNode, str | None, str | None, str | None]:
+    plan: MappingPlan,
+    concept: ConceptPlan,
+    bnode: Callable[[], Term],
+) -> tuple[Term, str | None, str | None, str | None]:
     uri_value = None
     code_value = None
     label_value = None
     if isinstance(value, dict):
-        uri_value = _value_from_path(value, uri_path)
-        code_value = _value_from_path(value, code_path)
-        label_value = _value_from_path(value, label_path)
+        uri_value = concept.uri.first(value)
+        code_value = concept.code.first(value)
+        label_value = concept.label.first(value)
     elif isinstance(value, str):
         if value.startswith("http://") or value.startswith("https://"):
             uri_value = value
@@ -412,7 +472,7 @@ def _concept_iri(
             label_value = value
     if uri_value:
         return (
-            URIRef(str(uri_value)),
+            _cached_iri(str(uri_value), plan.iris),
             str(code_value) if code_value else None,
             str(label_value) if label_value else None,
             str(uri_value),
@@ -420,7 +480,7 @@ def _concept_iri(
     if code_value:
         code_str = str(code_value)
         return (
-            URIRef(f"{mapping.concept_ns}{quote(code_str, safe='')}"),
+            plan.iris.quoted(plan.concept_ns, code_str),
             code_str,
             str(label_value) if label_value else None,
             None,
@@ -428,72 +488,138 @@ def _concept_iri(
     if label_value:
         label_str = str(label_value)
         return (
-            URIRef(f"{mapping.concept_ns}{quote(label_str, safe='')}"),
+            plan.iris.quoted(plan.concept_ns, label_str),
             None,
             label_str,
             None,
         )
-    return BNode(), None, None, None
+    return bnode(), None, None, None
+
+
+class _EmittedNodes:
+    # Concepts and nodes shared by many rows are described once per run; the key
+    # carries the node content so differing descriptions are still all emitted.
+    # The index is reset when full, which only costs re-inserting a duplicate.
+    def __init__(self, limit: int = _EMITTED_INDEX_SIZE) -> None:
+        self.limit = limit
+        self._triples: dict[tuple[object, ...], int] = {}
+        self.skipped = 0
+
+    def seen(self, key: tuple[object, ...]) -> bool:
+        count = self._triples.get(key)
+        if count is None:
+            return False
+        self.skipped += count
+        return True
+
+    def emit(
+        self,
+        key: tuple[object, ...] | None,
+        triples: list[tuple[Term, Term, Term]],
+        sink: TripleBuffer,
+    ) -> None:
+        if key is not None:
+            if len(self._triples) >= self.limit:
+                self._triples.clear()
+            self._triples[key] = len(triples)
+        sink.extend(triples)
 
 
 def _add_concepts(
-    subject: URIRef, row: dict, graph: Graph, mapping: MappingConfig
+    subject: Term,
+    row: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    emitted: _EmittedNodes,
 ) -> None:
-    for key, cfg in mapping.concept_fields.items():
-        if not cfg.path:
-            continue
-        predicate_name = cfg.predicate or mapping.field_aliases.get(key, key)
-        predicate = URIRef(f"{mapping.raw.field_ns}{predicate_name}")
-        for item in _values_from_path(row, cfg.path):
-            concept, code, label, uri_value = _concept_iri(
-                value=item,
-                mapping=mapping,
-                uri_path=cfg.uri_path,
-                code_path=cfg.code_path,
-                label_path=cfg.label_path,
+    for concept_plan in plan.concepts:
+        _add_concept(subject, row, sink, plan, concept_plan, emitted)
+
+
+def _add_concept(
+    subject: Term,
+    row: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    concept_plan: ConceptPlan,
+    emitted: _EmittedNodes,
+) -> bool:
+    items = concept_plan.accessor.values(row)
+    for item in items:
+        concept, code, label, uri_value = _concept_iri(
+            value=item, plan=plan, concept=concept_plan, bnode=sink.bnode
+        )
+        sink.add((subject, concept_plan.predicate, concept))
+        terms = plan.terms
+        key = None
+        if terms.is_iri(concept):
+            key = ("concept", concept, code, label, uri_value, concept_plan.lang)
+            if emitted.seen(key):
+                continue
+        described: list[tuple[Term, Term, Term]] = [
+            (concept, terms.rdf_type, terms.skos_concept)
+        ]
+        if label:
+            described.append(
+                (
+                    concept,
+                    terms.skos_pref_label,
+                    terms.tagged(label, concept_plan.lang),
+                )
             )
-            graph.add((subject, predicate, concept))
-            graph.add((concept, RDF.type, SKOS.Concept))
-            if label:
-                graph.add((concept, SKOS.prefLabel, Literal(label, lang=cfg.lang)))
-            if code:
-                graph.add((concept, SKOS.notation, Literal(code)))
-            if uri_value and str(concept) != uri_value:
-                graph.add((concept, OWL.sameAs, URIRef(uri_value)))
+        if code:
+            described.append((concept, terms.skos_notation, terms.literal(code)))
+        if uri_value and concept != (same_as := terms.iri(uri_value)):
+            described.append((concept, terms.owl_same_as, same_as))
+        emitted.emit(key, described, sink)
+
+    return bool(items)
 
 
 def _add_nodes(
-    subject: URIRef, row: dict, graph: Graph, mapping: MappingConfig
+    subject: Term,
+    row: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    emitted: _EmittedNodes,
 ) -> None:
-    for cfg in mapping.node_fields.values():
-        if not cfg.path or not cfg.predicate or not cfg.subject_path:
+    for node_plan in plan.nodes:
+        _add_node(subject, row, sink, node_plan, emitted)
+
+
+def _add_node(
+    subject: Term,
+    row: dict,
+    sink: TripleBuffer,
+    node_plan: NodePlan,
+    emitted: _EmittedNodes,
+) -> bool:
+    items = node_plan.accessor.values(row)
+    for item in items:
+        if not isinstance(item, dict):
             continue
-        predicate = URIRef(f"{mapping.raw.field_ns}{cfg.predicate}")
-        for item in _values_from_path(row, cfg.path):
-            if not isinstance(item, dict):
-                continue
-            node_id = _value_from_path(item, cfg.id_field)
-            if node_id is None:
+        node_id = node_plan.id_accessor.first(item)
+        if node_id is None:
+            continue
+        node = node_plan.iris.quoted(node_plan.subject_prefix, str(node_id))
+        sink.add((subject, node_plan.predicate, node))
+        key = ("node", node, node_plan.predicate, repr(item))
+        if emitted.seen(key):
+            continue
+        described: list[tuple[Term, Term, Term]] = []
+        if node_plan.type_iri is not None:
+            described.append((node, node_plan.iris.terms.rdf_type, node_plan.type_iri))
+        for item_key, value in item.items():
+            term = node_plan.term(item_key)
+            if term is None:
                 continue
-            node = URIRef(
-                f"{mapping.raw.base_uri}{cfg.subject_path}/{quote(str(node_id), safe='')}"
-            )
-            graph.add((subject, predicate, node))
-            if cfg.type_iri:
-                graph.add((node, RDF.type, URIRef(cfg.type_iri)))
-            for key, value in item.items():
-                if cfg.fields:
-                    if key not in cfg.fields:
-                        continue
-                    mapped_key = cfg.fields[key]
-                else:
-                    mapped_key = key
-                pred = URIRef(f"{mapping.raw.field_ns}{mapped_key}")
-                use_iri = mapped_key in cfg.iri_fields
-                for item_value in _iter_values(value):
-                    if item_value is None:
-                        continue
-                    graph.add((node, pred, _coerce_object(item_value, use_iri)))
+            for item_value in _iter_values(value):
+                if item_value is None:
+                    continue
+                described.append((node, term.predicate, term.coerce(item_value)))
+        emitted.emit(key, described, sink)
+
+    return bool(items)
 
 
 def _auto_node_subject(
@@ -501,69 +627,237 @@ def _auto_node_subject(
     path: str,
     item: Mapping[str, object],
     mapping: MappingConfig,
-) -> URIRef | BNode:
+    bnode: Callable[[], Term],
+    iris: IriCache | None = None,
+) -> Term:
     node_id = _select_id_value(item, mapping.node_defaults.id_fields)
     if not node_id:
-        return BNode()
+        return bnode()
     return _format_subject(
         template=mapping.node_defaults.subject_template,
         base_uri=mapping.raw.base_uri,
         path=path,
         value=node_id,
         normalize=mapping.node_defaults.normalize,
+        iris=iris,
     )
 
 
 def _add_auto_nodes(
-    subject: URIRef, row: dict, graph: Graph, mapping: MappingConfig
+    subject: Term,
+    row: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    mapping: MappingConfig,
+    emitted: _EmittedNodes,
 ) -> None:
-    if not mapping.auto_nodes:
+    if not plan.auto_nodes:
         return
     for key, value in row.items():
-        if isinstance(value, dict):
-            items = [value]
-        elif isinstance(value, list) and any(isinstance(item, dict) for item in value):
-            items = [item for item in value if isinstance(item, dict)]
+        items = _auto_node_items(value)
+        if items:
+            _add_auto_node(subject, key, items, sink, plan, mapping, emitted)
+
+
+def _auto_node_items(value: object) -> list[dict]:
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+def _add_auto_node(
+    subject: Term,
+    key: str,
+    items: list[dict],
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    mapping: MappingConfig,
+    emitted: _EmittedNodes,
+) -> None:
+    predicate = plan.term(key).predicate
+    for item in items:
+        node = _auto_node_subject(
+            path=key, item=item, mapping=mapping, bnode=sink.bnode, iris=plan.iris
+        )
+        sink.add((subject, predicate, node))
+        emit_key = None
+        if plan.terms.is_iri(node):
+            emit_key = ("auto", node, repr(item))
+            if emitted.seen(emit_key):
+                continue
+        described: list[tuple[Term, Term, Term]] = []
+        for item_key, item_value in item.items():
+            pred = plan.predicate(item_key)
+            coerce = plan.field_types.get(item_key, plan.terms.literal)
+            for item_val in _iter_values(item_value):
+                if item_val is None:
+                    continue
+                described.append((node, pred, coerce(item_val)))
+        emitted.emit(emit_key, described, sink)
+
+
+def _map_row(
+    subject: Term,
+    row: dict,
+    normalized: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    mapping: MappingConfig,
+    emitted: _EmittedNodes,
+) -> None:
+    sink.add((subject, plan.terms.rdf_type, plan.entity_type))
+    for key, value in normalized.items():
+        term = plan.term(key)
+        for item in _iter_values(value):
+            if item is None:
+                continue
+            sink.add((subject, term.predicate, term.coerce(item)))
+    if plan.concepts:
+        _add_concepts(subject, row, sink, plan, emitted)
+    if plan.nodes:
+        _add_nodes(subject, row, sink, plan, emitted)
+    if plan.auto_nodes:
+        _add_auto_nodes(subject, row, sink, plan, mapping, emitted)
+
+
+def _record(
+    stats: MappingStats,
+    sink: TripleBuffer,
+    name: str,
+    mark: tuple[float, int, float],
+    rows: int = 1,
+) -> None:
+    start, added, flush_seconds = mark
+    # Store inserts triggered mid-entry are not charged to the entry.
+    stats.record(
+        name,
+        rows=rows,
+        triples=sink.added - added,
+        seconds=perf_counter() - start - (sink.flush_seconds - flush_seconds),
+    )
+
+
+def _mark(sink: TripleBuffer) -> tuple[float, int, float]:
+    return perf_counter(), sink.added, sink.flush_seconds
+
+
+def _map_row_instrumented(
+    row: dict,
+    sink: TripleBuffer,
+    plan: MappingPlan,
+    mapping: MappingConfig,
+    emitted: _EmittedNodes,
+    stats: MappingStats,
+) -> None:
+    stats.rows += 1
+    normalized = _normalized_row(row, plan, stats)
+    mark = _mark(sink)
+    normalized = _resolve_id_alias(normalized, plan)
+    subject = _subject_from_row(normalized, mapping, plan.iris)
+    sink.add((subject, plan.terms.rdf_type, plan.entity_type))
+    _record(stats, sink, "subject", mark)
+    path_keys = {out_key for out_key, _ in plan.field_paths}
+    for key, value in normalized.items():
+        mark = _mark(sink)
+        term = plan.term(key)
+        for item in _iter_values(value):
+            if item is None:
+                continue
+            sink.add((subject, term.predicate, term.coerce(item)))
+        if key in path_keys:
+            _record(stats, sink, f"field_paths.{key}", mark, rows=0)
         else:
-            continue
-        predicate_name = mapping.field_aliases.get(key, key)
-        predicate = URIRef(f"{mapping.raw.field_ns}{predicate_name}")
-        for item in items:
-            node = _auto_node_subject(path=key, item=item, mapping=mapping)
-            graph.add((subject, predicate, node))
-            for item_key, item_value in item.items():
-                pred = URIRef(f"{mapping.raw.field_ns}{item_key}")
-                for item_val in _iter_values(item_value):
-                    if item_val is None:
-                        continue
-                    graph.add((node, pred, _coerce_object(item_val, False)))
+            _record(stats, sink, f"fields.{key}", mark)
+    for concept_plan in plan.concepts:
+        mark = _mark(sink)
+        hit = _add_concept(subject, row, sink, plan, concept_plan, emitted)
+        _record(stats, sink, f"concept_fields.{concept_plan.name}", mark, int(hit))
+    for node_plan in plan.nodes:
+        mark = _mark(sink)
+        hit = _add_node(subject, row, sink, node_plan, emitted)
+        _record(stats, sink, f"node_fields.{node_plan.name}", mark, int(hit))
+    if plan.auto_nodes:
+        for key, value in row.items():
+            mark = _mark(sink)
+            items = _auto_node_items(value)
+            if items:
+                _add_auto_node(subject, key, items, sink, plan, mapping, emitted)
+                _record(stats, sink, f"auto_nodes.{key}", mark)
 
 
 def load_raw_from_rows(
-    rows: Iterable[dict], graph: Graph, mapping: MappingConfig
+    rows: Iterable[dict],
+    graph: Graph | NativeGraph,
+    mapping: MappingConfig,
+    *,
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    workers: int = 1,
+    bnode_prefix: str | None = None,
+    progress_every: int = DEFAULT_PROGRESS_ROWS,
+    stats: MappingStats | None = None,
+    columnar: bool = False,
+    iri_cache_size: int = DEFAULT_IRI_CACHE_SIZE,
 ) -> None:
-    rows_list = list(rows)
+    if columnar and stats is not None:
+        logger.warning("Mapping instrumentation maps rows as dicts; ignoring columnar")
+    elif columnar:
+        from schema_bridge.rdf.columnar import (
+            iter_record_batches,
+            load_raw_from_batches,
+        )
+
+        if workers > 1:
+            logger.warning("Columnar mapping runs in-process; ignoring workers")
+        load_raw_from_batches(
+            iter_record_batches(rows),
+            graph,
+            mapping,
+            batch_size=batch_size,
+            bnode_prefix=bnode_prefix,
+            iri_cache_size=iri_cache_size,
+        )
+        return
+    if workers > 1 and stats is not None:
+        logger.warning("Mapping instrumentation runs in-process; ignoring workers")
+    elif workers > 1:
+        from schema_bridge.rdf.parallel import load_rows_parallel
+
+        load_rows_parallel(
+            rows,
+            graph,
+            mapping,
+            workers=workers,
+            batch_size=batch_size,
+            bnode_prefix=bnode_prefix,
+            iri_cache_size=iri_cache_size,
+        )
+        return
+    logger.debug("Loading rows into RDF graph for %s", mapping.raw.entity_name)
+    plan = compile_mapping(
+        mapping, iri_cache_size=iri_cache_size, terms=term_factory(graph)
+    )
+    emitted = _EmittedNodes()
+    count = 0
+    with buffered_triples(graph, batch_size, bnode_prefix) as sink:
+        for row in rows:
+            count += 1
+            if count % progress_every == 0:
+                logger.info(
+                    "Mapped %s row(s) for %s (%s triple(s) inserted)",
+                    count,
+                    mapping.raw.entity_name,
+                    sink.flushed,
+                )
+            if stats is not None:
+                _map_row_instrumented(row, sink, plan, mapping, emitted, stats)
+                continue
+            normalized = _resolve_id_alias(_normalized_row(row, plan), plan)
+            subject = _subject_from_row(normalized, mapping, plan.iris)
+            _map_row(subject, row, normalized, sink, plan, mapping, emitted)
     logger.debug(
-        "Loading %s row(s) into RDF graph for %s",
-        len(rows_list),
-        mapping.raw.entity_name,
+        "Loaded %s row(s) into RDF graph for %s", count, mapping.raw.entity_name
     )
-    entity_type = URIRef(f"{mapping.raw.entity_ns}{mapping.raw.entity_name}")
-    for row in rows_list:
-        normalized = _resolve_id_alias(_normalized_row(row, mapping), mapping)
-        subject = _subject_from_row(normalized, mapping)
-        graph.add((subject, RDF.type, entity_type))
-        for key, value in normalized.items():
-            mapped_key = mapping.field_aliases.get(key, key)
-            predicate = URIRef(f"{mapping.raw.field_ns}{mapped_key}")
-            use_iri = mapped_key in mapping.iri_fields
-            for item in _iter_values(value):
-                if item is None:
-                    continue
-                graph.add((subject, predicate, _coerce_object(item, use_iri)))
-        if mapping.concept_fields:
-            _add_concepts(subject, row, graph, mapping)
-        if mapping.node_fields:
-            _add_nodes(subject, row, graph, mapping)
-        if mapping.auto_nodes:
-            _add_auto_nodes(subject, row, graph, mapping)
+    logger.debug("Skipped %s redundant concept/node triple insert(s)", emitted.skipped)
+    plan.iris.log_stats(mapping.raw.entity_name)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Any, Iterable
+import io
+import logging
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+import pyoxigraph as ox
+
+from schema_bridge.rdf.oxigraph import OxGraphName, from_ox
+
+logger = logging.getLogger("schema_bridge.rdf.native")
+
+_NAMED_NODE_CACHE_SIZE = 100_000
+NTRIPLES = "application/n-triples"
+_NATIVE_FORMATS = {"nt": NTRIPLES, "ntriples": NTRIPLES, "nt11": NTRIPLES}
+
+OxTerm = ox.NamedNode | ox.BlankNode | ox.Literal
+Term = Node | OxTerm
+
+
+class TermConverter:
+    def __init__(self) -> None:
+        self._named: dict[URIRef, ox.NamedNode] = {}
+
+    def _named_node(self, term: URIRef) -> ox.NamedNode:
+        named = self._named.get(term)
+        if named is None:
+            if len(self._named) >= _NAMED_NODE_CACHE_SIZE:
+                self._named.clear()
+            named = self._named[term] = ox.NamedNode(term)
+        return named
+
+    def __call__(self, term: Term) -> OxTerm:
+        # Terms from the pyoxigraph term factory pass through unchanged.
+        if isinstance(term, (ox.NamedNode, ox.BlankNode, ox.Literal)):
+            return term
+        if isinstance(term, URIRef):
+            return self._named_node(term)
+        if isinstance(term, BNode):
+            return ox.BlankNode(term)
+        if isinstance(term, Literal):
+            return ox.Literal(
+                term,
+                language=term.language,
+                datatype=self._named_node(term.datatype) if term.datatype else None,
+            )
+        raise ValueError(f"Unexpected RDF term: {term!r}")
+
+    def subject(self, term: Term) -> ox.NamedNode | ox.BlankNode:
+        if isinstance(term, (ox.NamedNode, ox.BlankNode)):
+            return term
+        if isinstance(term, URIRef):
+            return self._named_node(term)
+        if isinstance(term, BNode):
+            return ox.BlankNode(term)
+        raise ValueError(f"Unexpected RDF subject: {term!r}")
+
+    def predicate(self, term: Term) -> ox.NamedNode:
+        if isinstance(term, ox.NamedNode):
+            return term
+        if isinstance(term, URIRef):
+            return self._named_node(term)
+        raise ValueError(f"Unexpected RDF predicate: {term!r}")
+
+    def triple(self, s: Term, p: Term, o: Term) -> ox.Triple:
+        return ox.Triple(self.subject(s), self.predicate(p), self(o))
+
+    def quad(
+        self, s: Term, p: Term, o: Term, graph_name: OxGraphName | None = None
+    ) -> ox.Quad:
+        return ox.Quad(self.subject(s), self.predicate(p), self(o), graph_name)
+
+
+class NativeGraph:
+    def __init__(self, store: ox.Store | None = None) -> None:
+        self.store = store if store is not None else ox.Store()
+        self.convert = TermConverter()
+        self._rdflib: Graph | None = None
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def add(self, triple: tuple[Term, Term, Term]) -> None:
+        self.extend([triple])
+
+    def extend(
+        self,
+        triples: Iterable[tuple[Term, Term, Term]],
+        graph_name: ox.NamedNode | None = None,
+    ) -> None:
+        quad = self.convert.quad
+        self.store.bulk_extend([quad(s, p, o, graph_name) for s, p, o in triples])
+        self._rdflib = None
+
+    def load_ntriples(self, data: bytes) -> None:
+        self.store.bulk_load(io.BytesIO(data), NTRIPLES)
+        self._rdflib = None
+
+    def select_rows(self, query: str) -> list[dict]:
+        result = self.store.query(query)
+        if isinstance(result, ox.QuerySolutions):
+            names = [variable.value for variable in result.variables]
+            return [
+                {
+                    name: value.value
+                    for name, value in zip(names, solution)
+                    if value is not None
+                }
+                for solution in result
+            ]
+        raise RuntimeError("SELECT query did not return solutions")
+
+    def construct(self, query: str, into: NativeGraph | None = None) -> NativeGraph:
+        result = self.store.query(query)
+        if isinstance(result, ox.QueryTriples):
+            # Opening a store is costly, so several results can share one.
+            graph = into if into is not None else NativeGraph()
+            graph._rdflib = None
+            graph.store.bulk_extend(
+                [
+                    ox.Quad(triple.subject, triple.predicate, triple.object)
+                    for triple in result
+                ]
+            )
+            return graph
+        raise RuntimeError("CONSTRUCT query did not return a graph")
+
+    def to_rdflib(self) -> Graph:
+        if self._rdflib is None:
+            graph = Graph()
+            graph.addN(
+                (
+                    from_ox(quad.subject),
+                    from_ox(quad.predicate),
+                    from_ox(quad.object),
+                    graph,
+                )
+                for quad in self.store
+            )
+            logger.debug("Converted %s native triple(s) to rdflib", len(graph))
+            self._rdflib = graph
+        return self._rdflib
+
+    def serialize(
+        self,
+        destination: str | Path | IO[bytes] | None = None,
+        format: str = "turtle",
+        **kwargs: Any,
+    ) -> str | bytes | None:
+        mime_type = _NATIVE_FORMATS.get(format)
+        if mime_type is None or kwargs:
+            # Prefixes, JSON-LD contexts and RDF/XML layout come from rdflib.
+            result = self.to_rdflib().serialize(destination, format=format, **kwargs)
+            return None if isinstance(result, Graph) else result
+        if destination is None:
+            output = io.BytesIO()
+            self.store.dump(output, mime_type, from_graph=ox.DefaultGraph())
+            return output.getvalue().decode("utf-8")
+        if isinstance(destination, Path):
+            destination = str(destination)
+        self.store.dump(destination, mime_type, from_graph=ox.DefaultGraph())
+        return None
+
+
+def as_rdflib(graph: Graph | NativeGraph) -> Graph:
+    if isinstance(graph, NativeGraph):
+        return graph.to_rdflib()
+    return graph
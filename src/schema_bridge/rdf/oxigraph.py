@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import cast
+
+# oxrdflib has no public API for its pyoxigraph store or its term conversions.
+# Every use of those private helpers goes through this module so an oxrdflib
+# upgrade only needs checking here.
+from oxrdflib import OxigraphStore, _from_ox, _to_ox
+from rdflib import Graph
+from rdflib.term import Node
+import pyoxigraph as ox
+
+OxGraphName = ox.NamedNode | ox.BlankNode | ox.DefaultGraph
+
+
+def inner_store(graph: Graph) -> ox.Store | None:
+    store = graph.store
+    if isinstance(store, OxigraphStore):
+        return store._inner
+    return None
+
+
+def graph_name(graph: Graph) -> OxGraphName:
+    name = _to_ox(graph)
+    if isinstance(name, (ox.NamedNode, ox.BlankNode, ox.DefaultGraph)):
+        return name
+    raise ValueError(f"Unexpected graph identifier: {graph.identifier!r}")
+
+
+def from_ox(term: ox.NamedNode | ox.BlankNode | ox.Literal | ox.Triple) -> Node:
+    return cast(Node, _from_ox(term))
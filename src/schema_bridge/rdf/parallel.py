@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+import io
+import logging
+import uuid
+
+from rdflib import Graph
+from rdflib.term import Node
+import pyoxigraph as ox
+
+from schema_bridge.rdf.mapping import MappingConfig, load_raw_from_rows
+from schema_bridge.rdf.native import NTRIPLES, NativeGraph, TermConverter
+from schema_bridge.rdf.plan import DEFAULT_IRI_CACHE_SIZE
+from schema_bridge.rdf.store import DEFAULT_INSERT_BATCH_SIZE, load_ntriples
+
+logger = logging.getLogger("schema_bridge.rdf.parallel")
+
+DEFAULT_CHUNK_ROWS = 1_000
+
+_worker_mapping: MappingConfig | None = None
+
+
+class _NTriplesChunk:
+    def __init__(self) -> None:
+        self.output = io.BytesIO()
+        self._convert = TermConverter()
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, object]]) -> None:
+        triple = self._convert.triple
+        ox.serialize(
+            [triple(s, p, o) for s, p, o, _ in quads],
+            self.output,
+            NTRIPLES,
+        )
+
+
+def _init_worker(mapping: MappingConfig) -> None:
+    global _worker_mapping
+    _worker_mapping = mapping
+
+
+def _map_chunk(
+    bnode_prefix: str, batch_size: int, iri_cache_size: int, rows: list[dict]
+) -> bytes:
+    if _worker_mapping is None:
+        raise RuntimeError("Mapping worker was not initialised")
+    chunk = _NTriplesChunk()
+    load_raw_from_rows(
+        rows,
+        chunk,  # type: ignore[arg-type]
+        _worker_mapping,
+        batch_size=batch_size,
+        bnode_prefix=bnode_prefix,
+        iri_cache_size=iri_cache_size,
+    )
+    return chunk.output.getvalue()
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def load_rows_parallel(
+    rows: Iterable[dict],
+    graph: Graph | NativeGraph,
+    mapping: MappingConfig,
+    *,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    bnode_prefix: str | None = None,
+    iri_cache_size: int = DEFAULT_IRI_CACHE_SIZE,
+) -> None:
+    # Every shard mints its own blank node labels so merged shards never collide.
+    run = bnode_prefix if bnode_prefix is not None else uuid.uuid4().hex[:8]
+    count = 0
+    shards = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(mapping,)
+    ) as pool:
+        pending: deque[Future[bytes]] = deque()
+        for index, chunk in enumerate(_chunks(rows, chunk_size)):
+            count += len(chunk)
+            shards += 1
+            pending.append(
+                pool.submit(
+                    _map_chunk,
+                    f"{run}s{index}b",
+                    batch_size,
+                    iri_cache_size,
+                    chunk,
+                )
+            )
+            if len(pending) >= workers * 2:
+                load_ntriples(graph, pending.popleft().result())
+        while pending:
+            load_ntriples(graph, pending.popleft().result())
+    logger.debug(
+        "Loaded %s row(s) for %s in %s shard(s) across %s worker(s)",
+        count,
+        mapping.raw.entity_name,
+        shards,
+        workers,
+    )
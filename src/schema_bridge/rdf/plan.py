@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Mapping
+from urllib.parse import quote
+import logging
+
+from rdflib.namespace import RDF, XSD
+
+from schema_bridge.rdf.native import Term
+from schema_bridge.rdf.terms import RDFLIB_TERMS, TermFactory
+
+if TYPE_CHECKING:
+    from schema_bridge.rdf.mapping import FieldType, MappingConfig
+
+logger = logging.getLogger("schema_bridge.rdf.plan")
+
+DEFAULT_IRI_CACHE_SIZE = 65_536
+
+PathPart = tuple[str, bool]
+Coercer = Callable[[object], Term]
+
+
+@lru_cache(maxsize=1024)
+def parse_path(path: str) -> tuple[PathPart, ...]:
+    parts: list[PathPart] = []
+    for raw in path.split("."):
+        if raw.endswith("[]"):
+            parts.append((raw[:-2], True))
+        else:
+            parts.append((raw, False))
+    return tuple(parts)
+
+
+_DATATYPE_PREFIXES = {"xsd": str(XSD), "rdf": str(RDF)}
+
+
+def _lexical(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _datatype_iri(name: str) -> str:
+    prefix, sep, local = name.partition(":")
+    if sep and prefix in _DATATYPE_PREFIXES:
+        return f"{_DATATYPE_PREFIXES[prefix]}{local}"
+    if not sep:
+        raise ValueError(f"Datatype must be a prefixed name or IRI: {name}")
+    return name
+
+
+def compile_coercer(
+    field_type: FieldType, terms: TermFactory = RDFLIB_TERMS
+) -> Coercer:
+    if field_type.iri:
+        return terms.as_iri
+    if field_type.datatype:
+        datatype = terms.iri(_datatype_iri(field_type.datatype))
+
+        def typed(value: object) -> Term:
+            return terms.typed(_lexical(value), datatype)
+
+        return typed
+    if field_type.lang:
+        lang = field_type.lang
+
+        def tagged(value: object) -> Term:
+            return terms.tagged(str(value), lang)
+
+        return tagged
+    return terms.literal
+
+
+def _coercer(
+    name: str,
+    iri_fields: frozenset[str] | set[str],
+    types: Mapping[str, Coercer],
+    terms: TermFactory,
+) -> Coercer:
+    coerce = types.get(name)
+    if coerce is not None:
+        return coerce
+    return terms.as_iri if name in iri_fields else terms.literal
+
+
+class IriCache:
+    # Identifiers repeat heavily across rows (concept codes, organisation ids,
+    # emails), so their formatted IRIs are kept for the whole mapping run.
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_IRI_CACHE_SIZE,
+        terms: TermFactory = RDFLIB_TERMS,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("IRI cache size must be at least 1")
+        self.maxsize = maxsize
+        self.terms = terms
+        self.hits = 0
+        self.misses = 0
+        self._iris: OrderedDict[tuple[object, ...], Term] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._iris)
+
+    def get(self, key: tuple[object, ...]) -> Term | None:
+        iri = self._iris.get(key)
+        if iri is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._iris.move_to_end(key)
+        return iri
+
+    def put(self, key: tuple[object, ...], iri: Term) -> Term:
+        self._iris[key] = iri
+        if len(self._iris) > self.maxsize:
+            self._iris.popitem(last=False)
+        return iri
+
+    def quoted(self, prefix: str, value: str) -> Term:
+        key = (prefix, value)
+        iri = self.get(key)
+        if iri is None:
+            iri = self.put(key, self.terms.iri(f"{prefix}{quote(value, safe='')}"))
+        return iri
+
+    def log_stats(self, entity_name: str) -> None:
+        logger.debug(
+            "IRI cache for %s: %s hit(s), %s miss(es), %s/%s entries",
+            entity_name,
+            self.hits,
+            self.misses,
+            len(self._iris),
+            self.maxsize,
+        )
+
+
+@dataclass(frozen=True)
+class PathAccessor:
+    path: str
+    parts: tuple[PathPart, ...]
+
+    @classmethod
+    def compile(cls, path: str) -> PathAccessor:
+        return cls(path=path, parts=parse_path(path))
+
+    def values(self, value: object) -> list[object]:
+        current = [value]
+        for key, is_list in self.parts:
+            found: list[object] = []
+            for item in current:
+                if not isinstance(item, dict):
+                    continue
+                child = item.get(key)
+                if is_list:
+                    if isinstance(child, list):
+                        found.extend(child)
+                else:
+                    found.append(child)
+            current = found
+        return [item for item in current if item is not None]
+
+    def first(self, value: object) -> object | None:
+        values = self.values(value)
+        return values[0] if values else None
+
+
+@dataclass(frozen=True)
+class FieldTerm:
+    predicate: Term
+    coerce: Coercer
+
+
+@dataclass(frozen=True)
+class ConceptPlan:
+    name: str
+    accessor: PathAccessor
+    predicate: Term
+    uri: PathAccessor
+    code: PathAccessor
+    label: PathAccessor
+    lang: str | None
+
+
+@dataclass(frozen=True)
+class NodePlan:
+    name: str
+    accessor: PathAccessor
+    predicate: Term
+    subject_prefix: str
+    id_accessor: PathAccessor
+    type_iri: Term | None
+    terms: Mapping[str, FieldTerm] | None
+    field_ns: str
+    iri_fields: frozenset[str]
+    field_types: Mapping[str, Coercer]
+    iris: IriCache = field(default_factory=IriCache, compare=False)
+    _memo: dict[str, FieldTerm] = field(default_factory=dict, compare=False)
+
+    def term(self, key: str) -> FieldTerm | None:
+        if self.terms is not None:
+            return self.terms.get(key)
+        term = self._memo.get(key)
+        if term is None:
+            term = FieldTerm(
+                predicate=self.iris.terms.iri(f"{self.field_ns}{key}"),
+                coerce=_coercer(
+                    key, self.iri_fields, self.field_types, self.iris.terms
+                ),
+            )
+            self._memo[key] = term
+        return term
+
+
+@dataclass(frozen=True)
+class MappingPlan:
+    entity_type: Term
+    field_ns: str
+    concept_ns: str
+    id_field: str
+    id_aliases: tuple[str, ...]
+    field_aliases: Mapping[str, str]
+    iri_fields: frozenset[str]
+    field_types: Mapping[str, Coercer]
+    field_paths: tuple[tuple[str, tuple[PathAccessor, ...]], ...]
+    concepts: tuple[ConceptPlan, ...]
+    nodes: tuple[NodePlan, ...]
+    auto_nodes: bool
+    drop_nested: bool
+    iris: IriCache = field(default_factory=IriCache, compare=False)
+    _terms: dict[str, FieldTerm] = field(default_factory=dict, compare=False)
+    _predicates: dict[str, Term] = field(default_factory=dict, compare=False)
+
+    @property
+    def terms(self) -> TermFactory:
+        return self.iris.terms
+
+    def term(self, key: str) -> FieldTerm:
+        term = self._terms.get(key)
+        if term is None:
+            mapped_key = self.field_aliases.get(key, key)
+            term = FieldTerm(
+                predicate=self.predicate(mapped_key),
+                coerce=_coercer(
+                    mapped_key, self.iri_fields, self.field_types, self.terms
+                ),
+            )
+            self._terms[key] = term
+        return term
+
+    def predicate(self, name: str) -> Term:
+        predicate = self._predicates.get(name)
+        if predicate is None:
+            predicate = self.terms.iri(f"{self.field_ns}{name}")
+            self._predicates[name] = predicate
+        return predicate
+
+
+def compile_mapping(
+    mapping: MappingConfig,
+    *,
+    iri_cache_size: int = DEFAULT_IRI_CACHE_SIZE,
+    terms: TermFactory = RDFLIB_TERMS,
+) -> MappingPlan:
+    field_ns = mapping.raw.field_ns
+    iris = IriCache(iri_cache_size, terms)
+    aliases = dict(mapping.field_aliases)
+    field_types = {
+        name: compile_coercer(field_type, terms)
+        for name, field_type in mapping.field_types.items()
+    }
+
+    def predicate(name: str) -> Term:
+        return terms.iri(f"{field_ns}{name}")
+
+    field_paths = tuple(
+        (
+            out_key,
+            tuple(
+                PathAccessor.compile(path)
+                for path in (path_spec if isinstance(path_spec, list) else [path_spec])
+            ),
+        )
+        for out_key, path_spec in mapping.field_paths.items()
+    )
+    concepts = tuple(
+        ConceptPlan(
+            name=key,
+            accessor=PathAccessor.compile(cfg.path),
+            predicate=predicate(cfg.predicate or aliases.get(key, key)),
+            uri=PathAccessor.compile(cfg.uri_path),
+            code=PathAccessor.compile(cfg.code_path),
+            label=PathAccessor.compile(cfg.label_path),
+            lang=cfg.lang,
+        )
+        for key, cfg in mapping.concept_fields.items()
+        if cfg.path
+    )
+    nodes = tuple(
+        NodePlan(
+            name=key,
+            accessor=PathAccessor.compile(cfg.path),
+            predicate=predicate(cfg.predicate),
+            subject_prefix=f"{mapping.raw.base_uri}{cfg.subject_path}/",
+            id_accessor=PathAccessor.compile(cfg.id_field),
+            type_iri=terms.iri(cfg.type_iri) if cfg.type_iri else None,
+            terms={
+                source: FieldTerm(
+                    predicate=predicate(target),
+                    coerce=_coercer(target, cfg.iri_fields, field_types, terms),
+                )
+                for source, target in cfg.fields.items()
+            }
+            if cfg.fields
+            else None,
+            field_ns=field_ns,
+            iri_fields=frozenset(cfg.iri_fields),
+            field_types=field_types,
+            iris=iris,
+        )
+        for key, cfg in mapping.node_fields.items()
+        if cfg.path and cfg.predicate and cfg.subject_path
+    )
+    plan = MappingPlan(
+        entity_type=terms.iri(f"{mapping.raw.entity_ns}{mapping.raw.entity_name}"),
+        field_ns=field_ns,
+        concept_ns=mapping.concept_ns,
+        id_field=mapping.raw.id_field,
+        id_aliases=tuple(
+            key for key, alias in aliases.items() if alias == mapping.raw.id_field
+        ),
+        field_aliases=aliases,
+        iri_fields=frozenset(mapping.iri_fields),
+        field_types=field_types,
+        field_paths=field_paths,
+        concepts=concepts,
+        nodes=nodes,
+        auto_nodes=mapping.auto_nodes,
+        drop_nested=mapping.drop_nested,
+        iris=iris,
+    )
+    for key in {*aliases, *(out_key for out_key, _ in field_paths)}:
+        plan.term(key)
+    logger.debug(
+        "Compiled mapping plan for %s: %s field path(s), %s concept(s), %s node(s)",
+        mapping.raw.entity_name,
+        len(field_paths),
+        len(concepts),
+        len(nodes),
+    )
+    return plan
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import logging
+
+from oxrdflib import OxigraphStore
+from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+
+from schema_bridge.resources.loader import resolve_resource_path
+
+logger = logging.getLogger("schema_bridge.rdf.queries")
+
+_PREPARED_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_PREPARED_CACHE_SIZE)
+def _prepare(text: str) -> Query:
+    # rdflib parses string queries with the graph's bound prefixes; the default
+    # graph bindings are what profile queries may rely on.
+    return prepareQuery(text, initNs=dict(Graph().namespaces()))
+
+
+def query_for_graph(graph: Graph, text: str) -> str | Query:
+    # oxrdflib hands query strings straight to Oxigraph, which parses them
+    # natively and cannot run an rdflib Query object.
+    if isinstance(graph.store, OxigraphStore):
+        return text
+    return _prepare(text)
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    path: str
+    mtime_ns: int
+    text: str
+
+    def for_graph(self, graph: Graph) -> str | Query:
+        return query_for_graph(graph, self.text)
+
+
+class QueryRegistry:
+    def __init__(self) -> None:
+        self._queries: dict[str, PreparedQuery] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, package: str = "schema_bridge.resources") -> PreparedQuery:
+        resolved = resolve_resource_path(path, package)
+        mtime_ns = Path(resolved).stat().st_mtime_ns
+        cached = self._queries.get(resolved)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        query = PreparedQuery(
+            path=resolved,
+            mtime_ns=mtime_ns,
+            text=Path(resolved).read_text(encoding="utf-8"),
+        )
+        self._queries[resolved] = query
+        logger.debug("Loaded SPARQL query: %s", resolved)
+        return query
+
+    def clear(self) -> None:
+        self._queries.clear()
+
+
+QUERIES = QueryRegistry()
+
+
+def load_query(path: str, package: str = "schema_bridge.resources") -> PreparedQuery:
+    return QUERIES.get(path, package)
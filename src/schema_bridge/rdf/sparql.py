@@ -3,27 +3,101 @@ from __future__ import annotations
 from rdflib import Graph
 from typing import Any, Iterable, cast
 
-from schema_bridge.resources.loader import load_text
+from schema_bridge.rdf.decompose import (
+    BindingCounts,
+    ConstructDecomposition,
+    decompose_construct,
+)
+from schema_bridge.rdf.native import NativeGraph, as_rdflib
+from schema_bridge.rdf.queries import load_query, query_for_graph
 import logging
 
 logger = logging.getLogger("schema_bridge.rdf.sparql")
 
 
-def select_rows(graph: Graph, query_path: str) -> list[dict]:
+def select_rows(graph: Graph | NativeGraph, query_path: str) -> list[dict]:
     logger.debug("Running SELECT query: %s", query_path)
-    query = load_text(query_path, "schema_bridge.resources")
+    query = load_query(query_path)
+    if isinstance(graph, NativeGraph):
+        return graph.select_rows(query.text)
     rows = []
-    result = cast(Iterable[Any], graph.query(query))
+    result = cast(Iterable[Any], graph.query(query.for_graph(graph)))
     for row in result:
         row_dict = cast(dict[str, Any], row.asdict())
         rows.append({k: str(v) if v is not None else "" for k, v in row_dict.items()})
     return rows
 
 
-def construct_graph(graph: Graph, query_path: str) -> Graph:
-    logger.debug("Running CONSTRUCT query: %s", query_path)
-    query = load_text(query_path, "schema_bridge.resources")
-    result = graph.query(query)
+def _construct(graph: Graph | NativeGraph, query: str) -> Graph | NativeGraph:
+    if isinstance(graph, NativeGraph):
+        return graph.construct(query)
+    result = graph.query(query_for_graph(graph, query))
     if result.graph is None:
         raise RuntimeError("CONSTRUCT query did not return a graph")
     return result.graph
+
+
+def _binding_counts(
+    graph: Graph | NativeGraph, plan: ConstructDecomposition
+) -> BindingCounts:
+    counts = []
+    for query in plan.count_queries():
+        if isinstance(graph, NativeGraph):
+            rows = graph.select_rows(query)
+        else:
+            rows = [
+                {k: str(v) for k, v in row.asdict().items()}
+                for row in cast(
+                    Iterable[Any], graph.query(query_for_graph(graph, query))
+                )
+            ]
+        counts.append(
+            {
+                tuple(row.get(name, "") for name in plan.key_variables): int(row["n"])
+                for row in rows
+            }
+        )
+    return plan.binding_counts(counts)
+
+
+def _construct_decomposed(
+    graph: Graph | NativeGraph, plan: ConstructDecomposition, query_path: str
+) -> Graph | NativeGraph:
+    merged = _construct(graph, plan.queries[0])
+    for query in plan.queries[1:]:
+        if isinstance(graph, NativeGraph) and isinstance(merged, NativeGraph):
+            graph.construct(query, into=merged)
+        elif isinstance(merged, Graph):
+            merged += as_rdflib(_construct(graph, query))
+    logger.info(
+        "Decomposed CONSTRUCT %s into %s sub-queries over %s independent "
+        "OPTIONAL component(s)",
+        query_path,
+        len(plan.queries),
+        plan.components,
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        counts = _binding_counts(graph, plan)
+        logger.debug(
+            "CONSTRUCT %s: %s intermediate binding(s) and %s template triple(s) "
+            "instead of %s and %s when run whole",
+            query_path,
+            counts.split_bindings,
+            counts.split_triples,
+            counts.whole_bindings,
+            counts.whole_triples,
+        )
+    return merged
+
+
+def construct_graph(
+    graph: Graph | NativeGraph, query_path: str, *, decompose: bool = False
+) -> Graph | NativeGraph:
+    logger.debug("Running CONSTRUCT query: %s", query_path)
+    query = load_query(query_path)
+    if decompose:
+        plan = decompose_construct(query.text)
+        if plan is not None:
+            return _construct_decomposed(graph, plan, query_path)
+        logger.info("CONSTRUCT %s cannot be decomposed; running it whole", query_path)
+    return _construct(graph, query.text)
@@ -1,6 +1,23 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from time import perf_counter
+import io
+from typing import Iterator, cast
+
 from rdflib import Graph
+from rdflib.term import Node
+import pyoxigraph as ox
+
+from schema_bridge.rdf.native import NTRIPLES, NativeGraph, Term, TermConverter
+from schema_bridge.rdf.oxigraph import OxGraphName, graph_name, inner_store
+from schema_bridge.rdf.terms import TermFactory, term_factory
+import logging
+
+logger = logging.getLogger("schema_bridge.rdf.store")
+
+DEFAULT_INSERT_BATCH_SIZE = 10_000
+CANONICAL_BACKENDS = ("rdflib", "native")
 
 
 def new_graph(store: str | None = None) -> Graph:
@@ -8,3 +25,101 @@ def new_graph(store: str | None = None) -> Graph:
     if store_name:
         return Graph(store=store_name)
     return Graph()
+
+
+def new_canonical_graph(backend: str = "rdflib") -> Graph | NativeGraph:
+    if backend == "native":
+        return NativeGraph()
+    if backend == "rdflib":
+        return new_graph()
+    raise ValueError(f"Unsupported canonical graph backend: {backend}")
+
+
+def load_ntriples(graph: Graph | NativeGraph, data: bytes) -> None:
+    if isinstance(graph, NativeGraph):
+        graph.load_ntriples(data)
+    elif (store := inner_store(graph)) is not None:
+        store.bulk_load(io.BytesIO(data), NTRIPLES, to_graph=graph_name(graph))
+    else:
+        graph.parse(data=data, format="nt")
+
+
+class TripleBuffer:
+    def __init__(
+        self,
+        graph: Graph | NativeGraph,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        bnode_prefix: str | None = None,
+        terms: TermFactory | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Insert batch size must be at least 1")
+        self.graph = graph
+        self.batch_size = batch_size
+        self.flushed = 0
+        self.flush_seconds = 0.0
+        self.terms = terms if terms is not None else term_factory(graph)
+        self._pending: list[tuple[Term, Term, Term]] = []
+        self._store: ox.Store | None = None
+        self._context: OxGraphName | None = None
+        if isinstance(graph, Graph):
+            self._store = inner_store(graph)
+            if self._store is not None:
+                self._context = graph_name(graph)
+        self._convert = TermConverter()
+        self._bnode_prefix = bnode_prefix
+        self._bnodes = 0
+
+    def add(self, triple: tuple[Term, Term, Term]) -> None:
+        self._pending.append(triple)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, triples: list[tuple[Term, Term, Term]]) -> None:
+        self._pending.extend(triples)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    @property
+    def added(self) -> int:
+        return self.flushed + len(self._pending)
+
+    def bnode(self) -> Term:
+        if self._bnode_prefix is None:
+            return self.terms.bnode()
+        self._bnodes += 1
+        return self.terms.bnode(f"{self._bnode_prefix}{self._bnodes}")
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        start = perf_counter()
+        pending, self._pending = self._pending, []
+        if isinstance(self.graph, NativeGraph):
+            self.graph.extend(pending)
+        elif self._store is not None:
+            # Graph.addN goes through pyoxigraph's transactional extend, which is
+            # slower than per-triple add; bulk_extend skips the transaction.
+            quad = self._convert.quad
+            context = self._context
+            self._store.bulk_extend([quad(s, p, o, context) for s, p, o in pending])
+        else:
+            # Plain rdflib graphs are only fed by the rdflib term factory.
+            triples = cast(list[tuple[Node, Node, Node]], pending)
+            self.graph.addN((s, p, o, self.graph) for s, p, o in triples)
+        self.flushed += len(pending)
+        self.flush_seconds += perf_counter() - start
+
+
+@contextmanager
+def buffered_triples(
+    graph: Graph | NativeGraph,
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    bnode_prefix: str | None = None,
+) -> Iterator[TripleBuffer]:
+    sink = TripleBuffer(graph, batch_size, bnode_prefix)
+    yield sink
+    sink.flush()
+    logger.debug(
+        "Inserted %s triple(s) in batches of %s", sink.flushed, sink.batch_size
+    )
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import IO, Any, cast
+import io
+import logging
+
+from rdflib import ConjunctiveGraph, Graph
+import pyoxigraph as ox
+
+from schema_bridge.rdf.native import NTRIPLES, NativeGraph, as_rdflib
+from schema_bridge.rdf.oxigraph import OxGraphName, graph_name, inner_store
+
+logger = logging.getLogger("schema_bridge.rdf.stream")
+
+DEFAULT_STREAM_BUFFER_SIZE = 64 * 1024
+NQUADS = "application/n-quads"
+_OXIGRAPH_FORMATS = {
+    "nt": NTRIPLES,
+    "ntriples": NTRIPLES,
+    "nt11": NTRIPLES,
+    "nq": NQUADS,
+    "nquads": NQUADS,
+}
+
+
+class ChunkWriter(io.RawIOBase):
+    # Serializers write many small fragments; they are handed to the target in
+    # chunks of at most ``buffer_size`` bytes (or one oversized fragment).
+    def __init__(
+        self, target: IO[bytes], buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    ) -> None:
+        super().__init__()
+        if buffer_size < 1:
+            raise ValueError("Stream buffer size must be at least 1")
+        self.target = target
+        self.buffer_size = buffer_size
+        self.written = 0
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        size = len(data)
+        if self._size + size > self.buffer_size:
+            self.flush()
+        if size >= self.buffer_size:
+            self.target.write(data)
+            self.written += size
+            return size
+        self._chunks.append(bytes(data))
+        self._size += size
+        return size
+
+    def flush(self) -> None:
+        if self._chunks:
+            self.target.write(b"".join(self._chunks))
+            self.written += self._size
+            self._chunks = []
+            self._size = 0
+        self.target.flush()
+
+
+def _oxigraph_source(graph: Graph | NativeGraph) -> tuple[ox.Store, OxGraphName] | None:
+    if isinstance(graph, NativeGraph):
+        return graph.store, ox.DefaultGraph()
+    if isinstance(graph, ConjunctiveGraph):
+        # Datasets span every graph of the store; rdflib writes their quads.
+        return None
+    store = inner_store(graph)
+    if store is None:
+        return None
+    return store, graph_name(graph)
+
+
+def stream_graph(
+    graph: Graph | NativeGraph,
+    target: IO[bytes],
+    rdf_format: str,
+    *,
+    buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    context: dict[str, str] | None = None,
+    auto_compact: bool = False,
+) -> int:
+    writer = ChunkWriter(target, buffer_size)
+    mime_type = _OXIGRAPH_FORMATS.get(rdf_format)
+    source = _oxigraph_source(graph)
+    if mime_type is not None and source is not None:
+        store, from_graph = source
+        # Oxigraph cannot restrict a dataset dump to one graph; the N-Quads of a
+        # single graph are its triples in the default graph.
+        store.dump(
+            cast(IO[bytes], writer),
+            NTRIPLES if mime_type == NQUADS else mime_type,
+            from_graph=from_graph,
+        )
+    else:
+        # Prefixed Turtle, RDF/XML and JSON-LD come from rdflib, which writes
+        # to the handle as it goes instead of returning one string.
+        options: dict[str, Any] = {}
+        if context is not None:
+            options.update(context=context, auto_compact=auto_compact)
+        as_rdflib(graph).serialize(
+            cast(IO[bytes], writer), format=rdf_format, encoding="utf-8", **options
+        )
+    writer.close()
+    logger.debug("Streamed %s byte(s) of %s", writer.written, rdf_format)
+    return writer.written
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import OWL, RDF, SKOS, XSD
+import pyoxigraph as ox
+
+from schema_bridge.rdf.native import NativeGraph, OxTerm, Term, TermConverter
+
+
+class TermFactory:
+    # A compiled mapping builds every term through one factory, so a native
+    # sink receives pyoxigraph terms without an rdflib term in between.
+    def __init__(self) -> None:
+        self.rdf_type = self.iri(str(RDF.type))
+        self.skos_concept = self.iri(str(SKOS.Concept))
+        self.skos_pref_label = self.iri(str(SKOS.prefLabel))
+        self.skos_notation = self.iri(str(SKOS.notation))
+        self.owl_same_as = self.iri(str(OWL.sameAs))
+
+    def iri(self, value: str) -> Term:
+        raise NotImplementedError
+
+    def bnode(self, value: str | None = None) -> Term:
+        raise NotImplementedError
+
+    def literal(self, value: object) -> Term:
+        raise NotImplementedError
+
+    def typed(self, lexical: str, datatype: Term) -> Term:
+        raise NotImplementedError
+
+    def tagged(self, value: str, lang: str | None) -> Term:
+        raise NotImplementedError
+
+    def is_iri(self, term: Term) -> bool:
+        raise NotImplementedError
+
+    def as_iri(self, value: object) -> Term:
+        return self.iri(str(value))
+
+
+class RdflibTerms(TermFactory):
+    def iri(self, value: str) -> Term:
+        return URIRef(value)
+
+    def bnode(self, value: str | None = None) -> Term:
+        return BNode(value) if value is not None else BNode()
+
+    def literal(self, value: object) -> Term:
+        return Literal(value)
+
+    def typed(self, lexical: str, datatype: Term) -> Term:
+        if not isinstance(datatype, URIRef):
+            raise ValueError(f"Unexpected datatype: {datatype!r}")
+        return Literal(lexical, datatype=datatype)
+
+    def tagged(self, value: str, lang: str | None) -> Term:
+        return Literal(value, lang=lang)
+
+    def is_iri(self, term: Term) -> bool:
+        return isinstance(term, URIRef)
+
+
+class OxigraphTerms(TermFactory):
+    def __init__(self) -> None:
+        self._convert = TermConverter()
+        self._boolean = ox.NamedNode(str(XSD.boolean))
+        self._integer = ox.NamedNode(str(XSD.integer))
+        super().__init__()
+
+    def iri(self, value: str) -> ox.NamedNode:
+        return ox.NamedNode(value)
+
+    def bnode(self, value: str | None = None) -> ox.BlankNode:
+        return ox.BlankNode(value)
+
+    def literal(self, value: object) -> OxTerm:
+        # JSON scalars are built directly; anything else borrows rdflib's
+        # datatype inference so both backends agree on the lexical form.
+        if isinstance(value, str):
+            return ox.Literal(value)
+        if isinstance(value, bool):
+            return ox.Literal("true" if value else "false", datatype=self._boolean)
+        if isinstance(value, int):
+            return ox.Literal(str(value), datatype=self._integer)
+        return self._convert(Literal(value))
+
+    def typed(self, lexical: str, datatype: Term) -> ox.Literal:
+        if not isinstance(datatype, ox.NamedNode):
+            raise ValueError(f"Unexpected datatype: {datatype!r}")
+        return ox.Literal(lexical, datatype=datatype)
+
+    def tagged(self, value: str, lang: str | None) -> ox.Literal:
+        return ox.Literal(value, language=lang)
+
+    def is_iri(self, term: Term) -> bool:
+        return isinstance(term, ox.NamedNode)
+
+
+RDFLIB_TERMS = RdflibTerms()
+OXIGRAPH_TERMS = OxigraphTerms()
+
+
+def term_factory(graph: object) -> TermFactory:
+    return OXIGRAPH_TERMS if isinstance(graph, NativeGraph) else RDFLIB_TERMS
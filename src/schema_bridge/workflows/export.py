@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Callable
+from typing import IO, Callable
 
 from rdflib import Graph
 
 from schema_bridge.rdf.export import export_formats
-from schema_bridge.resources.loader import load_text
+from schema_bridge.rdf.native import NativeGraph, as_rdflib
+from schema_bridge.rdf.sparql import construct_graph as sparql_construct_graph
 from schema_bridge.rdf.shacl import validate_graph
 from schema_bridge.profiles.loader import ResolvedExport
 import logging
@@ -15,11 +16,12 @@ logger = logging.getLogger("schema_bridge.workflows.export")
 
 
 def export_and_validate(
-    raw_graph: Graph,
+    raw_graph: Graph | NativeGraph,
     export: ResolvedExport,
     out_dir: Path | None,
     shacl_report: Path | None,
     emit: Callable[[str], None] | None = None,
+    stream: IO[bytes] | None = None,
 ) -> None:
     logger.debug("Starting export for profile %s", export.profile.name)
     construct_graph = export_formats(
@@ -29,18 +31,24 @@ def export_and_validate(
         export.construct_query,
         export.targets,
         emit=emit,
+        decompose_construct=export.decompose_construct,
+        stream=stream,
     )
     if export.validate and export.profile.shacl:
         logger.debug("Running SHACL validation: %s", export.profile.shacl.shapes)
         if construct_graph is None:
             if not export.construct_query:
                 raise RuntimeError("SHACL validation requires a construct query")
-            construct_graph = raw_graph.query(
-                load_text(export.construct_query, "schema_bridge.resources")
-            ).graph
+            construct_graph = sparql_construct_graph(
+                raw_graph,
+                export.construct_query,
+                decompose=export.decompose_construct,
+            )
         if construct_graph is None:
             raise RuntimeError("SHACL validation requires a construct graph")
-        conforms, report = validate_graph(construct_graph, export.profile.shacl)
+        conforms, report = validate_graph(
+            as_rdflib(construct_graph), export.profile.shacl
+        )
         if shacl_report:
             report.serialize(shacl_report, format="turtle")
         if not conforms:
@@ -3,13 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 import uuid
 
-from gql import Client, gql
-from gql.transport.exceptions import TransportQueryError
-from gql.transport.requests import RequestsHTTPTransport
 from rdflib import Graph
 
 import logging
 
+from schema_bridge.graphql.pool import get_client_pool
 from schema_bridge.profiles.loader import IngestProfileConfig, resolve_profile_path
 from schema_bridge.rdf.shacl import ShaclConfig, validate_graph
 from schema_bridge.rdf.sparql import select_rows as sparql_select_rows
@@ -127,13 +125,10 @@ def graphql_post(
     headers = {"Content-Type": "application/json"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    transport = RequestsHTTPTransport(url=endpoint, headers=headers, timeout=30)
-    client = Client(transport=transport, fetch_schema_from_transport=False)
-    try:
-        result = client.execute(
-            gql(payload["query"]),
-            variable_values=payload.get("variables") or {},
-        )
-    except TransportQueryError as exc:
-        raise RuntimeError(f"GraphQL errors: {exc.errors}") from exc
+    result = get_client_pool().execute(
+        endpoint,
+        payload["query"],
+        payload.get("variables") or {},
+        headers=headers,
+    )
     return {"data": result}
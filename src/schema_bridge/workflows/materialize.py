@@ -5,10 +5,12 @@ from pathlib import Path
 import morph_kgc
 from rdflib import Graph
 
-from schema_bridge.graphql.client import extract_rows, load_graphql_file
+from schema_bridge.graphql.stream import iter_fixture_rows
 from schema_bridge.rdf.mapping import MappingConfig, load_raw_from_rows
 from schema_bridge.profiles.loader import ProfileConfig, resolve_profile_path
-from schema_bridge.rdf import new_graph
+from schema_bridge.rdf.instrument import MappingStats
+from schema_bridge.rdf.native import NativeGraph
+from schema_bridge.rdf.store import DEFAULT_INSERT_BATCH_SIZE, new_canonical_graph
 import logging
 
 logger = logging.getLogger("schema_bridge.workflows.materialize")
@@ -37,7 +39,12 @@ def _materialize_graph(
     root_key: str,
     rml_mapping: str | None,
     rml_source: str | None,
-) -> Graph:
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    workers: int = 1,
+    backend: str = "rdflib",
+    stats: MappingStats | None = None,
+    columnar: bool = False,
+) -> Graph | NativeGraph:
     if from_format == "rml" or profile.mapping_format == "rml":
         logger.debug("Materializing graph via RML")
         mapping_path = rml_mapping or profile.rml_mapping or str(input_path)
@@ -58,8 +65,14 @@ def _materialize_graph(
         return materialize_rml(resolved_mapping, resolved_source)
 
     logger.debug("Materializing graph from GraphQL JSON: %s", input_path)
-    graphql_data = load_graphql_file(input_path)
-    rows = extract_rows(graphql_data, root_key)
-    raw = new_graph()
-    load_raw_from_rows(rows, raw, mapping_override or profile.mapping)
+    raw = new_canonical_graph(backend)
+    load_raw_from_rows(
+        iter_fixture_rows(input_path, root_key),
+        raw,
+        mapping_override or profile.mapping,
+        batch_size=batch_size,
+        workers=workers,
+        stats=stats,
+        columnar=columnar,
+    )
     return raw
@@ -54,6 +54,44 @@ def test_cli_fetch_uses_fixture(tmp_path: Path) -> None:
     assert payload["data"]["Resources"] == fixture_payload["data"]["Resources"]
 
 
+@pytest.mark.integration
+def test_cli_fetch_records_watermark(tmp_path: Path) -> None:
+    resources = Path(__file__).parent / "resources"
+    env = _base_env()
+    env["SCHEMA_BRIDGE_GRAPHQL_FIXTURE"] = str(resources / "graphql_resources.json")
+    state_dir = tmp_path / "state"
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "schema_bridge.cli",
+            "fetch",
+            "--profile",
+            "dcat",
+            "--graphql-endpoint",
+            "https://example.org/graphql",
+            "--watermark",
+            "--state-dir",
+            str(state_dir),
+            "--updated-until",
+            "2024-06-01T00:00:00Z",
+            "--out",
+            str(tmp_path / "graphql.json"),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, (
+        f"fetch failed:\nSTDOUT: {completed.stdout}\nSTDERR: {completed.stderr}"
+    )
+    (state_file,) = state_dir.glob("dcat-*.json")
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    assert state["updated_until"] == "2024-06-01T00:00:00Z"
+    assert state["endpoint"] == "https://example.org/graphql"
+
+
 @pytest.mark.integration
 def test_cli_export_uses_fixture() -> None:
     resources = Path(__file__).parent / "resources"
@@ -123,6 +161,50 @@ def test_cli_export_healthdcat_ap_r5_uses_fixture() -> None:
     assert (res, rdf["type"], dcat["Dataset"]) in graph
 
 
+@pytest.mark.integration
+def test_cli_incremental_skips_deletions_when_limit_reached(tmp_path: Path) -> None:
+    env = _base_env()
+    state_dir = tmp_path / "state"
+    rows = [{"id": f"R{index}", "name": f"Resource {index}"} for index in (1, 2, 3)]
+
+    def run(resources: list[dict], limit: int) -> dict[str, str]:
+        fixture = tmp_path / "graphql.json"
+        fixture.write_text(json.dumps({"data": {"Resources": resources}}))
+        env["SCHEMA_BRIDGE_GRAPHQL_FIXTURE"] = str(fixture)
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "schema_bridge.cli",
+                "export",
+                "--profile",
+                "dcat",
+                "--format",
+                "nt",
+                "--canonical-only",
+                "--incremental",
+                "--state-dir",
+                str(state_dir),
+                "--limit",
+                str(limit),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert completed.returncode == 0, (
+            f"incremental export failed:\nSTDOUT: {completed.stdout}\nSTDERR: {completed.stderr}"
+        )
+        (index_path,) = state_dir.glob("canonical/*/index.json")
+        return json.loads(index_path.read_text(encoding="utf-8"))["subjects"]
+
+    assert len(run(rows, limit=0)) == 3
+    # The fixture ignores --limit, so two rows under --limit 2 stand in for a
+    # fetch the limit cut short: R3 is not treated as deleted.
+    assert len(run(rows[:2], limit=2)) == 3
+    assert len(run(rows[:2], limit=5)) == 2
+
+
 @pytest.mark.integration
 def test_cli_export_canonical_only_uses_fixture() -> None:
     resources = Path(__file__).parent / "resources"
@@ -1,9 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import gzip
+import json
+import os
+import re
+import threading
+import time
+
 from schema_bridge.graphql.client import (
     PaginationConfig,
     _build_updated_filter,
+    _iter_graphql_pages,
     _paginate_graphql,
     extract_rows,
+    iter_graphql_rows,
 )
+from schema_bridge.graphql.cache import CacheConfig, ResponseCache
+from schema_bridge.graphql.checkpoint import PageCheckpoint
+from schema_bridge.graphql.planner import plan_graphql_query
+from schema_bridge.graphql.pool import ClientPool, HttpConfig
+from schema_bridge.graphql.retry import RetryConfig, with_retry
+from schema_bridge.graphql.stream import iter_fixture_rows
+from schema_bridge.graphql.watermark import open_watermark_window
+from gql.transport.exceptions import TransportServerError
 import pytest
 
 
@@ -52,15 +72,649 @@ def test_paginate_graphql_respects_max_rows():
     assert len(rows) == 4
 
 
+def test_iter_graphql_pages_fetches_lazily():
+    calls = []
+
+    def execute(query, variables):
+        calls.append(variables["offset"])
+        offset = variables["offset"]
+        rows = [{"id": f"R{idx}"} for idx in range(offset, min(offset + 2, 6))]
+        return {"Resources": rows}
+
+    pages = _iter_graphql_pages(
+        execute=execute,
+        query="query",
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(page_size=2),
+        updated_filter=None,
+    )
+    first = next(pages)
+    assert [row["id"] for row in first] == ["R0", "R1"]
+    assert calls == [0]
+    assert sum(len(page) for page in pages) == 4
+
+
+def test_iter_graphql_rows_reads_fixture(monkeypatch):
+    fixture = Path(__file__).parent / "resources" / "graphql_resources.json"
+    monkeypatch.setenv("SCHEMA_BRIDGE_GRAPHQL_FIXTURE", str(fixture))
+    rows = iter_graphql_rows(
+        None,
+        None,
+        "query",
+        root_key="Resources",
+        pagination=PaginationConfig(page_size=10),
+    )
+    assert next(rows)["id"] == "R1"
+
+
+KEYSET_QUERY = """query Resources($limit: Int, $offset: Int, $filter: ResourcesFilter) {
+  Resources(limit: $limit, offset: $offset, filter: $filter, orderby: { id: ASC }) {
+    id
+  }
+}"""
+
+
+def _keyset_execute(table, calls, key="updated"):
+    def execute(query, variables):
+        calls.append(variables)
+        # Rows come back in the query's orderby, as EMX2 returns them.
+        order = re.search(r"orderby: \{\s*(\w+): ASC\s*\}", query)
+        order_key = order.group(1) if order else "id"
+        rows = sorted(table, key=lambda row: (row[order_key], row["id"]))
+        bound = (variables.get("filter") or {}).get(key, {}).get("between")
+        if bound:
+            rows = [row for row in rows if row[key] >= bound[0]]
+        start = variables["offset"]
+        return {"Resources": rows[start : start + variables["limit"]]}
+
+    return execute
+
+
+def test_paginate_graphql_keyset_filters_on_last_seen_key():
+    table = [{"id": f"R{idx}", "updated": idx // 2} for idx in range(9)]
+    calls = []
+    result = _paginate_graphql(
+        execute=_keyset_execute(table, calls),
+        query=KEYSET_QUERY,
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(
+            page_size=3, strategy="keyset", keyset_field="updated"
+        ),
+        updated_filter=None,
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(9)]
+    assert all(call["offset"] == 0 for call in calls)
+    assert calls[1]["filter"] == {"updated": {"between": [1, None]}}
+
+
+def test_paginate_graphql_keyset_respects_max_rows():
+    table = [{"id": f"R{idx}", "updated": idx} for idx in range(10)]
+    result = _paginate_graphql(
+        execute=_keyset_execute(table, []),
+        query=KEYSET_QUERY,
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(
+            page_size=3, max_rows=5, strategy="keyset", keyset_field="updated"
+        ),
+        updated_filter=None,
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(5)]
+
+
+def test_paginate_graphql_keyset_orders_by_the_key():
+    # Ids and update times disagree on order, so paging an id-sorted result on
+    # mg_updatedOn windows would skip and repeat rows.
+    table = [
+        {"id": f"R{idx}", "mg_updatedOn": f"2024-01-{10 - idx:02d}"} for idx in range(7)
+    ]
+    calls = []
+    result = _paginate_graphql(
+        execute=_keyset_execute(table, calls, key="mg_updatedOn"),
+        query=KEYSET_QUERY,
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(
+            page_size=2, strategy="keyset", keyset_field="mg_updatedOn"
+        ),
+        updated_filter=None,
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(6, -1, -1)]
+
+    variable_query = KEYSET_QUERY.replace(
+        "$filter: ResourcesFilter", "$filter: ResourcesFilter, $orderby: Orderby"
+    ).replace("orderby: { id: ASC }", "orderby: $orderby")
+    calls = []
+    _paginate_graphql(
+        execute=_keyset_execute(table, calls, key="mg_updatedOn"),
+        query=variable_query,
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(
+            page_size=2, strategy="keyset", keyset_field="mg_updatedOn"
+        ),
+        updated_filter=None,
+    )
+    assert calls[0]["orderby"] == {"mg_updatedOn": "ASC"}
+
+
 def test_build_updated_filter_between():
     updated = _build_updated_filter("2024-01-01T00:00:00Z", None)
     assert updated is not None
     between = updated["between"]["mg_updatedOn"]
-    assert between[0] == "2024-01-01T00:00:00Z"
-    assert len(between) == 2
+    assert between == ["2024-01-01T00:00:00Z", None]
+
+
+def test_response_cache_hits_across_updated_since_runs(tmp_path):
+    table = [{"id": f"R{idx}"} for idx in range(5)]
+    calls = []
+
+    def execute(query, variables):
+        calls.append(variables)
+        offset = variables["offset"]
+        return {"Resources": table[offset : offset + variables["limit"]]}
+
+    def run():
+        cache = ResponseCache(CacheConfig(directory=tmp_path))
+        result = _paginate_graphql(
+            execute=cache.wrap("https://example.org/graphql", execute),
+            query="query",
+            variables=None,
+            root_key="Resources",
+            pagination=PaginationConfig(page_size=2),
+            updated_filter=_build_updated_filter("2024-01-01T00:00:00Z", None),
+        )
+        assert result["data"]["Resources"] == table
+        return cache
+
+    run()
+    time.sleep(1.1)
+    second = run()
+    assert len(calls) == 3
+    assert (second.hits, second.misses) == (3, 0)
 
 
 def test_extract_rows_requires_root_key() -> None:
     payload = {"data": {"Other": []}}
     with pytest.raises(KeyError):
         extract_rows(payload, "Resources")
+
+
+def test_paginate_graphql_concurrent_merges_in_offset_order():
+    def execute(query, variables):
+        limit = variables["limit"]
+        offset = variables["offset"]
+        # Later pages answer first to exercise the in-order merge.
+        time.sleep(0.01 * max(0, 10 - offset) / 10)
+        rows = [{"id": f"R{idx}"} for idx in range(offset, min(offset + limit, 11))]
+        return {"Resources": rows}
+
+    pagination = PaginationConfig(page_size=2, concurrency=4)
+    result = _paginate_graphql(
+        execute=execute,
+        query="query",
+        variables=None,
+        root_key="Resources",
+        pagination=pagination,
+        updated_filter=None,
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(11)]
+
+
+def test_paginate_graphql_concurrent_respects_max_rows_and_offset():
+    calls = []
+    lock = threading.Lock()
+
+    def execute(query, variables):
+        with lock:
+            calls.append((variables["offset"], variables["limit"]))
+        limit = variables["limit"]
+        offset = variables["offset"]
+        rows = [{"id": f"R{idx}"} for idx in range(offset, min(offset + limit, 100))]
+        return {"Resources": rows}
+
+    pagination = PaginationConfig(page_size=3, max_rows=7, offset=5, concurrency=3)
+    result = _paginate_graphql(
+        execute=execute,
+        query="query",
+        variables=None,
+        root_key="Resources",
+        pagination=pagination,
+        updated_filter=None,
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(5, 12)]
+    assert sorted(calls) == [(5, 3), (8, 3), (11, 1)]
+
+
+class _GraphQLHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        offset = (payload.get("variables") or {}).get("offset", 0)
+        body = json.dumps({"data": {"Resources": [{"id": f"R{offset}"}]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_response_cache_tracks_size_without_rescanning(tmp_path, monkeypatch):
+    cache = ResponseCache(CacheConfig(directory=tmp_path, max_bytes=200))
+    scans = []
+    original = ResponseCache._scan_size
+
+    def counting_scan(self):
+        scans.append(True)
+        return original(self)
+
+    monkeypatch.setattr(ResponseCache, "_scan_size", counting_scan)
+    payload = {"Resources": [{"id": "x" * 20}]}
+    for index in range(10):
+        cache.put(f"k{index}", payload)
+    assert len(scans) == 1
+    sizes = sum(path.stat().st_size for path in tmp_path.glob("*.json"))
+    assert sizes <= 200
+    assert cache._total == sizes
+
+
+def test_client_pool_reuses_connection():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool = ClientPool(HttpConfig(timeout=5, max_connections_per_host=2))
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+        query = "query q($offset: Int) { Resources(offset: $offset) { id } }"
+        results = [pool.execute(url, query, {"offset": idx}) for idx in range(3)]
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+    assert [result["Resources"][0]["id"] for result in results] == ["R0", "R1", "R2"]
+    assert _GraphQLHandler.connections == 1
+
+
+def test_client_pool_sends_each_call_its_own_variables():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool = ClientPool(HttpConfig(timeout=5, max_connections_per_host=8))
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+        query = "query q($offset: Int) { Resources(offset: $offset) { id } }"
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda idx: pool.execute(url, query, {"offset": idx}), range(40)
+                )
+            )
+        after_empty = [
+            pool.execute(url, query, {"offset": 50}),
+            pool.execute(url, query, {}),
+        ]
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+    assert [result["Resources"][0]["id"] for result in results] == [
+        f"R{idx}" for idx in range(40)
+    ]
+    assert [result["Resources"][0]["id"] for result in after_empty] == ["R50", "R0"]
+
+
+def test_response_cache_hits_and_refresh(tmp_path):
+    calls = []
+
+    def execute(query, variables):
+        calls.append(variables)
+        return {"Resources": [{"id": "R1"}]}
+
+    cache = ResponseCache(CacheConfig(directory=tmp_path))
+    cached = cache.wrap("https://example.org/graphql", execute)
+    assert cached("query", {"offset": 0}) == cached("query", {"offset": 0})
+    cached("query", {"offset": 1})
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    refresh = ResponseCache(CacheConfig(directory=tmp_path, mode="refresh"))
+    refresh.wrap("https://example.org/graphql", execute)("query", {"offset": 0})
+    assert len(calls) == 3
+
+
+def test_response_cache_expires_and_evicts_least_recent(tmp_path):
+    cache = ResponseCache(CacheConfig(directory=tmp_path, ttl=60, max_bytes=100))
+    payload = {"Resources": [{"id": "x" * 20}]}
+    cache.put("old", payload)
+    cache.put("new", payload)
+    stale = time.time() - 120
+    os.utime(tmp_path / "new.json", (time.time(), stale))
+    assert cache.get("new") is None
+    os.utime(tmp_path / "old.json", (0, time.time()))
+    cache.put("newer", payload)
+    cache.put("newest", payload)
+    assert cache.get("old") is None
+    assert cache.get("newest") == payload
+
+
+def test_watermark_window_feeds_next_run(tmp_path):
+    endpoint = "https://example.org/catalogue/graphql"
+    first = open_watermark_window(
+        tmp_path,
+        profile="dcat",
+        endpoint=endpoint,
+        updated_since=None,
+        updated_until="2024-01-01T00:00:00Z",
+    )
+    assert first.updated_since is None
+    first.commit()
+    second = open_watermark_window(
+        tmp_path,
+        profile="dcat",
+        endpoint=endpoint,
+        updated_since=None,
+        updated_until=None,
+    )
+    assert second.updated_since == "2024-01-01T00:00:00Z"
+    other = open_watermark_window(
+        tmp_path,
+        profile="dcat",
+        endpoint="https://other.org/graphql",
+        updated_since=None,
+        updated_until=None,
+    )
+    assert other.updated_since is None
+
+
+def test_watermark_records_server_timestamps_and_skips_truncated_runs(tmp_path, caplog):
+    endpoint = "https://example.org/catalogue/graphql"
+
+    def window():
+        return open_watermark_window(
+            tmp_path,
+            profile="dcat",
+            endpoint=endpoint,
+            updated_since=None,
+            updated_until=None,
+        )
+
+    truncated = window()
+    rows = [{"id": "R1", "mg_updatedOn": "2024-03-01T10:00:00Z"}] * 5
+    assert list(truncated.track(rows)) == rows
+    truncated.commit(max_rows=5)
+    assert window().updated_since is None
+    assert "row limit" in caplog.text
+
+    complete = window()
+    for row in (
+        {"id": "R1", "mg_updatedOn": "2024-03-01T10:00:00Z"},
+        {"id": "R2", "mg_updatedOn": "2024-03-02T08:30:00+00:00"},
+        {"id": "R3"},
+    ):
+        complete.observe(row)
+    complete.commit(max_rows=5)
+    assert window().updated_since == "2024-03-02T08:30:00+00:00"
+
+    clock = window()
+    clock.observe({"id": "R1"})
+    clock.commit()
+    assert "local clock" in caplog.text
+    assert window().updated_since == clock.updated_until
+
+
+def test_with_retry_retries_transient_errors_only():
+    delays = []
+    attempts = {"count": 0}
+
+    def flaky(query, variables):
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise TransportServerError("Bad Gateway", 502)
+        return {"ok": True}
+
+    retrying = with_retry(flaky, RetryConfig(attempts=4, jitter=0), sleep=delays.append)
+    assert retrying("query", None) == {"ok": True}
+    assert delays == [0.5, 1.0]
+
+    def rejected(query, variables):
+        raise TransportServerError("Bad Request", 400)
+
+    with pytest.raises(TransportServerError):
+        with_retry(rejected, RetryConfig(attempts=4), sleep=delays.append)("q", None)
+    assert len(delays) == 2
+
+
+@pytest.mark.parametrize("strategy", ["offset", "keyset"])
+def test_paginate_graphql_resumes_from_checkpoint(tmp_path, strategy):
+    table = [{"id": f"R{idx}", "updated": idx} for idx in range(7)]
+    calls = []
+    keyset = _keyset_execute(table, calls)
+
+    def execute(query, variables):
+        if len(calls) == 2:
+            calls.append(None)
+            raise TransportServerError("Bad Gateway", 502)
+        if strategy == "keyset":
+            return keyset(query, variables)
+        calls.append(variables)
+        offset = variables["offset"]
+        return {"Resources": table[offset : offset + variables["limit"]]}
+
+    pagination = PaginationConfig(
+        page_size=2, strategy=strategy, keyset_field="updated"
+    )
+    checkpoint = PageCheckpoint(tmp_path, "run")
+    kwargs = {
+        "query": KEYSET_QUERY,
+        "variables": None,
+        "root_key": "Resources",
+        "pagination": pagination,
+        "updated_filter": None,
+        "checkpoint": checkpoint,
+    }
+    with pytest.raises(TransportServerError):
+        _paginate_graphql(execute=execute, **kwargs)
+    saved = checkpoint.load()
+    assert saved is not None
+    assert saved.cursor.total == 4
+
+    resumed = []
+
+    def resume(query, variables):
+        resumed.append(variables)
+        if strategy == "keyset":
+            return keyset(query, variables)
+        offset = variables["offset"]
+        return {"Resources": table[offset : offset + variables["limit"]]}
+
+    result = _paginate_graphql(execute=resume, **kwargs)
+    assert result["data"]["Resources"] == table
+    assert len(resumed) == 2
+    assert not checkpoint.state_path.exists()
+    assert not checkpoint.spool_path.exists()
+
+
+def test_checkpoint_key_ignores_concurrency_and_batching(tmp_path):
+    def key(**overrides):
+        pagination = PaginationConfig(page_size=2, **overrides)
+        return PageCheckpoint.for_request(
+            tmp_path,
+            endpoint="https://example.org/graphql",
+            query=KEYSET_QUERY,
+            variables=None,
+            root_key="Resources",
+            pagination=pagination,
+            updated_since=None,
+        ).key
+
+    assert key() == key(concurrency=4, batch_pages=3)
+    assert key() != key(max_rows=10)
+    assert key() != key(strategy="keyset")
+
+
+def test_iter_fixture_rows_streams_json_across_chunks(tmp_path):
+    rows = [
+        {"id": f"R{idx}", "size": idx * 1000, "tags": ["a", "b"]} for idx in range(25)
+    ]
+    payload = {
+        "errors": None,
+        "data": {"Other": [{"id": "X"}], "Resources": rows, "Tail": {"n": 1}},
+    }
+    path = tmp_path / "resources.json"
+    path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    streamed = iter_fixture_rows(path, "Resources", chunk_size=7)
+    assert next(streamed) == rows[0]
+    assert [rows[0], *streamed] == rows
+
+    with pytest.raises(KeyError):
+        list(iter_fixture_rows(path, "Missing"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_iter_fixture_rows_handles_numbers_split_across_chunks(tmp_path, chunk_size):
+    rows = [{"id": "R1", "score": 12.75, "weight": -3.5e-2, "count": 10}]
+    payload = {"data": {"Other": 1.5, "Big": 2e10, "Resources": rows, "Tail": 1e3}}
+    path = tmp_path / "resources.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    assert list(iter_fixture_rows(path, "Resources", chunk_size=chunk_size)) == rows
+
+
+def test_iter_fixture_rows_reads_gzip_and_ndjson(tmp_path):
+    rows = [{"id": f"R{idx}"} for idx in range(3)]
+    gz_path = tmp_path / "resources.json.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as handle:
+        json.dump({"data": {"Resources": rows}}, handle)
+    assert list(iter_fixture_rows(gz_path, "Resources")) == rows
+
+    nd_path = tmp_path / "resources.ndjson.gz"
+    with gzip.open(nd_path, "wt", encoding="utf-8") as handle:
+        handle.write("\n".join(json.dumps(row) for row in rows) + "\n")
+    assert list(iter_fixture_rows(nd_path, "Resources")) == rows
+
+
+def test_plan_graphql_query_prunes_unused_selections():
+    from schema_bridge.rdf.mapping import MappingConfig
+
+    mapping = MappingConfig.from_dict(
+        {
+            "drop_nested": True,
+            "field_aliases": {"name": "title"},
+            "field_paths": {"publisherName": "publisher.name"},
+        }
+    )
+    query = """
+    query Q($limit: Int, $offset: Int, $lang: String) {
+      Resources(limit: $limit, offset: $offset) {
+        id
+        name
+        acronym
+        publisher { name website(lang: $lang) }
+        type { code }
+      }
+    }
+    """
+    sparql = """
+    PREFIX field: <https://catalogue.org/field/>
+    SELECT ?title ?publisher WHERE {
+      ?res field:title ?title . OPTIONAL { ?res field:publisherName ?publisher }
+    }
+    """
+    plan = plan_graphql_query(
+        query, root_key="Resources", mapping=mapping, sparql=[sparql]
+    )
+    assert plan.pruned
+    assert sorted(plan.removed) == [
+        "Resources.acronym",
+        "Resources.publisher.website",
+        "Resources.type",
+    ]
+    assert "$lang" not in plan.query
+
+    open_sparql = "SELECT * WHERE { ?res ?p ?o }"
+    plan = plan_graphql_query(
+        query, root_key="Resources", mapping=mapping, sparql=[open_sparql]
+    )
+    assert not plan.pruned
+    assert plan.query == query
+
+
+def test_plan_graphql_query_keeps_auto_node_leaves_with_drop_nested():
+    from schema_bridge.rdf.mapping import MappingConfig
+
+    mapping = MappingConfig.from_dict({"drop_nested": True})
+    query = """
+    query Q {
+      Resources {
+        id
+        contact { email role }
+        type { code }
+      }
+    }
+    """
+    sparql = """
+    PREFIX field: <https://catalogue.org/field/>
+    SELECT ?email WHERE { ?node field:email ?email }
+    """
+    plan = plan_graphql_query(
+        query, root_key="Resources", mapping=mapping, sparql=[sparql]
+    )
+    assert plan.pruned
+    assert "Resources.contact" not in plan.removed
+    assert "email" in plan.query
+    assert "Resources.type" in plan.removed
+
+
+def test_paginate_graphql_batches_pages_with_aliases():
+    calls = []
+
+    def execute(query, variables):
+        calls.append((query, variables))
+        result = {}
+        index = 0
+        while f"limit_p{index}" in variables:
+            offset = variables[f"offset_p{index}"]
+            limit = variables[f"limit_p{index}"]
+            result[f"p{index}"] = [
+                {"id": f"R{idx}"} for idx in range(offset, min(offset + limit, 7))
+            ]
+            index += 1
+        return result
+
+    query = """
+    query Q($limit: Int, $offset: Int, $filter: ResourcesFilter) {
+      Resources(limit: $limit, offset: $offset, filter: $filter) { id }
+    }
+    """
+    result = _paginate_graphql(
+        execute=execute,
+        query=query,
+        variables=None,
+        root_key="Resources",
+        pagination=PaginationConfig(page_size=2, batch_pages=3),
+        updated_filter={"between": {"mg_updatedOn": ["a", "b"]}},
+    )
+    rows = result["data"]["Resources"]
+    assert [row["id"] for row in rows] == [f"R{idx}" for idx in range(7)]
+    assert len(calls) == 2
+    batched, variables = calls[0]
+    assert "p2: Resources(limit: $limit_p2, offset: $offset_p2" in batched
+    assert "$limit:" not in batched
+    assert variables["offset_p1"] == 2
+    assert variables["filter"] == {"between": {"mg_updatedOn": ["a", "b"]}}
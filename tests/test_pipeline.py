@@ -1,6 +1,8 @@
 import csv
 import io
+import json
 from pathlib import Path
+from typing import Any
 from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF
 
@@ -18,7 +20,10 @@ from schema_bridge.rdf import (
     select_rows,
     validate_graph,
 )
+from schema_bridge.graphql.planner import plan_graphql_query
 from schema_bridge.rdf.mapping import IdStrategy, NodeDefaults
+from schema_bridge.rdf.native import as_rdflib
+from schema_bridge.rdf.plan import PathAccessor, compile_mapping
 from schema_bridge.rdf.mapping import ConceptField, NodeField
 from schema_bridge.resources import load_text, load_yaml
 from schema_bridge.profiles import (
@@ -144,7 +149,9 @@ def test_schemaorg_contact_point_uses_stable_uri_under_cross_product():
         _with_id_strategy(MappingConfig(raw=RawMapping()), ["id"]),
     )
 
-    graph = construct_graph(raw, "profiles/schemaorg-molgenis/sparql/construct.sparql")
+    graph = as_rdflib(
+        construct_graph(raw, "profiles/schemaorg-molgenis/sparql/construct.sparql")
+    )
     SCHEMA = Namespace("http://schema.org/")
     res = EX["resource/R1"]
 
@@ -453,3 +460,755 @@ def test_export_profiles_reference_existing_queries():
                 ),
                 "schema_bridge.resources",
             )
+
+
+def _project(value: Any, selection_set) -> Any:
+    if selection_set is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [_project(item, selection_set) for item in value]
+    projected = {}
+    for selection in selection_set.selections:
+        key = selection.alias.value if selection.alias else selection.name.value
+        if key in value:
+            projected[key] = _project(value[key], selection.selection_set)
+    return projected
+
+
+def test_pruned_healthdcat_query_keeps_construct_output():
+    from graphql import parse
+
+    from schema_bridge.graphql.ast import root_field
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    assert profile.graphql_query and profile.construct_query
+    query = load_text(
+        resolve_profile_path(profile, profile.graphql_query, "schema_bridge.resources"),
+        "schema_bridge.resources",
+    )
+    construct_path = resolve_profile_path(
+        profile, profile.construct_query, "schema_bridge.resources"
+    )
+    plan = plan_graphql_query(
+        query,
+        root_key=profile.root_key,
+        mapping=profile.mapping,
+        sparql=[load_text(construct_path, "schema_bridge.resources")],
+    )
+    assert plan.pruned
+    assert "Resources.type.parent" in plan.removed
+    assert "Resources.acronym" in plan.removed
+
+    fixture = (
+        Path(__file__).parent / "resources" / "graphql_health_dcat_ap_molgenis.json"
+    )
+    rows = json.loads(fixture.read_text(encoding="utf-8"))["data"]["Resources"]
+    found = root_field(parse(plan.query), profile.root_key)
+    assert found is not None
+    root = found[1]
+    pruned_rows = [_project(row, root.selection_set) for row in rows]
+
+    outputs = []
+    for source in (rows, pruned_rows):
+        raw = new_graph()
+        load_raw_from_rows(source, raw, profile.mapping)
+        graph = as_rdflib(construct_graph(raw, construct_path))
+        modified = URIRef("http://purl.org/dc/terms/modified")
+        outputs.append({triple for triple in graph if triple[1] != modified})
+    assert outputs[0] == outputs[1]
+
+
+def test_compiled_mapping_plan_interns_terms_and_paths():
+    mapping = MappingConfig.from_dict(
+        {
+            "field_aliases": {"homepage": "website", "pid": "id"},
+            "iri_fields": ["website"],
+            "field_paths": {"countryNames": "countries[].name"},
+        }
+    )
+    plan = compile_mapping(mapping)
+    assert plan.term("homepage") is plan.term("homepage")
+    assert plan.term("homepage").predicate == FIELD["website"]
+    assert plan.term("homepage").coerce("https://x.org") == URIRef("https://x.org")
+    assert plan.id_aliases == ("pid",)
+    out_key, accessors = plan.field_paths[0]
+    assert out_key == "countryNames"
+    row = {"countries": [{"name": "NL"}, {"code": "BE"}, {"name": "DE"}]}
+    assert accessors[0].values(row) == ["NL", "DE"]
+    assert PathAccessor.compile("countries.name").values(row) == []
+
+
+def test_bulk_insert_matches_per_triple_graph():
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    fixture = (
+        Path(__file__).parent / "resources" / "graphql_health_dcat_ap_molgenis.json"
+    )
+    rows = json.loads(fixture.read_text(encoding="utf-8"))["data"]["Resources"]
+    bulk = new_graph()
+    load_raw_from_rows(rows, bulk, profile.mapping, batch_size=7)
+    memory = Graph()
+    load_raw_from_rows(rows, memory, profile.mapping, batch_size=7)
+    per_triple = new_graph()
+    for triple in memory:
+        per_triple.add(triple)
+    assert len(bulk) == len(per_triple) > 7
+    assert isomorphic(bulk, per_triple)
+
+
+def test_native_backend_matches_rdflib_backend():
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf import NativeGraph, new_canonical_graph
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    fixture = (
+        Path(__file__).parent / "resources" / "graphql_health_dcat_ap_molgenis.json"
+    )
+    rows = json.loads(fixture.read_text(encoding="utf-8"))["data"]["Resources"]
+    assert profile.select_query and profile.construct_query
+    select_path = resolve_profile_path(
+        profile, profile.select_query, "schema_bridge.resources"
+    )
+    construct_path = resolve_profile_path(
+        profile, profile.construct_query, "schema_bridge.resources"
+    )
+    modified = URIRef("http://purl.org/dc/terms/modified")
+    selected = []
+    constructed = []
+    for backend in ("rdflib", "native"):
+        raw = new_canonical_graph(backend)
+        load_raw_from_rows(rows, raw, profile.mapping)
+        selected.append(
+            sorted(select_rows(raw, select_path), key=lambda row: sorted(row.items()))
+        )
+        graph = construct_graph(raw, construct_path)
+        if isinstance(graph, NativeGraph):
+            ntriples = graph.serialize(format="nt")
+            assert isinstance(ntriples, str) and "<http://" in ntriples
+            graph = graph.to_rdflib()
+        trimmed = Graph()
+        trimmed += (triple for triple in graph if triple[1] != modified)
+        constructed.append(trimmed)
+    assert selected[0] == selected[1]
+    assert len(constructed[0]) > 0
+    assert isomorphic(constructed[0], constructed[1])
+
+
+def test_native_backend_maps_rows_to_pyoxigraph_terms(monkeypatch):
+    import pyoxigraph as ox
+
+    from schema_bridge.rdf import NativeGraph
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    fixture = (
+        Path(__file__).parent / "resources" / "graphql_health_dcat_ap_molgenis.json"
+    )
+    rows = json.loads(fixture.read_text(encoding="utf-8"))["data"]["Resources"]
+    written: list[tuple[object, ...]] = []
+    extend = NativeGraph.extend
+
+    def record(self, triples, graph_name=None):
+        triples = list(triples)
+        written.extend(triples)
+        extend(self, triples, graph_name)
+
+    monkeypatch.setattr(NativeGraph, "extend", record)
+    graph = NativeGraph()
+    load_raw_from_rows(rows, graph, profile.mapping)
+    ox_terms = (ox.NamedNode, ox.BlankNode, ox.Literal)
+    assert written and len(graph) > 0
+    assert all(isinstance(term, ox_terms) for triple in written for term in triple)
+    year = ox.NamedNode("http://www.w3.org/2001/XMLSchema#gYear")
+    assert any(isinstance(o, ox.Literal) and o.datatype == year for _, _, o in written)
+
+
+@pytest.mark.parametrize("backend", ["rdflib", "native"])
+def test_parallel_mapping_keeps_shard_blank_nodes_apart(backend: str) -> None:
+    from rdflib import BNode
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf import new_canonical_graph
+    from schema_bridge.rdf.native import as_rdflib
+    from schema_bridge.rdf.parallel import load_rows_parallel
+
+    mapping = MappingConfig(
+        raw=RawMapping(),
+        id_strategy=IdStrategy(
+            template="{base_uri}{path}/{id}",
+            fallback_fields=["id"],
+        ),
+        node_defaults=NodeDefaults(
+            subject_template="{base_uri}{path}/{id}",
+            id_fields=["email"],
+        ),
+    )
+    rows = [
+        {"id": f"R{idx}", "contactPoint": {"displayName": f"Person {idx}"}}
+        for idx in range(6)
+    ]
+    serial = new_canonical_graph(backend)
+    load_raw_from_rows(rows, serial, mapping)
+    parallel = new_canonical_graph(backend)
+    load_rows_parallel(rows, parallel, mapping, workers=2, chunk_size=1)
+    merged = as_rdflib(parallel)
+    assert len({o for o in merged.objects() if isinstance(o, BNode)}) == len(rows)
+    assert isomorphic(as_rdflib(serial), merged)
+
+    labelled = new_canonical_graph(backend)
+    load_rows_parallel(
+        rows, labelled, mapping, workers=2, chunk_size=2, bnode_prefix="run-"
+    )
+    labels = {o for o in as_rdflib(labelled).objects() if isinstance(o, BNode)}
+    assert len(labels) == len(rows)
+
+
+def test_shared_concepts_are_described_once(caplog) -> None:
+    mapping = MappingConfig(
+        raw=RawMapping(),
+        concept_fields={
+            "keywords": ConceptField(
+                path="keywords[]",
+                predicate="keywordConcept",
+                uri_path="ontologyTermURI",
+                code_path="code",
+                label_path="name",
+                lang="en",
+            )
+        },
+    )
+    keyword = {
+        "name": "genomics",
+        "code": "GEN",
+        "ontologyTermURI": "http://example.org/terms/genomics",
+    }
+    rows = [
+        {"id": "R1", "keywords": [keyword]},
+        {"id": "R2", "keywords": [keyword]},
+        {"id": "R3", "keywords": [dict(keyword, name="Genomics")]},
+    ]
+    triples = []
+
+    class Recorder:
+        def addN(self, quads):
+            triples.extend(quad[:3] for quad in quads)
+
+    graph = Recorder()
+    with caplog.at_level("DEBUG", logger="schema_bridge.rdf.mapping"):
+        load_raw_from_rows(
+            rows,
+            graph,  # type: ignore[arg-type]
+            _with_id_strategy(mapping, ["id"]),
+        )
+    # R2 repeats R1's type, prefLabel and notation; R3's new label is kept.
+    assert "Skipped 3 redundant concept/node triple insert(s)" in caplog.text
+    concept = URIRef("http://example.org/terms/genomics")
+    described = [triple for triple in triples if triple[0] == concept]
+    assert len(described) == 6
+
+
+def test_rows_are_mapped_lazily_without_mutating_input() -> None:
+    mapping = _with_id_strategy(
+        MappingConfig(
+            raw=RawMapping(),
+            field_aliases={"pid": "id"},
+            field_paths={"keywords": "tags[].name"},
+        ),
+        ["id"],
+    )
+    graph = new_graph()
+    seen_sizes = []
+    rows = [
+        {"pid": "R1", "keywords": ["a"], "tags": [{"name": "b"}]},
+        {"pid": "R2", "keywords": ["c"]},
+    ]
+
+    def stream():
+        for row in rows:
+            seen_sizes.append(len(graph))
+            yield row
+
+    load_raw_from_rows(stream(), graph, mapping, batch_size=1)
+    assert seen_sizes[0] == 0 and seen_sizes[1] > 0
+    assert rows[0] == {"pid": "R1", "keywords": ["a"], "tags": [{"name": "b"}]}
+    assert "id" not in rows[1]
+    res = URIRef("https://catalogue.org/resource/R1")
+    assert (res, FIELD["keywords"], None) in graph
+
+
+def test_field_types_emit_typed_literals() -> None:
+    from rdflib import Literal
+    from rdflib.namespace import XSD
+
+    mapping = _with_id_strategy(
+        MappingConfig.from_dict(
+            {
+                "field_aliases": {"homepage": "landingPage"},
+                "field_types": {
+                    "startYear": "xsd:gYear",
+                    "participants": {
+                        "datatype": "http://www.w3.org/2001/XMLSchema#nonNegativeInteger"
+                    },
+                    "description": {"lang": "en"},
+                    "landingPage": "iri",
+                    "founded": "xsd:gYear",
+                },
+            }
+        ),
+        ["id"],
+    )
+    raw = new_graph()
+    rows = [
+        {
+            "id": "R7",
+            "startYear": 2001,
+            "participants": 40,
+            "description": "Cohort",
+            "homepage": "https://example.org/r7",
+            "publisher": {"name": "Org", "founded": 1990},
+        }
+    ]
+    load_raw_from_rows(rows, raw, mapping)
+    res = URIRef("https://catalogue.org/resource/R7")
+    assert raw.value(res, FIELD["startYear"]) == Literal("2001", datatype=XSD.gYear)
+    participants = raw.value(res, FIELD["participants"])
+    assert isinstance(participants, Literal)
+    assert participants.datatype in {XSD.nonNegativeInteger, XSD.integer}
+    assert raw.value(res, FIELD["description"]) == Literal("Cohort", lang="en")
+    assert raw.value(res, FIELD["landingPage"]) == URIRef("https://example.org/r7")
+    publisher = raw.value(res, FIELD["publisher"])
+    assert raw.value(publisher, FIELD["founded"]) == Literal("1990", datatype=XSD.gYear)
+    with pytest.raises(ValueError, match="not a path"):
+        MappingConfig.from_dict({"field_types": {"publisher.founded": "xsd:gYear"}})
+    with pytest.raises(ValueError, match="only one of"):
+        MappingConfig.from_dict(
+            {"field_types": {"x": {"datatype": "xsd:int", "lang": "en"}}}
+        )
+
+
+def test_incremental_graph_patches_changed_and_deleted_subjects(tmp_path) -> None:
+    import pyoxigraph as ox
+    from rdflib import Graph, Literal
+
+    from schema_bridge.rdf.incremental import IncrementalGraph
+
+    mapping = _with_id_strategy(MappingConfig(raw=RawMapping()), ["id"])
+    rows = [
+        {"id": "R1", "name": "One"},
+        {"id": "R2", "name": "Two"},
+        {"id": "R3", "name": "Three"},
+        {"id": "R4", "name": "Four"},
+        {"id": "R4", "name": "Vier"},
+    ]
+    with IncrementalGraph(tmp_path) as canonical:
+        first = canonical.patch(rows, mapping, detect_deletions=True)
+        canonical.commit()
+    assert len(first.changed) == 4
+
+    r2 = "https://catalogue.org/resource/R2"
+    r3 = "https://catalogue.org/resource/R3"
+    r4 = "https://catalogue.org/resource/R4"
+    updated = [
+        {"id": "R1", "name": "One"},
+        {"id": "R2", "name": "Deux"},
+        {"id": "R4", "name": "Four"},
+        {"id": "R4", "name": "Quatre"},
+    ]
+    with IncrementalGraph(tmp_path) as canonical:
+        patch = canonical.patch(updated, mapping, detect_deletions=True, batch_size=2)
+        canonical.commit()
+        assert patch.changed == [r2, r4]
+        assert patch.deleted == [r3]
+        assert patch.unchanged == 1
+        delta = as_rdflib(canonical.subjects_graph(patch.changed))
+        rdflib_delta = canonical.subjects_graph([r2], backend="rdflib")
+        assert isinstance(rdflib_delta, Graph)
+        assert (URIRef(r2), FIELD["name"], Literal("Deux")) in rdflib_delta
+        assert {str(o) for o in delta.objects(URIRef(r2), FIELD["name"])} == {"Deux"}
+        assert {str(o) for o in delta.objects(URIRef(r4), FIELD["name"])} == {
+            "Four",
+            "Quatre",
+        }
+        assert not list(delta.subjects(None, URIRef(r3)))
+        solutions = canonical.store.query(
+            "SELECT ?name WHERE { GRAPH ?g { ?s <https://catalogue.org/field/name> ?name } }"
+        )
+        assert isinstance(solutions, ox.QuerySolutions)
+        names = sorted(str(solution["name"].value) for solution in solutions)
+        # Open query results keep the store (and its lock) alive.
+        del solutions
+        assert names == ["Deux", "Four", "One", "Quatre"]
+
+    # A run that patches the store but never commits leaves the touched
+    # subjects out of the saved index, so reverting the row re-patches it.
+    with IncrementalGraph(tmp_path) as canonical:
+        canonical.patch([{"id": "R2", "name": "Zwei"}], mapping, detect_deletions=False)
+    with IncrementalGraph(tmp_path) as canonical:
+        assert r2 not in canonical.index
+        patch = canonical.patch(
+            [{"id": "R2", "name": "Deux"}], mapping, detect_deletions=False
+        )
+        assert patch.changed == [r2]
+    with pytest.raises(RuntimeError, match="closed"):
+        canonical.store
+
+
+def test_mapping_stats_report_fields_by_cost() -> None:
+    from schema_bridge.rdf.instrument import MappingStats
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    payload = json.loads(
+        Path("tests/resources/graphql_health_dcat_ap_molgenis.json").read_text()
+    )
+    rows = payload["data"]["Resources"]
+    stats = MappingStats()
+    raw = new_graph()
+    load_raw_from_rows(rows, raw, profile.mapping, stats=stats)
+    report = stats.report()
+    names = {entry["name"] for entry in report}
+    assert stats.rows == len(rows)
+    assert {"subject", "field_paths.contactEmail", "auto_nodes.contactPoint"} <= names
+    assert sum(entry["triples"] for entry in report) >= len(raw)
+    seconds = [entry["seconds"] for entry in report]
+    assert seconds == sorted(seconds, reverse=True)
+    assert report[-1]["cumulative_share"] == pytest.approx(1.0, abs=1e-3)
+    assert json.loads(stats.to_json())["rows"] == len(rows)
+
+
+def test_columnar_mapping_matches_dict_path() -> None:
+    pytest.importorskip("pyarrow")
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf.columnar import iter_record_batches, load_raw_from_batches
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    payload = json.loads(
+        Path("tests/resources/graphql_health_dcat_ap_molgenis.json").read_text()
+    )
+    rows = [
+        *payload["data"]["Resources"],
+        {"id": "X1", "score": 1, "tags": ["a", "b"], "flag": True},
+        {"id": "X2", "score": 2.5, "tags": [], "extra": {"id": "n1"}},
+        {"id": "X3", "score": None, "tags": ["a", None], "flag": False},
+    ]
+    flat = _with_id_strategy(
+        MappingConfig(raw=RawMapping(), auto_nodes=False, drop_nested=True), ["id"]
+    )
+    for mapping in (profile.mapping, flat):
+        expected = new_graph()
+        load_raw_from_rows(rows, expected, mapping)
+        columnar = new_graph()
+        load_raw_from_batches(
+            iter_record_batches(rows, batch_rows=2), columnar, mapping
+        )
+        assert isomorphic(expected, columnar)
+
+
+def test_iri_cache_reuses_repeated_identifiers(caplog) -> None:
+    from schema_bridge.rdf.plan import IriCache
+
+    cache = IriCache(maxsize=2)
+    first = cache.quoted("https://x.org/", "a b")
+    assert first == URIRef("https://x.org/a%20b")
+    assert cache.quoted("https://x.org/", "a b") is first
+    cache.quoted("https://x.org/", "c")
+    cache.quoted("https://x.org/", "d")
+    assert len(cache) == 2 and cache.get(("https://x.org/", "a b")) is None
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    mapping = _with_id_strategy(
+        MappingConfig(
+            raw=RawMapping(),
+            concept_fields={"theme": ConceptField(path="theme")},
+        ),
+        ["id"],
+    )
+    rows = [{"id": f"R{index}", "theme": {"code": "T1"}} for index in range(3)]
+    caplog.set_level("DEBUG", logger="schema_bridge.rdf.plan")
+    graph = new_graph()
+    load_raw_from_rows(rows, graph, mapping)
+    assert (None, None, URIRef("https://catalogue.org/concept/T1")) in graph
+    assert "IRI cache for Resource: 2 hit(s)" in caplog.text
+
+
+@pytest.mark.parametrize("backend", ["rdflib", "native"])
+def test_decomposed_construct_matches_whole_query(backend: str, caplog) -> None:
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf import new_canonical_graph
+    from schema_bridge.rdf.decompose import decompose_construct
+    from schema_bridge.rdf.native import as_rdflib
+
+    profile = load_profile("healthdcat-ap-r5-molgenis")
+    assert profile.construct_query
+    construct_path = resolve_profile_path(
+        profile, profile.construct_query, "schema_bridge.resources"
+    )
+    payload = json.loads(
+        Path("tests/resources/graphql_health_dcat_ap_molgenis.json").read_text()
+    )
+    row = payload["data"]["Resources"][0]
+    row["keywords"] = ["a", "b", "c"]
+    raw = new_canonical_graph(backend)
+    load_raw_from_rows([row], raw, profile.mapping)
+    caplog.set_level("DEBUG", logger="schema_bridge.rdf.sparql")
+    whole = construct_graph(raw, construct_path)
+    split = construct_graph(raw, construct_path, decompose=True)
+
+    def without_timestamps(graph) -> Graph:
+        modified = URIRef("http://purl.org/dc/terms/modified")
+        result = Graph()
+        for triple in as_rdflib(graph):
+            if triple[1] != modified:
+                result.add(triple)
+        return result
+
+    assert isomorphic(without_timestamps(whole), without_timestamps(split))
+    assert "intermediate binding(s)" in caplog.text
+    assert (
+        decompose_construct(
+            "CONSTRUCT { ?s ?p ?o } WHERE { { ?s ?p ?o } UNION { ?o ?p ?s } }"
+        )
+        is None
+    )
+    assert (
+        decompose_construct(
+            "CONSTRUCT { ?s <p> [ <q> ?o ] } WHERE { ?s <a> ?x OPTIONAL { ?s <b> ?o } }"
+        )
+        is None
+    )
+    plan = decompose_construct(
+        "CONSTRUCT { ?s <a> ?x . ?s <b> ?y . ?s <c> ?z } "
+        "WHERE { ?s <t> ?x OPTIONAL { ?s <b> ?y } OPTIONAL { ?s <c> ?z } }"
+    )
+    assert plan is not None
+    assert (len(plan.queries), plan.components) == (3, 2)
+
+
+@pytest.mark.parametrize("backend", ["rdflib", "native"])
+def test_decomposed_construct_keeps_pinned_filters_and_optional_binds(
+    backend: str, tmp_path
+) -> None:
+    from rdflib import Literal
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf import new_canonical_graph
+    from schema_bridge.rdf.decompose import decompose_construct
+    from schema_bridge.rdf.native import as_rdflib
+
+    query = """PREFIX f: <https://catalogue.org/field/>
+CONSTRUCT {
+  ?s <urn:name> ?name .
+  ?s <urn:status> ?status .
+  ?s <urn:label> ?label .
+  ?s <urn:keyword> ?keyword .
+}
+WHERE {
+  ?s f:name ?name .
+  OPTIONAL { ?s f:status ?status }
+  FILTER(!BOUND(?status) || ?status != "retired")
+  OPTIONAL { ?s f:title ?title }
+  BIND(CONCAT(?title, "!") AS ?label)
+  OPTIONAL { ?s f:keywords ?keyword }
+}
+"""
+    plan = decompose_construct(query)
+    assert plan is not None
+    # The FILTER pins the status OPTIONAL into every sub-query; the BIND reads
+    # an optional variable and travels with the title component.
+    assert plan.components == 2
+    assert all("FILTER" in sub_query for sub_query in plan.queries)
+    assert sum("BIND" in sub_query for sub_query in plan.queries) == 1
+
+    path = tmp_path / "construct.sparql"
+    path.write_text(query, encoding="utf-8")
+    rows = [
+        {"id": "R1", "name": "One", "status": "active", "title": "T1"},
+        {"id": "R2", "name": "Two", "status": "retired", "title": "T2"},
+        {"id": "R3", "name": "Three", "keywords": ["a", "b"]},
+        {"id": "R4", "name": "Four", "title": "T4", "keywords": ["c"]},
+    ]
+    raw = new_canonical_graph(backend)
+    load_raw_from_rows(rows, raw, _with_id_strategy(MappingConfig(), ["id"]))
+    whole = as_rdflib(construct_graph(raw, str(path)))
+    split = as_rdflib(construct_graph(raw, str(path), decompose=True))
+    assert isomorphic(whole, split)
+    assert not list(whole.subjects(URIRef("urn:name"), Literal("Two")))
+    assert len(whole) == 9
+
+
+def test_decomposed_construct_ignores_braces_in_strings_and_comments(tmp_path):
+    from rdflib.compare import isomorphic
+
+    from schema_bridge.rdf.decompose import decompose_construct
+
+    query = """PREFIX f: <https://catalogue.org/field/>
+CONSTRUCT {
+  ?s <urn:name> ?label .
+  ?s <urn:status> ?status .
+  ?s <urn:keyword> ?keyword .
+}
+WHERE {
+  ?s f:name ?name .
+  BIND(CONCAT(?name, " }") AS ?label)
+  # OPTIONAL { ?s f:title ?title }
+  OPTIONAL { ?s f:status ?status FILTER(?status != "{retired}") }
+  OPTIONAL { ?s f:keywords ?keyword }
+}
+"""
+    plan = decompose_construct(query)
+    assert plan is not None
+    assert plan.components == 2
+    assert not any("f:title" in sub_query for sub_query in plan.queries)
+
+    path = tmp_path / "construct.sparql"
+    path.write_text(query, encoding="utf-8")
+    rows = [
+        {"id": "R1", "name": "One", "status": "{retired}", "keywords": ["a"]},
+        {"id": "R2", "name": "Two", "status": "active", "title": "T2"},
+    ]
+    raw = new_graph()
+    load_raw_from_rows(rows, raw, _with_id_strategy(MappingConfig(), ["id"]))
+    whole = as_rdflib(construct_graph(raw, str(path)))
+    split = as_rdflib(construct_graph(raw, str(path), decompose=True))
+    assert isomorphic(whole, split)
+    assert len(whole) == 4
+
+    assert decompose_construct("CONSTRUCT { ?s <a> ?o } WHERE { ?s <a> ?o ") is None
+    # MINUS is not something the splitter understands, so the query runs whole.
+    assert (
+        decompose_construct(
+            "CONSTRUCT { ?s <a> ?x . ?s <b> ?y } WHERE { ?s <t> ?x "
+            "OPTIONAL { ?s <b> ?y } MINUS { ?s <c> ?x } }"
+        )
+        is None
+    )
+
+
+def test_query_registry_reuses_queries_until_file_changes(tmp_path) -> None:
+    import os
+
+    from rdflib import Graph
+    from rdflib.plugins.sparql.sparql import Query
+
+    from schema_bridge.rdf.queries import QueryRegistry
+
+    path = tmp_path / "select.sparql"
+    path.write_text("SELECT ?s WHERE { ?s ?p ?o }", encoding="utf-8")
+    registry = QueryRegistry()
+    first = registry.get(str(path))
+    assert registry.get(str(path)) is first
+    assert (registry.hits, registry.misses) == (1, 1)
+    assert isinstance(first.for_graph(Graph()), Query)
+    assert isinstance(first.for_graph(new_graph()), str)
+
+    path.write_text("SELECT ?o WHERE { ?s ?p ?o }", encoding="utf-8")
+    os.utime(path, ns=(first.mtime_ns + 1_000_000, first.mtime_ns + 1_000_000))
+    reloaded = registry.get(str(path))
+    assert reloaded is not first and "?o WHERE" in reloaded.text
+
+    graph = Graph()
+    graph.add((EX["r1"], RDF.type, EX["Thing"]))
+    assert select_rows(graph, str(path)) == [{"o": str(EX["Thing"])}]
+
+
+@pytest.mark.parametrize("backend", ["rdflib", "native"])
+def test_export_formats_writes_every_target_from_one_construct(
+    backend: str, tmp_path: Path, monkeypatch
+) -> None:
+    from rdflib import Graph
+
+    from schema_bridge.rdf import export as export_module
+    from schema_bridge.rdf import new_canonical_graph
+
+    profile = load_profile("dcat")
+    assert profile.select_query and profile.construct_query
+    select_path = resolve_profile_path(
+        profile, profile.select_query, "schema_bridge.resources"
+    )
+    construct_path = resolve_profile_path(
+        profile, profile.construct_query, "schema_bridge.resources"
+    )
+    raw = new_canonical_graph(backend)
+    rows = [{"id": "R1", "name": "Example", "description": "Desc"}]
+    load_raw_from_rows(rows, raw, profile.mapping)
+    calls = []
+    original = export_module.construct_graph
+
+    def counting_construct(*args, **kwargs):
+        calls.append(args[1])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(export_module, "construct_graph", counting_construct)
+    export_formats(
+        raw,
+        tmp_path,
+        select_path,
+        construct_path,
+        ["ttl", "jsonld", "rdfxml", "csv"],
+    )
+    assert calls == [construct_path]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "resources.csv",
+        "resources.jsonld",
+        "resources.rdf",
+        "resources.ttl",
+    ]
+    turtle = Graph().parse(tmp_path / "resources.ttl", format="turtle")
+    assert len(turtle) > 0
+    assert len(Graph().parse(tmp_path / "resources.rdf", format="xml")) == len(turtle)
+    assert len(Graph().parse(tmp_path / "resources.jsonld", format="json-ld")) == len(
+        turtle
+    )
+    assert "Example" in (tmp_path / "resources.csv").read_text()
+
+
+@pytest.mark.parametrize("backend", ["rdflib", "native"])
+def test_stream_graph_writes_bounded_chunks(backend: str) -> None:
+    from rdflib import Dataset, Graph, Literal
+
+    from schema_bridge.rdf import new_canonical_graph
+    from schema_bridge.rdf.stream import stream_graph
+
+    class Recorder(io.BytesIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.sizes: list[int] = []
+
+        def write(self, data) -> int:
+            self.sizes.append(len(data))
+            return super().write(data)
+
+    graph = new_canonical_graph(backend)
+    for index in range(2000):
+        graph.add(
+            (
+                URIRef(f"https://example.org/r/{index}"),
+                URIRef("https://example.org/name"),
+                Literal(f"Resource {index}"),
+            )
+        )
+    for rdf_format in ("nt", "turtle"):
+        target = Recorder()
+        written = stream_graph(graph, target, rdf_format, buffer_size=16 * 1024)
+        assert written == len(target.getvalue())
+        assert len(target.sizes) > 1
+        assert max(target.sizes) <= 16 * 1024
+        parsed = Graph().parse(data=target.getvalue(), format=rdf_format)
+        assert len(parsed) == 2000
+    # N-Quads of one graph carry only its triples, never the rest of the store
+    # or a blank-node graph label.
+    if isinstance(graph, Graph):
+        Graph(store=graph.store, identifier=URIRef("urn:other")).add(
+            (URIRef("urn:s"), URIRef("urn:p"), Literal("other"))
+        )
+    target = io.BytesIO()
+    stream_graph(graph, target, "nq")
+    assert b"urn:other" not in target.getvalue()
+    assert b"_:" not in target.getvalue()
+    quads = Dataset().parse(data=target.getvalue(), format="nquads")
+    assert len(quads) == 2000
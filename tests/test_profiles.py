@@ -121,3 +121,20 @@ def test_ingest_profile_loads_required_sections() -> None:
     profile = load_ingest_profile(str(ingest_profile))
     assert profile.select_query is not None
     assert profile.table is not None
+
+
+def test_profile_fetch_pagination_block(tmp_path: Path) -> None:
+    profile_path = tmp_path / "profile.yml"
+    profile_path.write_text(
+        "name: keyset\n"
+        "kind: export\n"
+        "fetch:\n"
+        "  root_key: Resources\n"
+        "  pagination:\n"
+        "    strategy: keyset\n"
+        "    key: mg_updatedOn\n",
+        encoding="utf-8",
+    )
+    profile = load_profile(str(profile_path), expected_kind="export")
+    assert profile.pagination_strategy == "keyset"
+    assert profile.pagination_key == "mg_updatedOn"